@@ -8,12 +8,38 @@ Supports:
 - Dummy provider for testing
 """
 
-from proactive_hcdt.ai_providers.base import AIMessage, AIProvider, AIResponse
-from proactive_hcdt.ai_providers.dummy import DummyAIProvider
+import importlib
+from typing import Any
+
+from proactive_hcdt.ai_providers.base import (
+    AIMessage,
+    AIProvider,
+    AIResponse,
+    ConversationBuffer,
+    ResponseDelta,
+)
+
+# Exports imported on first attribute access (PEP 562)
+_LAZY_EXPORTS = {
+    "DummyAIProvider": "proactive_hcdt.ai_providers.dummy",
+}
 
 __all__ = [
     "AIProvider",
     "AIMessage",
     "AIResponse",
+    "ConversationBuffer",
+    "ResponseDelta",
     "DummyAIProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported provider classes on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,130 @@
+"""
+Shared HTTP connection pools for AI provider SDK clients.
+
+Provider instances of the same vendor share one tuned ``httpx.AsyncClient``
+so keep-alive connections are reused across instances instead of each SDK
+client opening its own small default pool.
+
+Pooled connections belong to the event loop that opened them, so clients
+are shared per (vendor, running event loop): a later ``asyncio.run()`` gets
+fresh clients instead of reusing connections from a closed loop.
+"""
+
+import asyncio
+import atexit
+import threading
+import weakref
+from typing import Any
+
+MAX_CONNECTIONS = 2000
+MAX_KEEPALIVE_CONNECTIONS = 500
+TIMEOUT_SECONDS = 120.0
+
+# event loop -> vendor -> client; entries go away with their loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Clients requested outside a running event loop
+_unbound_clients: dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    """Check whether httpx can negotiate HTTP/2 (requires the h2 package)."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _current_loop_clients() -> dict[str, Any]:
+    """Get the vendor -> client map for the running event loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _unbound_clients
+
+    clients = _clients.get(loop)
+    if clients is None:
+        with _lock:
+            clients = _clients.setdefault(loop, {})
+    return clients
+
+
+def get_shared_http_client(vendor: str) -> Any:
+    """
+    Get the shared async HTTP client for a vendor and the running event loop.
+
+    The client is created on first use in each event loop.
+
+    Args:
+        vendor: Vendor key (e.g., "anthropic", "openai").
+
+    Returns:
+        A shared ``httpx.AsyncClient`` instance.
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    clients = _current_loop_clients()
+    client = clients.get(vendor)
+    if client is not None and not client.is_closed:
+        return client
+
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "httpx package is required for shared provider connections. "
+            "Install it with: pip install httpx"
+        )
+
+    with _lock:
+        client = clients.get(vendor)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                timeout=httpx.Timeout(TIMEOUT_SECONDS),
+                http2=_http2_available(),
+            )
+            clients[vendor] = client
+    return client
+
+
+async def _aclose_all(clients: dict[str, Any]) -> None:
+    """Close and forget every client in a vendor -> client map."""
+    pending = list(clients.values())
+    clients.clear()
+    for client in pending:
+        if not client.is_closed:
+            await client.aclose()
+
+
+async def aclose_shared_http_clients() -> None:
+    """Close the shared HTTP clients of the running event loop."""
+    await _aclose_all(_current_loop_clients())
+
+
+def _close_at_exit() -> None:
+    """Best-effort cleanup of shared clients at interpreter shutdown."""
+    # Each client is closed on the loop that opened it; clients of loops
+    # that are already closed lost their connections with the loop.
+    for loop, clients in list(_clients.items()):
+        if clients and not loop.is_closed() and not loop.is_running():
+            try:
+                loop.run_until_complete(_aclose_all(clients))
+            except Exception:
+                pass
+
+    if _unbound_clients:
+        try:
+            asyncio.run(_aclose_all(_unbound_clients))
+        except Exception:
+            pass
+
+
+atexit.register(_close_at_exit)
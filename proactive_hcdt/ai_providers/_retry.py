@@ -0,0 +1,96 @@
+"""
+Retry with exponential backoff for transient AI provider errors.
+
+Rate limits (429), server errors (5xx), connection failures, and timeouts are
+retried with jittered exponential backoff; any other error is raised
+immediately so the provider can surface it as an error response.
+"""
+
+import asyncio
+import functools
+import random
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+@functools.cache
+def _retryable_exception_types() -> tuple[type[BaseException], ...]:
+    """Collect the transport-level exception types of the installed SDKs."""
+    types: list[type[BaseException]] = []
+
+    try:
+        import httpx
+
+        types += [httpx.TimeoutException, httpx.NetworkError]
+    except ImportError:
+        pass
+
+    try:
+        import openai
+
+        types.append(openai.APIConnectionError)
+    except ImportError:
+        pass
+
+    try:
+        import anthropic
+
+        types.append(anthropic.APIConnectionError)
+    except ImportError:
+        pass
+
+    return tuple(types)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """
+    Check whether an exception is a transient provider error.
+
+    Args:
+        exc: The exception raised by a provider SDK.
+
+    Returns:
+        True for rate limits, 5xx responses, connection errors, and timeouts.
+    """
+    # openai/anthropic expose status_code; google.api_core exposes code
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(exc, "code", None)
+    if status in RETRYABLE_STATUS_CODES:
+        return True
+    return isinstance(exc, _retryable_exception_types())
+
+
+async def with_retries(
+    coro_factory: Callable[[], Awaitable[T]],
+    attempts: int = 5,
+    base: float = 0.25,
+    cap: float = 10.0,
+) -> T:
+    """
+    Await a request, retrying transient failures with exponential backoff.
+
+    Args:
+        coro_factory: Callable creating a fresh awaitable for each attempt.
+        attempts: Maximum number of attempts.
+        base: Delay before the first retry in seconds.
+        cap: Maximum delay between attempts in seconds.
+
+    Returns:
+        The result of the first successful attempt.
+
+    Raises:
+        Exception: The last error if it is not retryable or attempts run out.
+    """
+    for attempt in range(attempts):
+        try:
+            return await coro_factory()
+        except Exception as e:
+            if attempt == attempts - 1 or not is_retryable(e):
+                raise
+            await asyncio.sleep(min(cap, base * 2**attempt + random.random() * 0.1))
+
+    raise ValueError("attempts must be at least 1")
@@ -5,16 +5,27 @@ Supports Anthropic's Claude models for natural language understanding
 and generation with tool use capabilities.
 """
 
-from typing import Any
+import contextlib
+from typing import Any, AsyncIterator
 
+from proactive_hcdt.ai_providers._http import get_shared_http_client
+from proactive_hcdt.ai_providers._retry import with_retries
 from proactive_hcdt.ai_providers.base import (
     AIMessage,
     AIProvider,
     AIResponse,
     MessageRole,
+    ResponseDelta,
     ToolCall,
 )
 
+# Claude has no tool role; tool results are sent as user turns
+_ANTHROPIC_ROLE_MAP = {
+    MessageRole.USER: "user",
+    MessageRole.ASSISTANT: "assistant",
+    MessageRole.TOOL: "user",
+}
+
 
 class AnthropicProvider(AIProvider):
     """
@@ -24,10 +35,13 @@ class AnthropicProvider(AIProvider):
     natural language understanding and tool use.
     """
 
+    default_max_concurrency = 50
+
     def __init__(
         self,
         model_name: str = "claude-3-5-sonnet-20241022",
         api_key: str | None = None,
+        max_concurrency: int | None = None,
     ):
         """
         Initialize the Anthropic provider.
@@ -35,13 +49,21 @@ class AnthropicProvider(AIProvider):
         Args:
             model_name: The Claude model to use (e.g., "claude-3-5-sonnet-20241022").
             api_key: Anthropic API key. If not provided, will look for ANTHROPIC_API_KEY env var.
+            max_concurrency: Maximum number of concurrent requests to the API.
         """
-        super().__init__(model_name, api_key)
+        super().__init__(model_name, api_key, max_concurrency)
         self._client = None
+        self._http_client = None  # shared pool the SDK client was built on
 
     def _ensure_client(self) -> None:
         """Lazily initialize the Anthropic client."""
-        if self._client is None:
+        if self._client is not None and self._http_client is None:
+            return  # client supplied directly, not built on the shared pool
+
+        # Pooled connections are per event loop, so rebuild the SDK client
+        # when called from a different loop than the one it was built in
+        http_client = get_shared_http_client("anthropic")
+        if http_client is not self._http_client:
             try:
                 from anthropic import AsyncAnthropic
             except ImportError:
@@ -51,8 +73,11 @@ class AnthropicProvider(AIProvider):
                 )
 
             self._client = (
-                AsyncAnthropic(api_key=self.api_key) if self.api_key else AsyncAnthropic()
+                AsyncAnthropic(api_key=self.api_key, http_client=http_client)
+                if self.api_key
+                else AsyncAnthropic(http_client=http_client)
             )
+            self._http_client = http_client
 
     async def generate(
         self,
@@ -73,12 +98,163 @@ class AnthropicProvider(AIProvider):
         Returns:
             AIResponse containing the generated content and any tool calls.
         """
+        cache_key = self._exact_cache.make_key(
+            self.model_name, messages, tools, temperature, max_tokens
+        )
+        cached = self._exact_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        self._ensure_client()
+        params = self._build_params(messages, tools, temperature, max_tokens)
+
+        try:
+            async with self._sem:
+                response = await with_retries(lambda: self._client.messages.create(**params))
+            result = self._parse_response(response)
+            self._exact_cache.put(cache_key, result)
+            return result
+
+        except Exception as e:
+            return AIResponse(
+                content=f"Error generating response: {str(e)}",
+                tool_calls=[],
+                finish_reason="error",
+            )
+
+    async def stream(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict[str, Any]] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[ResponseDelta]:
+        """
+        Stream a response from a Claude model as it is generated.
+
+        Text deltas are yielded as they arrive; tool use blocks are yielded
+        with the final delta once the message is complete.
+
+        Args:
+            messages: List of conversation messages.
+            tools: Optional list of tool definitions.
+            temperature: Sampling temperature (0.0 to 1.0).
+            max_tokens: Maximum number of tokens in the response.
+
+        Yields:
+            ResponseDelta pieces of the response.
+        """
+        self._ensure_client()
+        params = self._build_params(messages, tools, temperature, max_tokens)
+
+        try:
+            async with contextlib.AsyncExitStack() as stack:
+                # Hold a concurrency slot only while opening the stream
+                async with self._sem:
+                    stream = await stack.enter_async_context(
+                        self._client.messages.stream(**params)
+                    )
+                async for text in stream.text_stream:
+                    yield ResponseDelta(content=text)
+                final = await stream.get_final_message()
+
+        except Exception as e:
+            yield ResponseDelta(
+                content=f"Error generating response: {str(e)}",
+                finish_reason="error",
+            )
+            return
+
+        result = self._parse_response(final)
+        yield ResponseDelta(tool_calls=result.tool_calls, finish_reason=result.finish_reason)
+
+    async def abatch(
+        self,
+        batches: list[list[AIMessage]],
+        tools: list[dict[str, Any]] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> list[AIResponse]:
+        """
+        Generate responses for many conversations using the Message Batches API.
+
+        Submits all requests as one batch, waits for processing to end, and
+        collects the results back into input order.
+
+        Args:
+            batches: List of conversations, each a list of messages.
+            tools: Optional list of tool definitions shared by all conversations.
+            temperature: Sampling temperature (0.0 to 1.0).
+            max_tokens: Maximum number of tokens in each response.
+
+        Returns:
+            One AIResponse per conversation, in input order.
+        """
+        if not batches:
+            return []
+
         self._ensure_client()
 
+        requests = [
+            {
+                "custom_id": str(i),
+                "params": self._build_params(messages, tools, temperature, max_tokens),
+            }
+            for i, messages in enumerate(batches)
+        ]
+
+        results: list[AIResponse | None] = [None] * len(batches)
+
+        try:
+            batch = await self._client.messages.batches.create(requests=requests)
+            batch = await self._poll_batch(
+                lambda: self._client.messages.batches.retrieve(batch.id),
+                lambda b: b.processing_status == "ended",
+            )
+
+            async for entry in await self._client.messages.batches.results(batch.id):
+                index = int(entry.custom_id)
+                if entry.result.type == "succeeded":
+                    results[index] = self._parse_response(entry.result.message)
+                else:
+                    results[index] = AIResponse(
+                        content=f"Error generating response: batch request {entry.result.type}",
+                        tool_calls=[],
+                        finish_reason="error",
+                    )
+
+        except Exception as e:
+            return [
+                AIResponse(
+                    content=f"Error generating response: {str(e)}",
+                    tool_calls=[],
+                    finish_reason="error",
+                )
+                for _ in batches
+            ]
+
+        return [
+            result
+            if result is not None
+            else AIResponse(
+                content="Error generating response: missing batch result",
+                tool_calls=[],
+                finish_reason="error",
+            )
+            for result in results
+        ]
+
+    def _build_params(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict[str, Any]] | None,
+        temperature: float,
+        max_tokens: int | None,
+    ) -> dict[str, Any]:
+        """Build the Messages API request parameters."""
         # Extract system message and convert others to Claude format
         system_message, claude_messages = self._convert_messages(messages)
 
-        # Build request parameters
         params: dict[str, Any] = {
             "model": self.model_name,
             "messages": claude_messages,
@@ -90,70 +266,48 @@ class AnthropicProvider(AIProvider):
             params["system"] = system_message
 
         if tools:
-            params["tools"] = self.format_tools(tools)
+            params["tools"] = self._format_tools_cached(tools)
 
-        try:
-            response = await self._client.messages.create(**params)
-            return self._parse_response(response)
-
-        except Exception as e:
-            return AIResponse(
-                content=f"Error generating response: {str(e)}",
-                tool_calls=[],
-                finish_reason="error",
-            )
+        return params
 
     def _convert_messages(
         self, messages: list[AIMessage]
     ) -> tuple[str | None, list[dict[str, Any]]]:
         """Convert AIMessage list to Claude format, extracting system message."""
-        system_message = None
-        claude_messages = []
-
-        for msg in messages:
-            if msg.role == MessageRole.SYSTEM:
-                system_message = msg.content
-                continue
-
-            role = msg.role.value
-            if role == "tool":
-                # Claude uses tool_result for tool responses
-                claude_messages.append(
+        fmt = self._to_provider_format(messages)
+        return fmt.system_message, list(fmt.messages)
+
+    def _convert_message(self, msg: AIMessage) -> dict[str, Any] | None:
+        """Convert a single AIMessage to Claude format (system messages are extracted)."""
+        role = msg.role
+        if role is MessageRole.SYSTEM:
+            return None
+
+        if role is MessageRole.TOOL:
+            # Claude uses tool_result for tool responses
+            return {
+                "role": _ANTHROPIC_ROLE_MAP[role],
+                "content": [
                     {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": msg.tool_call_id,
-                                "content": msg.content,
-                            }
-                        ],
+                        "type": "tool_result",
+                        "tool_use_id": msg.tool_call_id,
+                        "content": msg.content,
                     }
-                )
-            else:
-                claude_messages.append({"role": role, "content": msg.content})
-
-        return system_message, claude_messages
+                ],
+            }
+        return {"role": _ANTHROPIC_ROLE_MAP[role], "content": msg.content}
 
     def _parse_response(self, response: Any) -> AIResponse:
         """Parse Claude response into AIResponse."""
-        content = ""
-        tool_calls = []
-
-        for block in response.content:
-            if block.type == "text":
-                content += block.text
-            elif block.type == "tool_use":
-                tool_calls.append(
-                    ToolCall(
-                        id=block.id,
-                        name=block.name,
-                        arguments=block.input,
-                    )
-                )
+        blocks = response.content
+        tool_calls = [
+            ToolCall(id=block.id, name=block.name, arguments=block.input)
+            for block in blocks
+            if block.type == "tool_use"
+        ]
 
         return AIResponse(
-            content=content,
+            content="".join(block.text for block in blocks if block.type == "text"),
             tool_calls=tool_calls,
             raw_response=response,
             finish_reason=response.stop_reason,
@@ -169,17 +323,14 @@ class AnthropicProvider(AIProvider):
         Returns:
             List of tool definitions in Claude format.
         """
-        claude_tools = []
-
-        for tool in tools:
-            claude_tool = {
+        return [
+            {
                 "name": tool.get("name", ""),
                 "description": tool.get("description", ""),
                 "input_schema": tool.get("parameters", {}),
             }
-            claude_tools.append(claude_tool)
-
-        return claude_tools
+            for tool in tools
+        ]
 
     @property
     def provider_name(self) -> str:
@@ -5,10 +5,13 @@ This module defines the interface that all AI providers must implement,
 enabling seamless switching between different frontier AI models.
 """
 
+import asyncio
+import copy
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable, Sequence
 
 
 class MessageRole(str, Enum):
@@ -20,26 +23,174 @@ class MessageRole(str, Enum):
     TOOL = "tool"
 
 
-@dataclass
+@dataclass(slots=True)
 class AIMessage:
     """Represents a message in the AI conversation."""
 
     role: MessageRole
     content: str
     tool_call_id: str | None = None
-    tool_calls: list[dict[str, Any]] | None = None
+    tool_calls: Sequence[dict[str, Any]] | None = None
+    _cached_dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _content_lower: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name not in ("_cached_dict", "_content_lower"):
+            # Any field change invalidates the memoized derived forms
+            object.__setattr__(self, "_cached_dict", None)
+            object.__setattr__(self, "_content_lower", None)
+
+    @property
+    def content_lower(self) -> str:
+        """Lowercased message content, computed once."""
+        lowered = self._content_lower
+        if lowered is None:
+            lowered = self.content.lower()
+            object.__setattr__(self, "_content_lower", lowered)
+        return lowered
 
     def to_dict(self) -> dict[str, Any]:
         """Convert message to dictionary format."""
-        result = {"role": self.role.value, "content": self.content}
-        if self.tool_call_id:
-            result["tool_call_id"] = self.tool_call_id
-        if self.tool_calls:
-            result["tool_calls"] = self.tool_calls
+        return dict(self._shared_dict())
+
+    def _shared_dict(self) -> dict[str, Any]:
+        """
+        Get the memoized dictionary form used when building requests.
+
+        The dictionary is built once and shared between calls and with
+        providers; it must not be modified. Public callers use to_dict().
+        """
+        result = self._cached_dict
+        if result is None:
+            result = {"role": self.role.value, "content": self.content}
+            if self.tool_call_id:
+                result["tool_call_id"] = self.tool_call_id
+            if self.tool_calls:
+                result["tool_calls"] = self.tool_calls
+            object.__setattr__(self, "_cached_dict", result)
         return result
 
 
 @dataclass
+class ProviderFormat:
+    """Provider-specific conversion of a conversation prefix."""
+
+    messages: list[Any] = field(default_factory=list)
+    system_message: str | None = None
+    converted_upto: int = 0
+
+
+class ConversationBuffer(list):
+    """
+    Conversation history that remembers provider-format conversions.
+
+    Behaves as a plain list of AIMessage. Providers convert it incrementally,
+    walking only the messages appended since the previous request. Any
+    mutation other than appending discards the stored conversions.
+    """
+
+    def __init__(self, messages: Any = ()):
+        super().__init__(messages)
+        self._formats: dict[str, ProviderFormat] = {}
+        self._last_user_idx: int | None = None  # None means "rescan on demand"
+        self._system_parts: list[str] | None = None  # None means "rescan on demand"
+
+    @property
+    def last_user_index(self) -> int:
+        """Index of the most recent user message, or -1 if there is none."""
+        if self._last_user_idx is None:
+            self._last_user_idx = -1
+            for i in range(len(self) - 1, -1, -1):
+                if self[i].role is MessageRole.USER:
+                    self._last_user_idx = i
+                    break
+        return self._last_user_idx
+
+    @property
+    def system_prompt(self) -> str:
+        """Concatenated content of all system messages."""
+        if self._system_parts is None:
+            self._system_parts = [msg.content for msg in self if msg.role is MessageRole.SYSTEM]
+        return "\n".join(self._system_parts)
+
+    def _track_appended(self, start: int) -> None:
+        """Update the tracked user index and system prompt for messages from start."""
+        for i in range(start, len(self)):
+            msg = self[i]
+            role = msg.role
+            if role is MessageRole.USER:
+                self._last_user_idx = i
+            elif role is MessageRole.SYSTEM and self._system_parts is not None:
+                self._system_parts.append(msg.content)
+
+    def append(self, message: AIMessage) -> None:
+        super().append(message)
+        self._track_appended(len(self) - 1)
+
+    def extend(self, messages: Any) -> None:
+        start = len(self)
+        super().extend(messages)
+        self._track_appended(start)
+
+    def __iadd__(self, messages: Any):
+        start = len(self)
+        result = super().__iadd__(messages)
+        self._track_appended(start)
+        return result
+
+    def provider_format(self, key: str) -> ProviderFormat:
+        """Get the stored conversion for a provider, resetting it if stale."""
+        fmt = self._formats.get(key)
+        if fmt is None or fmt.converted_upto > len(self):
+            fmt = self._formats[key] = ProviderFormat()
+        return fmt
+
+    def _invalidate(self) -> None:
+        self._formats.clear()
+        self._last_user_idx = None
+        self._system_parts = None
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._invalidate()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._invalidate()
+
+    def __imul__(self, n):
+        self._invalidate()
+        return super().__imul__(n)
+
+    def insert(self, index, value):
+        super().insert(index, value)
+        self._invalidate()
+
+    def pop(self, index=-1):
+        self._invalidate()
+        return super().pop(index)
+
+    def remove(self, value):
+        super().remove(value)
+        self._invalidate()
+
+    def clear(self):
+        super().clear()
+        self._invalidate()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._invalidate()
+
+    def reverse(self):
+        super().reverse()
+        self._invalidate()
+
+
+@dataclass(slots=True)
 class ToolCall:
     """Represents a tool call request from the AI."""
 
@@ -48,7 +199,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class AIResponse:
     """Response from an AI provider."""
 
@@ -63,6 +214,87 @@ class AIResponse:
         return len(self.tool_calls) > 0
 
 
+@dataclass(slots=True)
+class ResponseDelta:
+    """
+    Incremental piece of a streamed AI response.
+
+    Text arrives as it is generated; tool calls are delivered once complete,
+    and the final delta carries the finish reason.
+    """
+
+    content: str = ""
+    tool_calls: list[ToolCall] = field(default_factory=list)
+    finish_reason: str | None = None
+
+
+async def collect_stream(deltas: AsyncIterator[ResponseDelta]) -> AIResponse:
+    """
+    Collect a stream of response deltas into a complete AIResponse.
+
+    Args:
+        deltas: Stream produced by AIProvider.stream().
+
+    Returns:
+        AIResponse with the concatenated content and all tool calls.
+    """
+    text_parts: list[str] = []
+    tool_calls: list[ToolCall] = []
+    finish_reason = None
+
+    async for delta in deltas:
+        if delta.content:
+            text_parts.append(delta.content)
+        tool_calls.extend(delta.tool_calls)
+        if delta.finish_reason is not None:
+            finish_reason = delta.finish_reason
+
+    return AIResponse(
+        content="".join(text_parts),
+        tool_calls=tool_calls,
+        finish_reason=finish_reason,
+    )
+
+
+def find_last_user_message(messages: list[AIMessage]) -> AIMessage | None:
+    """
+    Find the most recent user message in a conversation.
+
+    Uses the tracked index of a ConversationBuffer when available.
+
+    Args:
+        messages: Conversation messages.
+
+    Returns:
+        The last message with the USER role, or None if there is none.
+    """
+    if isinstance(messages, ConversationBuffer):
+        index = messages.last_user_index
+        return messages[index] if index >= 0 else None
+    for msg in reversed(messages):
+        if msg.role is MessageRole.USER:
+            return msg
+    return None
+
+
+def extract_system_prompt(messages: list[AIMessage]) -> str:
+    """
+    Extract the system prompt of a conversation.
+
+    Uses the tracked system messages of a ConversationBuffer when available,
+    so long conversations are not rescanned on every turn.
+
+    Args:
+        messages: Conversation messages.
+
+    Returns:
+        The content of all system messages joined by newlines.
+    """
+    if isinstance(messages, ConversationBuffer):
+        return messages.system_prompt
+    return "\n".join(msg.content for msg in messages if msg.role is MessageRole.SYSTEM)
+
+
 class AIProvider(ABC):
     """
     Abstract base class for AI providers.
@@ -71,16 +303,40 @@ class AIProvider(ABC):
     to ensure consistent behavior across different models.
     """
 
-    def __init__(self, model_name: str, api_key: str | None = None):
+    # Default cap on concurrent in-flight requests, overridable per vendor
+    default_max_concurrency: int = 32
+
+    # Number of distinct tool lists whose formatted form is kept
+    tools_cache_size: int = 8
+
+    def __init__(
+        self,
+        model_name: str,
+        api_key: str | None = None,
+        max_concurrency: int | None = None,
+    ):
         """
         Initialize the AI provider.
 
         Args:
             model_name: The name/identifier of the model to use.
             api_key: Optional API key for authentication.
+            max_concurrency: Maximum number of concurrent requests. Falls back to the
+                PHCDT_MAX_CONCURRENCY env var, then to the provider's default.
         """
+        from proactive_hcdt.ai_providers.cache import ExactResponseCache
+
         self.model_name = model_name
         self.api_key = api_key
+        self._exact_cache = ExactResponseCache(maxsize=1024)
+        self._tools_cache: list[tuple[list[dict[str, Any]], list[dict[str, Any]]]] = []
+
+        if max_concurrency is None:
+            max_concurrency = int(
+                os.environ.get("PHCDT_MAX_CONCURRENCY", self.default_max_concurrency)
+            )
+        self.max_concurrency = max_concurrency
+        self._sem = asyncio.Semaphore(max_concurrency)
 
     @abstractmethod
     async def generate(
@@ -104,6 +360,160 @@ class AIProvider(ABC):
         """
         pass
 
+    async def stream(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict[str, Any]] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[ResponseDelta]:
+        """
+        Stream a response from the AI model as it is generated.
+
+        The default implementation yields the complete generate() result as a
+        single delta. Providers with native streaming override this so callers
+        can act on the first tokens before the response is complete.
+
+        Args:
+            messages: List of conversation messages.
+            tools: Optional list of tool definitions in the provider's format.
+            temperature: Sampling temperature (0.0 to 1.0).
+            max_tokens: Maximum number of tokens in the response.
+
+        Yields:
+            ResponseDelta pieces; use collect_stream() to assemble them.
+        """
+        response = await self.generate(
+            messages, tools=tools, temperature=temperature, max_tokens=max_tokens
+        )
+        yield ResponseDelta(
+            content=response.content,
+            tool_calls=list(response.tool_calls),
+            finish_reason=response.finish_reason,
+        )
+
+    def _convert_message(self, msg: AIMessage) -> Any:
+        """
+        Convert a single message to the provider's wire format.
+
+        Providers that support incremental conversion override this.
+
+        Returns:
+            The converted message, or None to leave it out of the request.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not convert messages")
+
+    def _extend_format(self, fmt: ProviderFormat, messages: list[AIMessage]) -> None:
+        """Append converted messages to a provider format."""
+        for msg in messages:
+            if msg.role is MessageRole.SYSTEM:
+                fmt.system_message = msg.content
+            converted = self._convert_message(msg)
+            if converted is not None:
+                fmt.messages.append(converted)
+        fmt.converted_upto += len(messages)
+
+    def convert_incremental(self, buffer: ConversationBuffer) -> ProviderFormat:
+        """
+        Convert a conversation buffer, walking only newly appended messages.
+
+        Args:
+            buffer: Conversation history to convert.
+
+        Returns:
+            The buffer's up-to-date provider format for this provider.
+        """
+        fmt = buffer.provider_format(self.provider_name)
+        if fmt.converted_upto < len(buffer):
+            self._extend_format(fmt, buffer[fmt.converted_upto :])
+        return fmt
+
+    def _to_provider_format(self, messages: list[AIMessage]) -> ProviderFormat:
+        """Convert messages, reusing prior work when given a ConversationBuffer."""
+        if isinstance(messages, ConversationBuffer):
+            return self.convert_incremental(messages)
+        fmt = ProviderFormat()
+        self._extend_format(fmt, messages)
+        return fmt
+
+    async def abatch(
+        self,
+        batches: list[list[AIMessage]],
+        tools: list[dict[str, Any]] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> list[AIResponse]:
+        """
+        Generate responses for many independent conversations.
+
+        The default implementation runs generate() concurrently. Providers with
+        a native batch API override this for bulk offline workloads.
+
+        Args:
+            batches: List of conversations, each a list of messages.
+            tools: Optional list of tool definitions shared by all conversations.
+            temperature: Sampling temperature (0.0 to 1.0).
+            max_tokens: Maximum number of tokens in each response.
+
+        Returns:
+            One AIResponse per conversation, in input order.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.generate(
+                        messages, tools=tools, temperature=temperature, max_tokens=max_tokens
+                    )
+                    for messages in batches
+                )
+            )
+        )
+
+    async def _poll_batch(
+        self,
+        fetch: Callable[[], Awaitable[Any]],
+        is_done: Callable[[Any], bool],
+        initial_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ) -> Any:
+        """
+        Poll a batch job with exponential backoff until it finishes.
+
+        Args:
+            fetch: Coroutine function returning the current job state.
+            is_done: Predicate telling whether a job state is terminal.
+            initial_delay: First delay between polls, in seconds.
+            max_delay: Upper bound on the delay between polls, in seconds.
+
+        Returns:
+            The terminal job state.
+        """
+        delay = initial_delay
+        job = await fetch()
+        while not is_done(job):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
+            job = await fetch()
+        return job
+
+    def _format_tools_cached(self, tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Format tools, reusing the result for structurally identical tool lists.
+
+        Tool definitions rarely change within a session, so the formatted list
+        is kept in a small LRU keyed by equality with the input definitions.
+        """
+        for i, (known, formatted) in enumerate(self._tools_cache):
+            if known == tools:
+                if i:
+                    self._tools_cache.insert(0, self._tools_cache.pop(i))
+                return formatted
+
+        formatted = self.format_tools(tools)
+        self._tools_cache.insert(0, (copy.deepcopy(tools), formatted))
+        del self._tools_cache[self.tools_cache_size :]
+        return formatted
+
     @abstractmethod
     def format_tools(self, tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
@@ -0,0 +1,393 @@
+"""
+Response caching for AI providers.
+
+Provides an exact-match LRU cache for deterministic requests, an
+embedding-backed semantic cache, and a provider wrapper that returns stored
+responses for near-duplicate user turns, avoiding a full network round-trip
+to the underlying model.
+"""
+
+import dataclasses
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Callable
+
+try:
+    # msgspec encodes the request payload in C, several times faster than json.dumps
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+from proactive_hcdt.ai_providers.base import (
+    AIMessage,
+    AIProvider,
+    AIResponse,
+    MessageRole,
+    ToolCall,
+    extract_system_prompt,
+    find_last_user_message,
+)
+
+
+# finish_reason values of responses CachingProvider never stores
+# ("length" from OpenAI, "max_tokens" from Anthropic)
+_UNCACHEABLE_FINISH_REASONS = frozenset({"error", "length", "max_tokens"})
+
+
+def _encode(obj: Any) -> bytes:
+    """Serialize an object to canonical (key-sorted) JSON bytes for hashing."""
+    if MSGSPEC_AVAILABLE:
+        return msgspec.json.encode(obj, order="sorted", enc_hook=str)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+
+def _copy_response(response: AIResponse) -> AIResponse:
+    """Copy a response along with its tool calls and their argument dicts."""
+    return dataclasses.replace(
+        response,
+        tool_calls=[
+            ToolCall(id=tc.id, name=tc.name, arguments=dict(tc.arguments))
+            for tc in response.tool_calls
+        ],
+    )
+
+
+def _last_user_content(messages: list[AIMessage]) -> str | None:
+    """Return the content of the most recent user message, if any."""
+    msg = find_last_user_message(messages)
+    return msg.content if msg is not None else None
+
+
+class ExactResponseCache:
+    """
+    Exact-match LRU cache of AI responses for deterministic requests.
+
+    Requests are keyed by a BLAKE2b digest of the model name, sampling
+    parameters, serialized messages, and tool definitions. Only requests at
+    (near) zero temperature are cacheable, since only those are reproducible.
+    """
+
+    def __init__(self, maxsize: int = 1024, max_temperature: float = 0.05):
+        """
+        Initialize the exact-match cache.
+
+        Args:
+            maxsize: Maximum number of stored responses (least recently used evicted).
+            max_temperature: Requests above this temperature are never cached.
+        """
+        self.maxsize = maxsize
+        self.max_temperature = max_temperature
+        self._entries: OrderedDict[bytes, AIResponse] = OrderedDict()
+
+    def make_key(
+        self,
+        model_name: str,
+        messages: list[AIMessage],
+        tools: list[dict[str, Any]] | None,
+        temperature: float,
+        max_tokens: int | None,
+    ) -> bytes | None:
+        """
+        Build the cache key for a request.
+
+        Returns:
+            The request digest, or None if the request is not cacheable.
+        """
+        if self.maxsize <= 0 or temperature > self.max_temperature:
+            return None
+
+        h = hashlib.blake2b(digest_size=16)
+        h.update(model_name.encode())
+        h.update(repr((temperature, max_tokens)).encode())
+        h.update(_encode([m._shared_dict() for m in messages]))
+        h.update(_encode(tools))
+        return h.digest()
+
+    def get(self, key: bytes | None) -> AIResponse | None:
+        """Return a copy of the cached response for a key, or None on a miss."""
+        if key is None:
+            return None
+        response = self._entries.get(key)
+        if response is None:
+            return None
+        self._entries.move_to_end(key)
+        return _copy_response(response)
+
+    def put(self, key: bytes | None, response: AIResponse) -> None:
+        """Store a response under a key, ignoring uncacheable requests and errors."""
+        if key is None or response.finish_reason == "error":
+            return
+        # Stored separately so the caller may still edit the response it holds
+        self._entries[key] = _copy_response(response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+
+class SemanticCache:
+    """
+    Embedding-backed cache of AI responses.
+
+    Entries are scoped by (model name, temperature, max_tokens, tool list,
+    system prompt); within a scope, a lookup hits when the cosine similarity
+    between the last user turn and a stored turn exceeds ``threshold``.
+
+    Embeddings are L2-normalized and stored row-wise in a single float32
+    matrix, so a lookup is one matrix-vector product.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 1024,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        embed_fn: Callable[[str], Any] | None = None,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit.
+            max_entries: Maximum number of stored responses (oldest evicted first).
+            model_name: sentence-transformers model used when no embed_fn is given.
+            embed_fn: Optional callable mapping text to an embedding vector.
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model_name = model_name
+        self._embed_fn = embed_fn
+        self._np = None
+
+        self._emb = None  # float32 matrix of shape (N, D)
+        self._scopes = None  # int64 scope id per row
+        self._responses: list[AIResponse] = []
+
+        # Last computed query, reused by put() after a miss in get()
+        self._last_text: str | None = None
+        self._last_vec = None
+
+    def _ensure_model(self) -> None:
+        """Lazily import numpy and load the embedding model."""
+        if self._np is None:
+            try:
+                import numpy as np
+            except ImportError:
+                raise ImportError(
+                    "numpy package is required for SemanticCache. "
+                    "Install it with: pip install numpy"
+                )
+            self._np = np
+
+        if self._embed_fn is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise ImportError(
+                    "sentence-transformers package is required for SemanticCache. "
+                    "Install it with: pip install sentence-transformers"
+                )
+
+            model = SentenceTransformer(self.model_name)
+            self._embed_fn = model.encode
+
+    def _embed(self, text: str) -> Any:
+        """Compute the L2-normalized embedding for a piece of text."""
+        if text == self._last_text and self._last_vec is not None:
+            return self._last_vec
+
+        self._ensure_model()
+        np = self._np
+
+        vec = np.asarray(self._embed_fn(text), dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vec))
+        if norm > 0.0:
+            vec /= norm
+
+        self._last_text = text
+        self._last_vec = vec
+        return vec
+
+    @staticmethod
+    def _scope_id(messages: list[AIMessage], params: dict[str, Any]) -> int:
+        """Hash the non-semantic part of the request into a signed 64-bit id."""
+        h = hashlib.blake2b(digest_size=8)
+        h.update(str(params.get("model", "")).encode())
+        h.update(repr((params.get("temperature"), params.get("max_tokens"))).encode())
+        h.update(_encode(params.get("tools")))
+        h.update(extract_system_prompt(messages).encode())
+        return int.from_bytes(h.digest(), "little", signed=True)
+
+    def get(self, messages: list[AIMessage], params: dict[str, Any]) -> AIResponse | None:
+        """
+        Look up a cached response for a conversation.
+
+        Args:
+            messages: Conversation messages.
+            params: Request parameters ("model", "temperature", "max_tokens", "tools").
+
+        Returns:
+            The cached AIResponse, or None on a miss.
+        """
+        text = _last_user_content(messages)
+        if text is None:
+            return None
+
+        q = self._embed(text)
+        if self._emb is None:
+            return None
+
+        np = self._np
+        sims = self._emb @ q
+        sims[self._scopes != self._scope_id(messages, params)] = -1.0
+
+        best = int(np.argmax(sims))
+        if sims[best] > self.threshold:
+            return self._responses[best]
+        return None
+
+    def put(self, messages: list[AIMessage], params: dict[str, Any], response: AIResponse) -> None:
+        """
+        Store a response for a conversation.
+
+        Args:
+            messages: Conversation messages.
+            params: Request parameters ("model", "temperature", "max_tokens", "tools").
+            response: The response to cache.
+        """
+        text = _last_user_content(messages)
+        if text is None:
+            return
+
+        q = self._embed(text)
+        np = self._np
+        scope = np.array([self._scope_id(messages, params)], dtype=np.int64)
+
+        if self._emb is None:
+            self._emb = q[np.newaxis, :].copy()
+            self._scopes = scope
+        else:
+            self._emb = np.vstack([self._emb, q])
+            self._scopes = np.concatenate([self._scopes, scope])
+        self._responses.append(response)
+
+        if len(self._responses) > self.max_entries:
+            self._emb = self._emb[1:]
+            self._scopes = self._scopes[1:]
+            self._responses.pop(0)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._emb = None
+        self._scopes = None
+        self._responses.clear()
+        self._last_text = None
+        self._last_vec = None
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._responses)
+
+
+class CachingProvider(AIProvider):
+    """
+    AI provider wrapper that serves near-duplicate requests from a cache.
+
+    Wraps any AIProvider and consults a SemanticCache before delegating, so
+    cache hits never touch the wrapped provider's client. Conversations
+    containing tool results and high-temperature requests bypass the cache.
+
+    Example:
+        ```python
+        from proactive_hcdt.ai_providers.cache import CachingProvider
+        from proactive_hcdt.ai_providers.gemini import GeminiAIProvider
+
+        provider = CachingProvider(GeminiAIProvider(), max_temperature=0.3)
+        ```
+    """
+
+    def __init__(
+        self,
+        provider: AIProvider,
+        cache: SemanticCache | None = None,
+        max_temperature: float = 0.3,
+    ):
+        """
+        Initialize the caching provider.
+
+        Args:
+            provider: The provider to wrap.
+            cache: Cache instance to use. Creates a default SemanticCache if None.
+            max_temperature: Requests above this temperature are never cached.
+        """
+        super().__init__(provider.model_name, provider.api_key)
+        self.provider = provider
+        self.cache = cache if cache is not None else SemanticCache()
+        self.max_temperature = max_temperature
+
+    def _is_cacheable(self, messages: list[AIMessage], temperature: float) -> bool:
+        """Check whether a request may be served from or stored in the cache."""
+        if temperature > self.max_temperature:
+            return False
+        return not any(msg.role == MessageRole.TOOL for msg in messages)
+
+    async def generate(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict[str, Any]] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> AIResponse:
+        """
+        Generate a response, serving it from the cache when possible.
+
+        Args:
+            messages: List of conversation messages.
+            tools: Optional list of tool definitions.
+            temperature: Sampling temperature (0.0 to 1.0).
+            max_tokens: Maximum number of tokens in the response.
+
+        Returns:
+            AIResponse containing the generated content and any tool calls.
+        """
+        if not self._is_cacheable(messages, temperature):
+            return await self.provider.generate(
+                messages, tools=tools, temperature=temperature, max_tokens=max_tokens
+            )
+
+        params = {
+            "model": self.model_name,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "tools": tools,
+        }
+        cached = self.cache.get(messages, params)
+        if cached is not None:
+            return cached
+
+        response = await self.provider.generate(
+            messages, tools=tools, temperature=temperature, max_tokens=max_tokens
+        )
+        # Errors and replies cut off by max_tokens are not reusable
+        if response.finish_reason not in _UNCACHEABLE_FINISH_REASONS:
+            self.cache.put(messages, params, response)
+        return response
+
+    def format_tools(self, tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Format tools using the wrapped provider."""
+        return self.provider.format_tools(tools)
+
+    @property
+    def provider_name(self) -> str:
+        """Return the wrapped provider's name."""
+        return self.provider.provider_name
@@ -5,10 +5,25 @@ This provider simulates AI responses without requiring actual API calls,
 making it useful for testing the framework and developing new features.
 """
 
-import uuid
+import copy
+import itertools
+import re
 from typing import Any
 
-from proactive_hcdt.ai_providers.base import AIMessage, AIProvider, AIResponse, ToolCall
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+from proactive_hcdt.ai_providers.base import (
+    AIMessage,
+    AIProvider,
+    AIResponse,
+    ToolCall,
+    find_last_user_message,
+)
 
 
 class DummyAIProvider(AIProvider):
@@ -19,11 +34,35 @@ class DummyAIProvider(AIProvider):
     and can simulate tool calls for testing the tool execution pipeline.
     """
 
+    # Words that suggest the user wants the robot to act (matched as substrings)
+    ACTION_WORDS = (
+        "move",
+        "go",
+        "turn",
+        "grab",
+        "pick",
+        "say",
+        "speak",
+        "look",
+        "scan",
+        "detect",
+        "find",
+        "help",
+        "assist",
+        "fetch",
+        "bring",
+    )
+    _ACTION_RE = re.compile("|".join(map(re.escape, ACTION_WORDS)))
+
+    # Tool lists smaller than this are scanned linearly (automaton build cost dominates)
+    AHOCORASICK_MIN_TOOLS = 8
+
     def __init__(
         self,
         model_name: str = "dummy-model-v1",
         api_key: str | None = None,
         responses: dict[str, str] | None = None,
+        max_concurrency: int | None = None,
     ):
         """
         Initialize the dummy AI provider.
@@ -32,10 +71,18 @@ class DummyAIProvider(AIProvider):
             model_name: Name of the dummy model.
             api_key: Ignored, included for interface compatibility.
             responses: Optional dictionary mapping input patterns to responses.
+            max_concurrency: Ignored, included for interface compatibility.
         """
-        super().__init__(model_name, api_key)
+        super().__init__(model_name, api_key, max_concurrency)
         self.responses = responses or {}
+        # Lowercased patterns, rebuilt whenever self.responses changes
+        self._responses_seen: dict[str, str] = {}
+        self._responses_lc: list[tuple[str, str]] = []
         self._call_count = 0
+        self._tool_keyword_cache: dict[str, list[str]] = {}
+        self._aho_cache: dict[tuple[str, ...], tuple[Any, int | None]] = {}
+        self._id_counter = itertools.count()
+        self._dummy_args_cache: dict[str, tuple[dict[str, Any], dict[str, Any], tuple[str, ...]]] = {}
 
     async def generate(
         self,
@@ -52,18 +99,37 @@ class DummyAIProvider(AIProvider):
         - Simulate tool calls if tools are provided and input suggests a command
         - Return a generic acknowledgment otherwise
         """
+        # No I/O happens here, so return the result without awaiting anything
+        return self.generate_sync(messages, tools, temperature, max_tokens)
+
+    def generate_sync(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict[str, Any]] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> AIResponse:
+        """
+        Synchronous version of generate() for use outside an event loop.
+
+        Args:
+            messages: List of conversation messages.
+            tools: Optional list of tool definitions.
+            temperature: Ignored, included for interface compatibility.
+            max_tokens: Ignored, included for interface compatibility.
+
+        Returns:
+            AIResponse containing the dummy content and any tool calls.
+        """
         self._call_count += 1
 
         # Get the last user message
-        last_user_message = ""
-        for msg in reversed(messages):
-            if msg.role.value == "user":
-                last_user_message = msg.content.lower()
-                break
+        last_user = find_last_user_message(messages)
+        last_user_message = last_user.content_lower if last_user is not None else ""
 
         # Check for predefined responses
-        for pattern, response in self.responses.items():
-            if pattern.lower() in last_user_message:
+        for pattern, response in self._lowercase_patterns():
+            if pattern in last_user_message:
                 return AIResponse(
                     content=response,
                     tool_calls=[],
@@ -89,58 +155,122 @@ class DummyAIProvider(AIProvider):
 
     def _should_use_tool(self, message: str, tools: list[dict[str, Any]]) -> bool:
         """Check if the message suggests using a tool."""
-        action_words = [
-            "move",
-            "go",
-            "turn",
-            "grab",
-            "pick",
-            "say",
-            "speak",
-            "look",
-            "scan",
-            "detect",
-            "find",
-            "help",
-            "assist",
-            "fetch",
-            "bring",
-        ]
-        return any(word in message for word in action_words)
+        return self._ACTION_RE.search(message) is not None
 
     def _generate_tool_call(
         self, message: str, tools: list[dict[str, Any]]
     ) -> ToolCall | None:
         """Generate a simulated tool call based on the message."""
         # Try to match the message to an available tool
-        for tool in tools:
-            tool_name = tool.get("name", "")
-
-            # Simple matching logic based on tool name
-            if any(keyword in message for keyword in tool_name.lower().split("_")):
-                # Generate dummy arguments
-                arguments = self._generate_dummy_arguments(tool)
-                return ToolCall(
-                    id=f"call_{uuid.uuid4().hex[:8]}",
-                    name=tool_name,
-                    arguments=arguments,
-                )
+        index = self._match_tool(message, tools)
+        if index is not None:
+            tool = tools[index]
+            # Generate dummy arguments
+            arguments = self._generate_dummy_arguments(tool)
+            return ToolCall(
+                id=self._next_call_id(),
+                name=tool.get("name", ""),
+                arguments=arguments,
+            )
 
         # If no specific match, use the first available tool
         if tools:
             tool = tools[0]
             return ToolCall(
-                id=f"call_{uuid.uuid4().hex[:8]}",
+                id=self._next_call_id(),
                 name=tool.get("name", "unknown"),
                 arguments=self._generate_dummy_arguments(tool),
             )
 
         return None
 
+    def _next_call_id(self) -> str:
+        """Return the next sequential tool call id."""
+        return f"call_{next(self._id_counter):08x}"
+
+    def _tool_keywords(self, tool_name: str) -> list[str]:
+        """Get the matching keywords for a tool name."""
+        keywords = self._tool_keyword_cache.get(tool_name)
+        if keywords is None:
+            keywords = self._tool_keyword_cache[tool_name] = tool_name.lower().split("_")
+        return keywords
+
+    def _match_tool(self, message: str, tools: list[dict[str, Any]]) -> int | None:
+        """
+        Find the first tool whose name keywords appear in the message.
+
+        Large tool lists are matched with a single Aho-Corasick pass when
+        pyahocorasick is installed; otherwise each tool is scanned in turn.
+
+        Returns:
+            Index of the matching tool, or None if no tool matches.
+        """
+        if AHOCORASICK_AVAILABLE and len(tools) >= self.AHOCORASICK_MIN_TOOLS:
+            names = tuple(tool.get("name", "") for tool in tools)
+            matcher = self._aho_cache.get(names)
+            if matcher is None:
+                matcher = self._aho_cache[names] = self._build_matcher(names)
+
+            automaton, always_index = matcher
+            index = None
+            if automaton is not None:
+                index = min((idx for _, idx in automaton.iter(message)), default=None)
+            if always_index is not None and (index is None or always_index < index):
+                index = always_index
+            return index
+
+        for index, tool in enumerate(tools):
+            # Simple matching logic based on tool name
+            if any(keyword in message for keyword in self._tool_keywords(tool.get("name", ""))):
+                return index
+        return None
+
+    def _build_matcher(self, names: tuple[str, ...]) -> tuple[Any, int | None]:
+        """
+        Build an Aho-Corasick automaton over the keywords of all tool names.
+
+        Each keyword maps to the lowest index of a tool containing it. An empty
+        keyword matches every message, so its tool index is returned separately
+        (as is a None automaton when there are no non-empty keywords).
+        """
+        automaton = ahocorasick.Automaton()
+        always_index = None
+
+        for index, name in enumerate(names):
+            for keyword in self._tool_keywords(name):
+                if not keyword:
+                    if always_index is None:
+                        always_index = index
+                elif not automaton.exists(keyword):
+                    automaton.add_word(keyword, index)
+
+        if len(automaton) == 0:
+            return None, always_index
+
+        automaton.make_automaton()
+        return automaton, always_index
+
     def _generate_dummy_arguments(self, tool: dict[str, Any]) -> dict[str, Any]:
-        """Generate dummy arguments for a tool based on its parameters."""
-        arguments = {}
+        """Generate dummy arguments for a tool, reusing them while its schema is unchanged."""
         parameters = tool.get("parameters", {}).get("properties", {})
+        name = tool.get("name", "")
+
+        cached = self._dummy_args_cache.get(name)
+        if cached is not None and cached[0] == parameters:
+            _, arguments, mutable_keys = cached
+            arguments = arguments.copy()
+            for key in mutable_keys:
+                arguments[key] = type(arguments[key])()
+            return arguments
+
+        arguments = self._build_dummy_arguments(parameters)
+        mutable_keys = tuple(k for k, v in arguments.items() if isinstance(v, (list, dict)))
+        self._dummy_args_cache[name] = (copy.deepcopy(parameters), arguments.copy(), mutable_keys)
+        return arguments
+
+    def _build_dummy_arguments(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Build dummy arguments from a tool's parameter properties."""
+        arguments = {}
 
         for param_name, param_info in parameters.items():
             param_type = param_info.get("type", "string")
@@ -168,6 +298,20 @@ class DummyAIProvider(AIProvider):
         """
         return tools
 
+    def _lowercase_patterns(self) -> list[tuple[str, str]]:
+        """
+        Get (lowercased pattern, response) pairs for self.responses.
+
+        Patterns are only lowercased again when the responses dict has been
+        replaced or edited since the last call.
+        """
+        if self.responses != self._responses_seen:
+            self._responses_seen = dict(self.responses)
+            self._responses_lc = [
+                (pattern.lower(), response) for pattern, response in self.responses.items()
+            ]
+        return self._responses_lc
+
     @property
     def provider_name(self) -> str:
         """Return the provider name."""
@@ -5,16 +5,25 @@ This is the primary AI provider for the framework, supporting Google's
 Gemini models for natural language understanding and generation.
 """
 
-from typing import Any
+from typing import Any, AsyncIterator
 
+from proactive_hcdt.ai_providers._retry import with_retries
 from proactive_hcdt.ai_providers.base import (
     AIMessage,
     AIProvider,
     AIResponse,
     MessageRole,
+    ResponseDelta,
     ToolCall,
 )
 
+# Gemini only knows "user" and "model" turns
+_GEMINI_ROLE_MAP = {
+    MessageRole.USER: "user",
+    MessageRole.TOOL: "user",
+    MessageRole.ASSISTANT: "model",
+}
+
 
 class GeminiAIProvider(AIProvider):
     """
@@ -24,10 +33,13 @@ class GeminiAIProvider(AIProvider):
     multi-modal AI capabilities in robotic assistance.
     """
 
+    default_max_concurrency = 100
+
     def __init__(
         self,
         model_name: str = "gemini-1.5-pro",
         api_key: str | None = None,
+        max_concurrency: int | None = None,
     ):
         """
         Initialize the Gemini AI provider.
@@ -35,8 +47,9 @@ class GeminiAIProvider(AIProvider):
         Args:
             model_name: The Gemini model to use (e.g., "gemini-1.5-pro", "gemini-1.5-flash").
             api_key: Google AI API key. If not provided, will look for GOOGLE_API_KEY env var.
+            max_concurrency: Maximum number of concurrent requests to the API.
         """
-        super().__init__(model_name, api_key)
+        super().__init__(model_name, api_key, max_concurrency)
         self._client = None
         self._model = None
 
@@ -76,68 +89,155 @@ class GeminiAIProvider(AIProvider):
         Returns:
             AIResponse containing the generated content and any tool calls.
         """
+        cache_key = self._exact_cache.make_key(
+            self.model_name, messages, tools, temperature, max_tokens
+        )
+        cached = self._exact_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        self._ensure_client()
+        request = self._build_request(messages, tools, temperature, max_tokens)
+
+        try:
+            async with self._sem:
+                response = await with_retries(lambda: self._send(*request))
+
+            # Parse response
+            result = self._parse_response(response)
+            self._exact_cache.put(cache_key, result)
+            return result
+
+        except Exception as e:
+            # Return error response
+            return AIResponse(
+                content=f"Error generating response: {str(e)}",
+                tool_calls=[],
+                finish_reason="error",
+            )
+
+    async def stream(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict[str, Any]] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[ResponseDelta]:
+        """
+        Stream a response from the Gemini model as it is generated.
+
+        Text deltas are yielded per chunk; function calls are collected
+        across chunks and yielded with the final delta.
+
+        Args:
+            messages: List of conversation messages.
+            tools: Optional list of tool definitions.
+            temperature: Sampling temperature (0.0 to 1.0).
+            max_tokens: Maximum number of tokens in the response.
+
+        Yields:
+            ResponseDelta pieces of the response.
+        """
         self._ensure_client()
+        request = self._build_request(messages, tools, temperature, max_tokens)
 
+        tool_calls: list[ToolCall] = []
+        finish_reason = None
+
+        try:
+            async with self._sem:
+                response = await with_retries(lambda: self._send(*request, stream=True))
+            async for chunk in response:
+                result = self._parse_response(chunk)
+                if result.finish_reason == "error":
+                    # Chunks without candidates carry no content
+                    continue
+                if result.content:
+                    yield ResponseDelta(content=result.content)
+                for tc in result.tool_calls:
+                    # Chunk-local ids would collide, so number calls per stream
+                    tool_calls.append(
+                        ToolCall(
+                            id=f"gemini_{tc.name}_{len(tool_calls)}",
+                            name=tc.name,
+                            arguments=tc.arguments,
+                        )
+                    )
+                if result.finish_reason is not None:
+                    finish_reason = result.finish_reason
+
+        except Exception as e:
+            yield ResponseDelta(
+                content=f"Error generating response: {str(e)}",
+                finish_reason="error",
+            )
+            return
+
+        yield ResponseDelta(tool_calls=tool_calls, finish_reason=finish_reason)
+
+    def _build_request(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict[str, Any]] | None,
+        temperature: float,
+        max_tokens: int | None,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any], list[dict[str, Any]] | None]:
+        """Build the Gemini messages, generation config, and tools for a request."""
         # Convert messages to Gemini format
         gemini_messages = self._convert_messages(messages)
 
         # Build generation config
-        generation_config = {"temperature": temperature}
+        generation_config: dict[str, Any] = {"temperature": temperature}
         if max_tokens:
             generation_config["max_output_tokens"] = max_tokens
 
         # Format tools if provided
         formatted_tools = None
         if tools:
-            formatted_tools = self.format_tools(tools)
+            formatted_tools = self._format_tools_cached(tools)
 
-        try:
-            # Create chat or direct generation based on message history
-            if len(gemini_messages) > 1:
-                chat = self._model.start_chat(history=gemini_messages[:-1])
-                response = await chat.send_message_async(
-                    gemini_messages[-1]["parts"],
-                    generation_config=generation_config,
-                    tools=formatted_tools,
-                )
-            else:
-                response = await self._model.generate_content_async(
-                    gemini_messages[0]["parts"] if gemini_messages else "",
-                    generation_config=generation_config,
-                    tools=formatted_tools,
-                )
-
-            # Parse response
-            return self._parse_response(response)
+        return gemini_messages, generation_config, formatted_tools
 
-        except Exception as e:
-            # Return error response
-            return AIResponse(
-                content=f"Error generating response: {str(e)}",
-                tool_calls=[],
-                finish_reason="error",
+    async def _send(
+        self,
+        gemini_messages: list[dict[str, Any]],
+        generation_config: dict[str, Any],
+        formatted_tools: list[dict[str, Any]] | None,
+        stream: bool = False,
+    ) -> Any:
+        """Send a request, using a chat session when there is message history."""
+        if len(gemini_messages) > 1:
+            chat = self._model.start_chat(history=gemini_messages[:-1])
+            return await chat.send_message_async(
+                gemini_messages[-1]["parts"],
+                generation_config=generation_config,
+                tools=formatted_tools,
+                stream=stream,
             )
 
+        return await self._model.generate_content_async(
+            gemini_messages[0]["parts"] if gemini_messages else "",
+            generation_config=generation_config,
+            tools=formatted_tools,
+            stream=stream,
+        )
+
     def _convert_messages(self, messages: list[AIMessage]) -> list[dict[str, Any]]:
         """Convert AIMessage list to Gemini format."""
-        gemini_messages = []
+        return list(self._to_provider_format(messages).messages)
 
-        for msg in messages:
-            if msg.role == MessageRole.SYSTEM:
-                # Gemini doesn't have a system role, prepend to first user message
-                continue
+    def _convert_message(self, msg: AIMessage) -> dict[str, Any] | None:
+        """Convert a single AIMessage to Gemini format."""
+        if msg.role is MessageRole.SYSTEM:
+            # Gemini doesn't have a system role, prepend to first user message
+            return None
 
-            role = "user" if msg.role in [MessageRole.USER, MessageRole.TOOL] else "model"
-
-            gemini_msg = {"role": role, "parts": [msg.content]}
-            gemini_messages.append(gemini_msg)
-
-        return gemini_messages
+        return {"role": _GEMINI_ROLE_MAP[msg.role], "parts": [msg.content]}
 
     def _parse_response(self, response: Any) -> AIResponse:
         """Parse Gemini response into AIResponse."""
         tool_calls = []
-        content = ""
+        text_parts: list[str] = []
 
         try:
             candidate = response.candidates[0]
@@ -145,7 +245,7 @@ class GeminiAIProvider(AIProvider):
 
             for part in content_parts:
                 if hasattr(part, "text"):
-                    content += part.text
+                    text_parts.append(part.text)
                 elif hasattr(part, "function_call"):
                     fc = part.function_call
                     tool_calls.append(
@@ -156,6 +256,7 @@ class GeminiAIProvider(AIProvider):
                         )
                     )
 
+            content = "".join(text_parts)
             finish_reason = (
                 str(candidate.finish_reason) if hasattr(candidate, "finish_reason") else None
             )
@@ -181,10 +282,8 @@ class GeminiAIProvider(AIProvider):
         Returns:
             List of tool definitions in Gemini format.
         """
-        gemini_tools = []
-
-        for tool in tools:
-            gemini_tool = {
+        return [
+            {
                 "function_declarations": [
                     {
                         "name": tool.get("name", ""),
@@ -193,9 +292,8 @@ class GeminiAIProvider(AIProvider):
                     }
                 ]
             }
-            gemini_tools.append(gemini_tool)
-
-        return gemini_tools
+            for tool in tools
+        ]
 
     @property
     def provider_name(self) -> str:
@@ -6,15 +6,27 @@ and generation with function calling capabilities.
 """
 
 import json
-from typing import Any
+from typing import Any, AsyncIterator
 
+try:
+    # orjson parses tool-call arguments several times faster than the stdlib
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+from proactive_hcdt.ai_providers._http import get_shared_http_client
+from proactive_hcdt.ai_providers._retry import with_retries
 from proactive_hcdt.ai_providers.base import (
     AIMessage,
     AIProvider,
     AIResponse,
+    ResponseDelta,
     ToolCall,
 )
 
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
 
 class OpenAIProvider(AIProvider):
     """
@@ -24,10 +36,13 @@ class OpenAIProvider(AIProvider):
     natural language understanding and tool use.
     """
 
+    default_max_concurrency = 2000
+
     def __init__(
         self,
         model_name: str = "gpt-4-turbo-preview",
         api_key: str | None = None,
+        max_concurrency: int | None = None,
     ):
         """
         Initialize the OpenAI provider.
@@ -35,13 +50,21 @@ class OpenAIProvider(AIProvider):
         Args:
             model_name: The OpenAI model to use (e.g., "gpt-4-turbo-preview", "gpt-4o").
             api_key: OpenAI API key. If not provided, will look for OPENAI_API_KEY env var.
+            max_concurrency: Maximum number of concurrent requests to the API.
         """
-        super().__init__(model_name, api_key)
+        super().__init__(model_name, api_key, max_concurrency)
         self._client = None
+        self._http_client = None  # shared pool the SDK client was built on
 
     def _ensure_client(self) -> None:
         """Lazily initialize the OpenAI client."""
-        if self._client is None:
+        if self._client is not None and self._http_client is None:
+            return  # client supplied directly, not built on the shared pool
+
+        # Pooled connections are per event loop, so rebuild the SDK client
+        # when called from a different loop than the one it was built in
+        http_client = get_shared_http_client("openai")
+        if http_client is not self._http_client:
             try:
                 from openai import AsyncOpenAI
             except ImportError:
@@ -50,7 +73,12 @@ class OpenAIProvider(AIProvider):
                     "Install it with: pip install openai"
                 )
 
-            self._client = AsyncOpenAI(api_key=self.api_key) if self.api_key else AsyncOpenAI()
+            self._client = (
+                AsyncOpenAI(api_key=self.api_key, http_client=http_client)
+                if self.api_key
+                else AsyncOpenAI(http_client=http_client)
+            )
+            self._http_client = http_client
 
     async def generate(
         self,
@@ -71,12 +99,213 @@ class OpenAIProvider(AIProvider):
         Returns:
             AIResponse containing the generated content and any tool calls.
         """
+        cache_key = self._exact_cache.make_key(
+            self.model_name, messages, tools, temperature, max_tokens
+        )
+        cached = self._exact_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        self._ensure_client()
+        params = self._build_params(messages, tools, temperature, max_tokens)
+
+        try:
+            async with self._sem:
+                response = await with_retries(
+                    lambda: self._client.chat.completions.create(**params)
+                )
+            result = self._parse_response(response)
+            self._exact_cache.put(cache_key, result)
+            return result
+
+        except Exception as e:
+            return AIResponse(
+                content=f"Error generating response: {str(e)}",
+                tool_calls=[],
+                finish_reason="error",
+            )
+
+    async def stream(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict[str, Any]] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[ResponseDelta]:
+        """
+        Stream a response from an OpenAI model as it is generated.
+
+        Text deltas are yielded as they arrive. Tool call fragments are
+        accumulated by index and yielded, parsed, with the final delta.
+
+        Args:
+            messages: List of conversation messages.
+            tools: Optional list of tool definitions.
+            temperature: Sampling temperature (0.0 to 1.0).
+            max_tokens: Maximum number of tokens in the response.
+
+        Yields:
+            ResponseDelta pieces of the response.
+        """
+        self._ensure_client()
+        params = self._build_params(messages, tools, temperature, max_tokens)
+        params["stream"] = True
+
+        # index -> [id, name, argument fragments]
+        pending: dict[int, list[Any]] = {}
+        finish_reason = None
+
+        try:
+            async with self._sem:
+                response = await with_retries(
+                    lambda: self._client.chat.completions.create(**params)
+                )
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                delta = choice.delta
+
+                if delta.content:
+                    yield ResponseDelta(content=delta.content)
+
+                for tc in delta.tool_calls or ():
+                    entry = pending.setdefault(tc.index, ["", "", []])
+                    if tc.id:
+                        entry[0] = tc.id
+                    if tc.function is not None:
+                        if tc.function.name:
+                            entry[1] += tc.function.name
+                        if tc.function.arguments:
+                            entry[2].append(tc.function.arguments)
+
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+
+        except Exception as e:
+            yield ResponseDelta(
+                content=f"Error generating response: {str(e)}",
+                finish_reason="error",
+            )
+            return
+
+        tool_calls = [
+            ToolCall(id=tc_id, name=name, arguments=self._parse_arguments("".join(parts) or "{}"))
+            for tc_id, name, parts in (pending[i] for i in sorted(pending))
+        ]
+        yield ResponseDelta(tool_calls=tool_calls, finish_reason=finish_reason)
+
+    async def abatch(
+        self,
+        batches: list[list[AIMessage]],
+        tools: list[dict[str, Any]] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> list[AIResponse]:
+        """
+        Generate responses for many conversations using the OpenAI Batch API.
+
+        Uploads all requests as one JSONL file, waits for the batch job to
+        finish, and parses the results back into input order.
+
+        Args:
+            batches: List of conversations, each a list of messages.
+            tools: Optional list of tool definitions shared by all conversations.
+            temperature: Sampling temperature (0.0 to 1.0).
+            max_tokens: Maximum number of tokens in each response.
+
+        Returns:
+            One AIResponse per conversation, in input order.
+        """
+        if not batches:
+            return []
+
         self._ensure_client()
 
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": self._build_params(messages, tools, temperature, max_tokens),
+                }
+            )
+            for i, messages in enumerate(batches)
+        ]
+
+        try:
+            from openai.types.chat import ChatCompletion
+
+            batch_file = await self._client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode()),
+                purpose="batch",
+            )
+            batch = await self._client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint=BATCH_ENDPOINT,
+                completion_window="24h",
+            )
+            batch = await self._poll_batch(
+                lambda: self._client.batches.retrieve(batch.id),
+                lambda b: b.status in BATCH_TERMINAL_STATUSES,
+            )
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+            output = await self._client.files.content(batch.output_file_id)
+
+        except Exception as e:
+            return [
+                AIResponse(
+                    content=f"Error generating response: {str(e)}",
+                    tool_calls=[],
+                    finish_reason="error",
+                )
+                for _ in batches
+            ]
+
+        results: list[AIResponse | None] = [None] * len(batches)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = _loads(line)
+            index = int(entry["custom_id"])
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                results[index] = self._parse_response(
+                    ChatCompletion.model_validate(response["body"])
+                )
+            else:
+                error = entry.get("error") or response.get("body")
+                results[index] = AIResponse(
+                    content=f"Error generating response: {error}",
+                    tool_calls=[],
+                    finish_reason="error",
+                )
+
+        return [
+            result
+            if result is not None
+            else AIResponse(
+                content="Error generating response: missing batch result",
+                tool_calls=[],
+                finish_reason="error",
+            )
+            for result in results
+        ]
+
+    def _build_params(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict[str, Any]] | None,
+        temperature: float,
+        max_tokens: int | None,
+    ) -> dict[str, Any]:
+        """Build the chat completion request body."""
         # Convert messages to OpenAI format
         openai_messages = self._convert_messages(messages)
 
-        # Build request parameters
         params: dict[str, Any] = {
             "model": self.model_name,
             "messages": openai_messages,
@@ -87,60 +316,33 @@ class OpenAIProvider(AIProvider):
             params["max_tokens"] = max_tokens
 
         if tools:
-            params["tools"] = self.format_tools(tools)
+            params["tools"] = self._format_tools_cached(tools)
             params["tool_choice"] = "auto"
 
-        try:
-            response = await self._client.chat.completions.create(**params)
-            return self._parse_response(response)
-
-        except Exception as e:
-            return AIResponse(
-                content=f"Error generating response: {str(e)}",
-                tool_calls=[],
-                finish_reason="error",
-            )
+        return params
 
     def _convert_messages(self, messages: list[AIMessage]) -> list[dict[str, Any]]:
         """Convert AIMessage list to OpenAI format."""
-        openai_messages = []
-
-        for msg in messages:
-            openai_msg: dict[str, Any] = {
-                "role": msg.role.value,
-                "content": msg.content,
-            }
-
-            if msg.tool_call_id:
-                openai_msg["tool_call_id"] = msg.tool_call_id
-
-            if msg.tool_calls:
-                openai_msg["tool_calls"] = msg.tool_calls
-
-            openai_messages.append(openai_msg)
+        return list(self._to_provider_format(messages).messages)
 
-        return openai_messages
+    def _convert_message(self, msg: AIMessage) -> dict[str, Any]:
+        """Convert a single AIMessage to OpenAI format."""
+        # OpenAI's chat format matches AIMessage.to_dict(); reuse the memoized form
+        return msg._shared_dict()
 
     def _parse_response(self, response: Any) -> AIResponse:
         """Parse OpenAI response into AIResponse."""
         choice = response.choices[0]
         message = choice.message
 
-        tool_calls = []
-        if message.tool_calls:
-            for tc in message.tool_calls:
-                try:
-                    arguments = json.loads(tc.function.arguments)
-                except json.JSONDecodeError:
-                    arguments = {"raw": tc.function.arguments}
-
-                tool_calls.append(
-                    ToolCall(
-                        id=tc.id,
-                        name=tc.function.name,
-                        arguments=arguments,
-                    )
-                )
+        tool_calls = [
+            ToolCall(
+                id=tc.id,
+                name=tc.function.name,
+                arguments=self._parse_arguments(tc.function.arguments),
+            )
+            for tc in message.tool_calls or ()
+        ]
 
         return AIResponse(
             content=message.content or "",
@@ -149,6 +351,14 @@ class OpenAIProvider(AIProvider):
             finish_reason=choice.finish_reason,
         )
 
+    @staticmethod
+    def _parse_arguments(raw: str) -> dict[str, Any]:
+        """Parse a tool call's JSON arguments, keeping malformed input as raw text."""
+        try:
+            return _loads(raw)
+        except json.JSONDecodeError:
+            return {"raw": raw}
+
     def format_tools(self, tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
         Format tools for OpenAI's function calling format.
@@ -159,10 +369,8 @@ class OpenAIProvider(AIProvider):
         Returns:
             List of tool definitions in OpenAI format.
         """
-        openai_tools = []
-
-        for tool in tools:
-            openai_tool = {
+        return [
+            {
                 "type": "function",
                 "function": {
                     "name": tool.get("name", ""),
@@ -170,9 +378,8 @@ class OpenAIProvider(AIProvider):
                     "parameters": tool.get("parameters", {}),
                 },
             }
-            openai_tools.append(openai_tool)
-
-        return openai_tools
+            for tool in tools
+        ]
 
     @property
     def provider_name(self) -> str:
@@ -4,13 +4,16 @@ Configuration settings for the proactive robotic assistance framework.
 Provides dataclass-based configuration for easy setup and validation.
 """
 
+import functools
+import importlib
 import os
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Any, Literal
+from types import MappingProxyType
+from typing import Any, Callable, Literal, Mapping
 
 from proactive_hcdt.ai_providers.base import AIProvider
-from proactive_hcdt.ai_providers.dummy import DummyAIProvider
 
 
 class AIProviderType(str, Enum):
@@ -22,26 +25,61 @@ class AIProviderType(str, Enum):
     ANTHROPIC = "anthropic"
 
 
-@dataclass
+# Provider classes are imported on first use, so unused SDK integrations never load
+_PROVIDER_CLASSES: Mapping[AIProviderType, tuple[str, str]] = MappingProxyType({
+    AIProviderType.DUMMY: ("proactive_hcdt.ai_providers.dummy", "DummyAIProvider"),
+    AIProviderType.GEMINI: ("proactive_hcdt.ai_providers.gemini", "GeminiAIProvider"),
+    AIProviderType.OPENAI: ("proactive_hcdt.ai_providers.openai_provider", "OpenAIProvider"),
+    AIProviderType.ANTHROPIC: (
+        "proactive_hcdt.ai_providers.anthropic_provider",
+        "AnthropicProvider",
+    ),
+})
+
+_DEFAULT_MODELS: Mapping[AIProviderType, str] = MappingProxyType({
+    AIProviderType.DUMMY: "dummy-model-v1",
+    AIProviderType.GEMINI: "gemini-1.5-pro",
+    AIProviderType.OPENAI: "gpt-4-turbo-preview",
+    AIProviderType.ANTHROPIC: "claude-3-5-sonnet-20241022",
+})
+
+_API_KEY_ENV_VARS: Mapping[AIProviderType, str] = MappingProxyType({
+    AIProviderType.GEMINI: "GOOGLE_API_KEY",
+    AIProviderType.OPENAI: "OPENAI_API_KEY",
+    AIProviderType.ANTHROPIC: "ANTHROPIC_API_KEY",
+})
+
+
+@functools.cache
+def _load_provider_class(provider_type: AIProviderType) -> type[AIProvider]:
+    """Import and return the provider class for a provider type (once per type)."""
+    try:
+        module_name, class_name = _PROVIDER_CLASSES[provider_type]
+    except KeyError:
+        raise ValueError(f"Unsupported provider type: {provider_type}")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@dataclass(slots=True)
 class AIProviderConfig:
     """Configuration for an AI provider."""
 
     provider_type: AIProviderType = AIProviderType.DUMMY
     model_name: str | None = None
-    api_key: str | None = None
+    api_key: str | None = field(default=None, repr=False)  # secret; kept out of repr
     temperature: float = 0.7
     max_tokens: int | None = None
+    max_concurrency: int | None = None  # None uses the provider's default
 
     def __post_init__(self):
-        """Set default model names based on provider type."""
+        """Set default model names and resolve API keys from the environment."""
         if self.model_name is None:
-            default_models = {
-                AIProviderType.DUMMY: "dummy-model-v1",
-                AIProviderType.GEMINI: "gemini-1.5-pro",
-                AIProviderType.OPENAI: "gpt-4-turbo-preview",
-                AIProviderType.ANTHROPIC: "claude-3-5-sonnet-20241022",
-            }
-            self.model_name = default_models.get(self.provider_type, "default-model")
+            self.model_name = _DEFAULT_MODELS.get(self.provider_type, "default-model")
+
+        if not self.api_key:
+            env_var = _API_KEY_ENV_VARS.get(self.provider_type)
+            if env_var is not None:
+                self.api_key = os.getenv(env_var)
 
     def create_provider(self) -> AIProvider:
         """
@@ -54,41 +92,48 @@ class AIProviderConfig:
             ImportError: If the required package for the provider is not installed.
             ValueError: If the provider type is not supported.
         """
-        if self.provider_type == AIProviderType.DUMMY:
-            return DummyAIProvider(
-                model_name=self.model_name or "dummy-model-v1",
-                api_key=self.api_key,
-            )
+        provider_class = _load_provider_class(self.provider_type)
+
+        return provider_class(
+            model_name=self.model_name or _DEFAULT_MODELS[self.provider_type],
+            api_key=self.api_key,
+            max_concurrency=self.max_concurrency,
+        )
 
-        elif self.provider_type == AIProviderType.GEMINI:
-            from proactive_hcdt.ai_providers.gemini import GeminiAIProvider
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the provider configuration to a dictionary (API key excluded).
 
-            return GeminiAIProvider(
-                model_name=self.model_name or "gemini-1.5-pro",
-                api_key=self.api_key or os.getenv("GOOGLE_API_KEY"),
-            )
+        Returns:
+            Configuration as dictionary.
+        """
+        return {
+            "provider_type": self.provider_type.value,
+            "model_name": self.model_name,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "max_concurrency": self.max_concurrency,
+        }
 
-        elif self.provider_type == AIProviderType.OPENAI:
-            from proactive_hcdt.ai_providers.openai_provider import OpenAIProvider
 
-            return OpenAIProvider(
-                model_name=self.model_name or "gpt-4-turbo-preview",
-                api_key=self.api_key or os.getenv("OPENAI_API_KEY"),
-            )
+def _ai_config_from_mapping(ai_config: Mapping[str, Any]) -> AIProviderConfig:
+    """Build an AIProviderConfig from its dictionary form."""
+    if "provider_type" in ai_config:
+        ai_config = {**ai_config, "provider_type": AIProviderType(ai_config["provider_type"])}
+    return AIProviderConfig(**ai_config)
 
-        elif self.provider_type == AIProviderType.ANTHROPIC:
-            from proactive_hcdt.ai_providers.anthropic_provider import AnthropicProvider
 
-            return AnthropicProvider(
-                model_name=self.model_name or "claude-3-5-sonnet-20241022",
-                api_key=self.api_key or os.getenv("ANTHROPIC_API_KEY"),
-            )
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
 
-        else:
-            raise ValueError(f"Unsupported provider type: {self.provider_type}")
+# Exact type of the "ai_provider" value -> loader, checked before any isinstance fallback
+_AI_CONFIG_LOADERS: Mapping[type, Callable[[Any], AIProviderConfig]] = MappingProxyType({
+    dict: _ai_config_from_mapping,
+    MappingProxyType: _ai_config_from_mapping,
+    AIProviderConfig: lambda ai_config: ai_config,
+})
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameworkConfig:
     """
     Main configuration for the proactive robotic assistance framework.
@@ -129,29 +174,23 @@ class FrameworkConfig:
         Returns:
             Configured FrameworkConfig instance.
         """
-        ai_config = config_dict.get("ai_provider", {})
-        if isinstance(ai_config, dict):
-            if "provider_type" in ai_config:
-                ai_config["provider_type"] = AIProviderType(ai_config["provider_type"])
-            ai_provider = AIProviderConfig(**ai_config)
+        ai_config = config_dict.get("ai_provider", _EMPTY_MAPPING)
+        loader = _AI_CONFIG_LOADERS.get(type(ai_config))
+        if loader is not None:
+            ai_provider = loader(ai_config)
+        elif isinstance(ai_config, Mapping):
+            ai_provider = _ai_config_from_mapping(ai_config)
         else:
             ai_provider = ai_config
 
-        return cls(
-            ai_provider=ai_provider,
-            system_prompt=config_dict.get("system_prompt"),
-            max_tool_iterations=config_dict.get("max_tool_iterations", 10),
-            robot_name=config_dict.get("robot_name", "ProactiveBot"),
-            enable_proactive_scanning=config_dict.get("enable_proactive_scanning", True),
-            scan_interval_seconds=config_dict.get("scan_interval_seconds", 30.0),
-            require_confirmation_for_movement=config_dict.get(
-                "require_confirmation_for_movement", False
-            ),
-            max_movement_distance=config_dict.get("max_movement_distance", 10.0),
-            emergency_stop_enabled=config_dict.get("emergency_stop_enabled", True),
-            debug_mode=config_dict.get("debug_mode", False),
-            log_conversations=config_dict.get("log_conversations", False),
-        )
+        # Missing keys fall back to the field defaults declared on the class
+        kwargs = {name: config_dict[name] for name in _FRAMEWORK_FIELD_NAMES if name in config_dict}
+
+        # Configs loaded from files share one copy of a repeated system prompt
+        system_prompt = kwargs.get("system_prompt")
+        if type(system_prompt) is str:
+            kwargs["system_prompt"] = sys.intern(system_prompt)
+        return cls(ai_provider=ai_provider, **kwargs)
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -161,12 +200,7 @@ class FrameworkConfig:
             Configuration as dictionary.
         """
         return {
-            "ai_provider": {
-                "provider_type": self.ai_provider.provider_type.value,
-                "model_name": self.ai_provider.model_name,
-                "temperature": self.ai_provider.temperature,
-                "max_tokens": self.ai_provider.max_tokens,
-            },
+            "ai_provider": self.ai_provider.to_dict(),
             "system_prompt": self.system_prompt,
             "max_tool_iterations": self.max_tool_iterations,
             "robot_name": self.robot_name,
@@ -180,6 +214,19 @@ class FrameworkConfig:
         }
 
 
+# FrameworkConfig fields read by from_dict (ai_provider is converted separately)
+_FRAMEWORK_FIELD_NAMES = tuple(f.name for f in fields(FrameworkConfig) if f.name != "ai_provider")
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve DummyAIProvider, formerly imported here eagerly, on first access."""
+    if name == "DummyAIProvider":
+        from proactive_hcdt.ai_providers.dummy import DummyAIProvider
+
+        return DummyAIProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def create_config(
     provider: Literal["dummy", "gemini", "openai", "anthropic"] = "dummy",
     model_name: str | None = None,
@@ -5,9 +5,18 @@ The AIController is the brain of the system, managing conversations,
 interpreting user intent, and orchestrating tool calls to control the robot.
 """
 
-from typing import Any
-
-from proactive_hcdt.ai_providers.base import AIMessage, AIProvider, AIResponse, MessageRole
+import asyncio
+import json
+import sys
+from typing import Any, Iterator
+
+from proactive_hcdt.ai_providers.base import (
+    AIMessage,
+    AIProvider,
+    ConversationBuffer,
+    MessageRole,
+    ToolCall,
+)
 from proactive_hcdt.core.tool_registry import ToolRegistry
 from proactive_hcdt.tools.base import ToolResult
 
@@ -46,7 +55,8 @@ class AIController:
         ```
     """
 
-    DEFAULT_SYSTEM_PROMPT = """You are a proactive AI-controlled robotic assistant designed to help humans with various tasks.
+    # Interned so controllers and configs loading the same prompt share one copy
+    DEFAULT_SYSTEM_PROMPT = sys.intern("""You are a proactive AI-controlled robotic assistant designed to help humans with various tasks.
 
 Your capabilities include:
 - Movement and navigation
@@ -61,7 +71,12 @@ When assisting users:
 4. Be proactive in anticipating needs when appropriate
 5. Prioritize safety in all actions
 
-Always be helpful, friendly, and efficient in your assistance."""
+Always be helpful, friendly, and efficient in your assistance.""")
+
+    PROACTIVE_SCAN_PROMPT = (
+        "\n\nBased on this scan, should I take any proactive action to help? "
+        "If so, what action would be most helpful?"
+    )
 
     def __init__(
         self,
@@ -69,6 +84,7 @@ Always be helpful, friendly, and efficient in your assistance."""
         tool_registry: ToolRegistry | None = None,
         system_prompt: str | None = None,
         max_tool_iterations: int = 10,
+        max_history: int | None = 256,
     ):
         """
         Initialize the AI controller.
@@ -78,20 +94,25 @@ Always be helpful, friendly, and efficient in your assistance."""
             tool_registry: Registry of available tools. Creates empty registry if None.
             system_prompt: Custom system prompt. Uses default if None.
             max_tool_iterations: Maximum number of tool call iterations per request.
+            max_history: Maximum number of messages kept after the system prompt.
+                None keeps the full history.
         """
         self.ai_provider = ai_provider
         self.tool_registry = tool_registry or ToolRegistry()
-        self.system_prompt = system_prompt or self.DEFAULT_SYSTEM_PROMPT
+        self.system_prompt = sys.intern(system_prompt or self.DEFAULT_SYSTEM_PROMPT)
         self.max_tool_iterations = max_tool_iterations
+        self.max_history = max_history
 
-        self._conversation_history: list[AIMessage] = []
+        self._conversation_history = ConversationBuffer()
         self._initialize_conversation()
 
     def _initialize_conversation(self) -> None:
         """Initialize the conversation with the system prompt."""
-        self._conversation_history = [
-            AIMessage(role=MessageRole.SYSTEM, content=self.system_prompt)
-        ]
+        # Shared by the history and proactive scans
+        self._system_msg = AIMessage(role=MessageRole.SYSTEM, content=self.system_prompt)
+
+        # A fresh buffer lets providers convert the history incrementally
+        self._conversation_history = ConversationBuffer([self._system_msg])
 
     async def process(
         self,
@@ -124,7 +145,7 @@ Always be helpful, friendly, and efficient in your assistance."""
         )
 
         # Get tool schemas for the AI
-        tool_schemas = self.tool_registry.get_schemas()
+        tool_schemas = self.tool_registry.schemas_view()
 
         # Process with potential tool calls
         final_response = await self._process_with_tools(tool_schemas)
@@ -133,10 +154,37 @@ Always be helpful, friendly, and efficient in your assistance."""
         self._conversation_history.append(
             AIMessage(role=MessageRole.ASSISTANT, content=final_response)
         )
+        self._trim_history()
 
         return final_response
 
-    async def _process_with_tools(self, tool_schemas: list[dict[str, Any]]) -> str:
+    def _trim_history(self) -> None:
+        """Drop the oldest turns once the history grows past max_history."""
+        history = self._conversation_history
+        if self.max_history is None or len(history) - 1 <= self.max_history:
+            return
+
+        # Trim a quarter below the limit so the providers' incremental
+        # conversion, which any deletion resets, is rebuilt once per block
+        keep = self.max_history - self.max_history // 4
+        cut = len(history) - keep
+
+        # Start at a user turn so no tool result loses its tool call
+        while cut < len(history) and history[cut].role is not MessageRole.USER:
+            cut += 1
+
+        if cut == len(history):
+            # The latest turn alone is over budget (e.g. a long tool-call
+            # loop); keep it whole, starting from its user message
+            cut = next(
+                (i for i in range(len(history) - 1, 0, -1)
+                 if history[i].role is MessageRole.USER),
+                1,
+            )
+
+        del history[1:cut]
+
+    async def _process_with_tools(self, tool_schemas: tuple[dict[str, Any], ...]) -> str:
         """
         Process the conversation with potential tool calls.
 
@@ -158,63 +206,73 @@ Always be helpful, friendly, and efficient in your assistance."""
             )
 
             # If no tool calls, return the content
-            if not response.has_tool_calls:
+            tool_calls = response.tool_calls
+            if not tool_calls:
                 return response.content or "I've completed the requested action."
 
             # Execute tool calls and add results to history
-            tool_results = await self._execute_tool_calls(response)
+            tool_results = await self._execute_tool_calls(tool_calls)
 
             # Add assistant's tool call response and tool results to history
-            self._conversation_history.append(
-                AIMessage(
-                    role=MessageRole.ASSISTANT,
-                    content=response.content or "",
-                    tool_calls=[
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {"name": tc.name, "arguments": str(tc.arguments)},
-                        }
-                        for tc in response.tool_calls
-                    ],
-                )
+            assistant_msg = AIMessage(
+                role=MessageRole.ASSISTANT,
+                content=response.content or "",
+                tool_calls=tuple(
+                    {
+                        "id": tc.id,
+                        "type": "function",
+                        "function": {
+                            "name": tc.name,
+                            "arguments": json.dumps(
+                                tc.arguments, separators=(",", ":"), default=str
+                            ),
+                        },
+                    }
+                    for tc in tool_calls
+                ),
             )
-
-            # Add tool results
-            for tool_call, result in tool_results:
-                self._conversation_history.append(
+            self._conversation_history.extend([
+                assistant_msg,
+                *(
                     AIMessage(
                         role=MessageRole.TOOL,
                         content=result.to_message(),
                         tool_call_id=tool_call.id,
                     )
-                )
+                    for tool_call, result in tool_results
+                ),
+            ])
 
         # If we hit the iteration limit, return what we have
         return "I've reached the maximum number of actions. Please provide additional guidance."
 
     async def _execute_tool_calls(
-        self, response: AIResponse
-    ) -> list[tuple[Any, ToolResult]]:
+        self, tool_calls: list[ToolCall]
+    ) -> list[tuple[ToolCall, ToolResult]]:
         """
-        Execute all tool calls from an AI response.
+        Execute tool calls from an AI response concurrently.
 
         Args:
-            response: AI response containing tool calls.
+            tool_calls: Tool calls requested by the AI.
 
         Returns:
-            List of (tool_call, result) tuples.
+            List of (tool_call, result) tuples, in the order of the tool calls.
         """
-        results = []
+        execute = self.tool_registry.execute
+        results = await asyncio.gather(
+            *(execute(tool_call.name, **tool_call.arguments) for tool_call in tool_calls),
+            return_exceptions=True,
+        )
 
-        for tool_call in response.tool_calls:
-            result = await self.tool_registry.execute(
-                tool_call.name,
-                **tool_call.arguments,
+        return [
+            (
+                tool_call,
+                ToolResult(success=False, error=f"Tool execution failed: {str(result)}")
+                if isinstance(result, BaseException)
+                else result,
             )
-            results.append((tool_call, result))
-
-        return results
+            for tool_call, result in zip(tool_calls, results)
+        ]
 
     def add_context(self, context: str) -> None:
         """
@@ -229,16 +287,29 @@ Always be helpful, friendly, and efficient in your assistance."""
         self._conversation_history.append(
             AIMessage(role=MessageRole.USER, content=f"[System Context]: {context}")
         )
+        self._trim_history()
 
     def get_conversation_history(self) -> list[dict[str, Any]]:
         """
         Get the current conversation history.
 
         Returns:
-            List of message dictionaries.
+            List of message dictionaries (copies; safe to modify).
         """
         return [msg.to_dict() for msg in self._conversation_history]
 
+    def iter_conversation_history(self) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over the conversation history without building a list.
+
+        Suited to streaming consumers such as incremental JSON writers. The
+        message dictionaries are shared with the history; do not modify them.
+
+        Yields:
+            Message dictionaries, oldest first.
+        """
+        return (msg._shared_dict() for msg in self._conversation_history)
+
     def clear_history(self) -> None:
         """Clear the conversation history and reinitialize with system prompt."""
         self._initialize_conversation()
@@ -252,7 +323,7 @@ Always be helpful, friendly, and efficient in your assistance."""
         Args:
             prompt: The new system prompt.
         """
-        self.system_prompt = prompt
+        self.system_prompt = sys.intern(prompt)
         self._initialize_conversation()
 
     async def proactive_scan(self) -> str | None:
@@ -268,7 +339,7 @@ Always be helpful, friendly, and efficient in your assistance."""
             Suggested action or None if no action needed.
         """
         # Check if perception tool is available
-        if not self.tool_registry.has("perceive_environment"):
+        if "perceive_environment" not in self.tool_registry.tools:
             return None
 
         # Execute perception
@@ -282,15 +353,12 @@ Always be helpful, friendly, and efficient in your assistance."""
             return None
 
         # Ask AI to analyze and suggest actions
-        context_message = f"[Proactive Scan Result]: {result.data}"
         response = await self.ai_provider.generate(
             messages=[
-                AIMessage(role=MessageRole.SYSTEM, content=self.system_prompt),
+                self._system_msg,
                 AIMessage(
                     role=MessageRole.USER,
-                    content=f"{context_message}\n\nBased on this scan, "
-                    "should I take any proactive action to help? "
-                    "If so, what action would be most helpful?",
+                    content=f"[Proactive Scan Result]: {result.data}{self.PROACTIVE_SCAN_PROMPT}",
                 ),
             ],
         )
@@ -5,7 +5,8 @@ The ToolRegistry maintains a collection of available tools and provides
 methods for registering, retrieving, and executing them.
 """
 
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 from proactive_hcdt.tools.base import BaseTool, ToolResult
 
@@ -21,6 +22,10 @@ class ToolRegistry:
     def __init__(self):
         """Initialize an empty tool registry."""
         self._tools: dict[str, BaseTool] = {}
+        # Live read-only view; lookups and membership tests on it run at C level
+        self.tools: Mapping[str, BaseTool] = MappingProxyType(self._tools)
+        self._schemas_cache: tuple[dict[str, Any], ...] | None = None
+        self._validators: dict[str, Callable[..., tuple[bool, str | None]]] = {}
 
     def register(self, tool: BaseTool) -> None:
         """
@@ -35,6 +40,8 @@ class ToolRegistry:
         if tool.name in self._tools:
             raise ValueError(f"Tool '{tool.name}' is already registered")
         self._tools[tool.name] = tool
+        self._schemas_cache = None
+        self._validators.pop(tool.name, None)
 
     def register_many(self, tools: list[BaseTool]) -> None:
         """
@@ -58,6 +65,8 @@ class ToolRegistry:
         """
         if tool_name in self._tools:
             del self._tools[tool_name]
+            self._schemas_cache = None
+            self._validators.pop(tool_name, None)
             return True
         return False
 
@@ -96,15 +105,18 @@ class ToolRegistry:
         Returns:
             ToolResult from the tool execution.
         """
-        tool = self.get(tool_name)
+        tool = self._tools.get(tool_name)
         if tool is None:
             return ToolResult(
                 success=False,
                 error=f"Tool '{tool_name}' not found",
             )
 
-        # Validate arguments
-        valid, error = tool.validate_arguments(**kwargs)
+        # Validate arguments with the tool's validator, compiled on first use
+        validator = self._validators.get(tool_name)
+        if validator is None:
+            validator = self._validators[tool_name] = tool.compile_validator()
+        valid, error = validator(**kwargs)
         if not valid:
             return ToolResult(success=False, error=error)
 
@@ -144,9 +156,25 @@ class ToolRegistry:
         """
         return [tool.to_schema() for tool in self._tools.values()]
 
+    def schemas_view(self) -> tuple[dict[str, Any], ...]:
+        """
+        Get the shared JSON schemas for all registered tools.
+
+        Unlike get_schemas(), the schemas are built once and reused until the
+        set of tools changes.
+
+        Returns:
+            Tuple of tool schemas in the standard format (shared; do not modify).
+        """
+        if self._schemas_cache is None:
+            self._schemas_cache = tuple(tool.to_schema() for tool in self._tools.values())
+        return self._schemas_cache
+
     def clear(self) -> None:
         """Remove all registered tools."""
         self._tools.clear()
+        self._schemas_cache = None
+        self._validators.clear()
 
     def __len__(self) -> int:
         """Return the number of registered tools."""
@@ -154,7 +182,7 @@ class ToolRegistry:
 
     def __contains__(self, tool_name: str) -> bool:
         """Check if a tool is registered."""
-        return self.has(tool_name)
+        return tool_name in self._tools
 
     def __iter__(self):
         """Iterate over registered tools."""
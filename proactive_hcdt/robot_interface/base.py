@@ -6,11 +6,12 @@ to integrate with the proactive assistance framework.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, fields
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class RobotState:
     """Current state of the robot."""
 
@@ -23,7 +24,12 @@ class RobotState:
     error_state: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert state to dictionary."""
+        """
+        Convert state to dictionary.
+
+        The position and orientation dicts are shared with this state rather
+        than copied; RobotState is a snapshot, so treat them as read-only.
+        """
         return {
             "position": self.position,
             "orientation": self.orientation,
@@ -34,6 +40,40 @@ class RobotState:
             "error_state": self.error_state,
         }
 
+    def to_mapping(self) -> Mapping[str, Any]:
+        """
+        Get a read-only, zero-copy mapping view of this state.
+
+        Unlike to_dict(), nothing is copied: the view reads the state's
+        attributes on access and reflects later changes. Use it for
+        read-only consumers such as logging.
+        """
+        return _RobotStateView(self)
+
+
+class _RobotStateView(Mapping[str, Any]):
+    """Read-only mapping over the fields of a RobotState."""
+
+    __slots__ = ("_state",)
+
+    def __init__(self, state: RobotState):
+        self._state = state
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _ROBOT_STATE_FIELD_SET:
+            raise KeyError(key)
+        return getattr(self._state, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_ROBOT_STATE_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_ROBOT_STATE_FIELDS)
+
+
+_ROBOT_STATE_FIELDS = tuple(f.name for f in fields(RobotState))
+_ROBOT_STATE_FIELD_SET = frozenset(_ROBOT_STATE_FIELDS)
+
 
 class RobotInterface(ABC):
     """
@@ -177,6 +217,6 @@ class RobotInterface(ABC):
 
     @property
     @abstractmethod
-    def capabilities(self) -> list[str]:
-        """Return list of robot capabilities."""
+    def capabilities(self) -> Sequence[str]:
+        """Return the robot capabilities (treat as read-only)."""
         pass
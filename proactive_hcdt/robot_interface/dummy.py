@@ -6,10 +6,34 @@ actual robot connections.
 """
 
 import asyncio
+import random
+from collections.abc import Sequence
 from typing import Any
 
 from proactive_hcdt.robot_interface.base import RobotInterface, RobotState
 
+_AXES = frozenset({"roll", "pitch", "yaw"})
+
+# Delays shorter than this yield to the event loop without arming a timer
+MIN_TIMER_DELAY = 1e-3
+
+
+async def _simulate_delay(delay: float) -> None:
+    """Wait out a simulated delay, bypassing the timer heap for sub-millisecond ones."""
+    if delay >= MIN_TIMER_DELAY:
+        await asyncio.sleep(delay)
+    elif delay > 0.0:
+        await asyncio.sleep(0)
+
+
+def _as_position(position: dict[str, float]) -> dict[str, float]:
+    """Read a target position into a fresh {x, y, z} dict of floats (z defaults to 0)."""
+    return {
+        "x": float(position["x"]),
+        "y": float(position["y"]),
+        "z": float(position.get("z", 0.0)),
+    }
+
 
 class DummyRobotInterface(RobotInterface):
     """
@@ -45,34 +69,43 @@ class DummyRobotInterface(RobotInterface):
         self._held_object: str | None = None
         self._error_state: str | None = None
 
-        self._capabilities = [
+        self._capabilities = (
             "movement",
             "rotation",
             "speech",
             "display",
             "manipulation",
-        ]
+        )
 
     async def _simulate_operation(self) -> bool:
         """Simulate an operation with delay and potential failure."""
-        await asyncio.sleep(self._simulation_delay)
+        await _simulate_delay(self._simulation_delay)
+
+        # Failures are disabled by default; skip the RNG call entirely then
+        if self._failure_rate <= 0.0:
+            return True
+        return random.random() >= self._failure_rate
 
-        import random
+    async def _simulate_many(self, n: int) -> list[bool]:
+        """Simulate n operations gated by a single delay."""
+        await _simulate_delay(self._simulation_delay)
 
-        if random.random() < self._failure_rate:
-            return False
-        return True
+        failure_rate = self._failure_rate
+        if failure_rate <= 0.0:
+            return [True] * n
+        rand = random.random
+        return [rand() >= failure_rate for _ in range(n)]
 
     async def initialize(self) -> bool:
         """Initialize the dummy robot."""
-        await asyncio.sleep(self._simulation_delay * 2)
+        await _simulate_delay(self._simulation_delay * 2)
         self._initialized = True
         self._error_state = None
         return True
 
     async def shutdown(self) -> bool:
         """Shutdown the dummy robot."""
-        await asyncio.sleep(self._simulation_delay)
+        await _simulate_delay(self._simulation_delay)
         self._initialized = False
         self._is_moving = False
         return True
@@ -99,10 +132,16 @@ class DummyRobotInterface(RobotInterface):
             self._error_state = "Robot not initialized"
             return False
 
+        try:
+            target = _as_position(position)
+        except (KeyError, TypeError, ValueError):
+            self._error_state = f"Invalid position: {position!r}"
+            return False
+
         self._is_moving = True
 
         if await self._simulate_operation():
-            self._position = position.copy()
+            self._position = target
             self._is_moving = False
             self._battery_level = max(0.0, self._battery_level - 0.01)
             return True
@@ -111,6 +150,50 @@ class DummyRobotInterface(RobotInterface):
             self._error_state = "Movement failed"
             return False
 
+    async def move_many(
+        self,
+        positions: Sequence[dict[str, float]],
+        speed: float = 0.5,
+    ) -> list[bool]:
+        """
+        Simulate a sequence of movements with one shared delay.
+
+        Equivalent to calling move_to for each position in order, but the
+        whole batch waits on a single simulated delay.
+
+        Args:
+            positions: Target positions, visited in order.
+            speed: Movement speed (0.0 to 1.0).
+
+        Returns:
+            Whether each movement succeeded, in input order.
+        """
+        if not self._initialized:
+            self._error_state = "Robot not initialized"
+            return [False] * len(positions)
+
+        if not positions:
+            return []
+
+        try:
+            targets = [_as_position(position) for position in positions]
+        except (KeyError, TypeError, ValueError):
+            self._error_state = "Invalid position in batch"
+            return [False] * len(positions)
+
+        self._is_moving = True
+        results = await self._simulate_many(len(targets))
+
+        for target, ok in zip(targets, results):
+            if ok:
+                self._position = target
+                self._battery_level = max(0.0, self._battery_level - 0.01)
+            else:
+                self._error_state = "Movement failed"
+
+        self._is_moving = False
+        return results
+
     async def rotate(
         self,
         angle: float,
@@ -121,7 +204,7 @@ class DummyRobotInterface(RobotInterface):
             self._error_state = "Robot not initialized"
             return False
 
-        if axis not in ["roll", "pitch", "yaw"]:
+        if axis not in _AXES:
             self._error_state = f"Invalid rotation axis: {axis}"
             return False
 
@@ -197,13 +280,13 @@ class DummyRobotInterface(RobotInterface):
         return self._name
 
     @property
-    def capabilities(self) -> list[str]:
-        """Return robot capabilities."""
-        return self._capabilities.copy()
+    def capabilities(self) -> tuple[str, ...]:
+        """Return robot capabilities (immutable, so shared rather than copied)."""
+        return self._capabilities
 
     def set_position(self, position: dict[str, float]) -> None:
         """Directly set position for testing."""
-        self._position = position.copy()
+        self._position = _as_position(position)
 
     def set_battery_level(self, level: float) -> None:
         """Directly set battery level for testing."""
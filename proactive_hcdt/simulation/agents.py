@@ -7,18 +7,47 @@ Agents are entities that can move and interact within the world.
 """
 
 from dataclasses import dataclass, field
-from typing import Tuple, Optional, List
-from enum import Enum
+from typing import Dict, NamedTuple, Tuple, Optional, List
+from enum import IntEnum
 import math
 
 
-class AgentType(Enum):
-    HUMAN = "human"
-    AI = "ai"
+_hypot = math.hypot
 
+_DIAG = math.sqrt(0.5)  # 1/sqrt(2), a unit diagonal step
 
-@dataclass
-class AgentState:
+# Unit movement vectors for AIAgent.move_direction
+_DIRECTIONS: Dict[str, Tuple[float, float]] = {
+    'up': (0.0, -1.0),
+    'down': (0.0, 1.0),
+    'left': (-1.0, 0.0),
+    'right': (1.0, 0.0),
+    'up_left': (-_DIAG, -_DIAG),
+    'up_right': (_DIAG, -_DIAG),
+    'down_left': (-_DIAG, _DIAG),
+    'down_right': (_DIAG, _DIAG),
+}
+
+
+# Keyboard direction per 4-bit key mask (bit0=up, bit1=down, bit2=left, bit3=right)
+_KEY_DIRECTIONS: Tuple[Tuple[float, float], ...] = tuple(
+    (float((mask >> 3 & 1) - (mask >> 2 & 1)), float((mask >> 1 & 1) - (mask & 1)))
+    for mask in range(16)
+)
+
+
+class AgentType(IntEnum):
+    """Agent controller kind; an int so it compares and hashes as a plain integer."""
+    HUMAN = 0
+    AI = 1
+    
+    @property
+    def label(self) -> str:
+        """Lowercase name ("human" or "ai"), the former string value."""
+        return self.name.lower()
+
+
+class AgentState(NamedTuple):
     """Immutable snapshot of agent state for observation."""
     x: float
     y: float
@@ -29,7 +58,7 @@ class AgentState:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """Base agent class with position and movement."""
     
@@ -41,21 +70,22 @@ class Agent:
     max_speed: float = 5.0
     agent_type: AgentType = AgentType.HUMAN
     
-    # Movement state
-    velocity_x: float = field(default=0.0, repr=False)
-    velocity_y: float = field(default=0.0, repr=False)
+    # Movement state (not constructor arguments; __init__ zeroes them directly)
+    velocity_x: float = field(default=0.0, init=False, repr=False)
+    velocity_y: float = field(default=0.0, init=False, repr=False)
     
     # Movement input (normalized direction)
-    _move_x: float = field(default=0.0, repr=False)
-    _move_y: float = field(default=0.0, repr=False)
+    _move_x: float = field(default=0.0, init=False, repr=False)
+    _move_y: float = field(default=0.0, init=False, repr=False)
     
     def set_movement(self, dx: float, dy: float) -> None:
         """Set movement direction (normalized)."""
-        # Normalize if magnitude > 1
-        magnitude = math.sqrt(dx * dx + dy * dy)
-        if magnitude > 1.0:
-            dx /= magnitude
-            dy /= magnitude
+        # Normalize if magnitude > 1; idle and cardinal input skip the sqrt
+        m2 = dx * dx + dy * dy
+        if m2 > 1.0:
+            inv = 1.0 / math.sqrt(m2)
+            dx *= inv
+            dy *= inv
         self._move_x = dx
         self._move_y = dy
     
@@ -69,16 +99,32 @@ class Agent:
     def update(self, dt: float, world_width: float, world_height: float) -> None:
         """Update agent position based on movement input."""
         # Apply movement
-        self.velocity_x = self._move_x * self.max_speed
-        self.velocity_y = self._move_y * self.max_speed
+        max_speed = self.max_speed
+        vx = self._move_x * max_speed
+        vy = self._move_y * max_speed
+        self.velocity_x = vx
+        self.velocity_y = vy
         
         # Update position
-        self.x += self.velocity_x * dt * 60  # Scale by 60 for frame-rate independence
-        self.y += self.velocity_y * dt * 60
+        step = dt * 60.0  # Scale by 60 for frame-rate independence
+        x = self.x + vx * step
+        y = self.y + vy * step
+        
+        # Clamp to world bounds (plain branches avoid min()/max() call overhead)
+        r = self.radius
+        max_x = world_width - r
+        max_y = world_height - r
+        if x > max_x:
+            x = max_x
+        if x < r:
+            x = r
+        if y > max_y:
+            y = max_y
+        if y < r:
+            y = r
         
-        # Clamp to world bounds
-        self.x = max(self.radius, min(world_width - self.radius, self.x))
-        self.y = max(self.radius, min(world_height - self.radius, self.y))
+        self.x = x
+        self.y = y
     
     def get_state(self) -> AgentState:
         """Get immutable state snapshot."""
@@ -94,16 +140,24 @@ class Agent:
     
     def distance_to(self, other: "Agent") -> float:
         """Calculate distance to another agent."""
-        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
+        return _hypot(self.x - other.x, self.y - other.y)
     
     def distance_to_point(self, x: float, y: float) -> float:
         """Calculate distance to a point."""
-        return math.sqrt((self.x - x) ** 2 + (self.y - y) ** 2)
+        return _hypot(self.x - x, self.y - y)
+    
+    def distance_sq_to_point(self, x: float, y: float) -> float:
+        """Calculate squared distance to a point (cheaper for threshold checks)."""
+        dx = self.x - x
+        dy = self.y - y
+        return dx * dx + dy * dy
 
 
 class HumanAgent(Agent):
     """Agent controlled by human keyboard input."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         name: str = "Human",
@@ -128,24 +182,22 @@ class HumanAgent(Agent):
         Args:
             keys_pressed: Dict with keys 'w', 'a', 's', 'd' as bools
         """
-        dx = 0.0
-        dy = 0.0
-        
-        if keys_pressed.get('w') or keys_pressed.get('up'):
-            dy -= 1.0
-        if keys_pressed.get('s') or keys_pressed.get('down'):
-            dy += 1.0
-        if keys_pressed.get('a') or keys_pressed.get('left'):
-            dx -= 1.0
-        if keys_pressed.get('d') or keys_pressed.get('right'):
-            dx += 1.0
-        
+        get = keys_pressed.get
+        mask = (
+            (1 if get('w') or get('up') else 0)
+            | (2 if get('s') or get('down') else 0)
+            | (4 if get('a') or get('left') else 0)
+            | (8 if get('d') or get('right') else 0)
+        )
+        dx, dy = _KEY_DIRECTIONS[mask]
         self.set_movement(dx, dy)
 
 
 class AIAgent(Agent):
     """Agent controlled by AI/VLM through API calls."""
     
+    __slots__ = ('_target_x', '_target_y', '_message')
+    
     def __init__(
         self,
         name: str = "AI Assistant",
@@ -193,19 +245,21 @@ class AIAgent(Agent):
         self._target_x = target_x
         self._target_y = target_y
         
-        distance = self.distance_to_point(target_x, target_y)
+        dx = target_x - self.x
+        dy = target_y - self.y
+        dist_sq = dx * dx + dy * dy
         
-        if distance <= arrival_threshold:
-            self.stop()
+        if dist_sq <= arrival_threshold * arrival_threshold:
+            # Inlined stop(): this branch runs every tick while parked at a target
+            self._move_x = self._move_y = self.velocity_x = self.velocity_y = 0.0
             self._target_x = None
             self._target_y = None
             return True
         
-        # Calculate direction
-        dx = (target_x - self.x) / distance
-        dy = (target_y - self.y) / distance
-        
-        self.set_movement(dx, dy)
+        # Calculate unit direction; it needs no further normalization
+        inv = 1.0 / math.sqrt(dist_sq)
+        self._move_x = dx * inv
+        self._move_y = dy * inv
         return False
     
     def move_direction(self, direction: str, magnitude: float = 1.0) -> None:
@@ -217,22 +271,13 @@ class AIAgent(Agent):
                       'up_left', 'up_right', 'down_left', 'down_right'
             magnitude: Movement magnitude (0.0 to 1.0)
         """
-        directions = {
-            'up': (0, -1),
-            'down': (0, 1),
-            'left': (-1, 0),
-            'right': (1, 0),
-            'up_left': (-0.707, -0.707),
-            'up_right': (0.707, -0.707),
-            'down_left': (-0.707, 0.707),
-            'down_right': (0.707, 0.707),
-        }
-        
-        if direction in directions:
-            dx, dy = directions[direction]
-            self.set_movement(dx * magnitude, dy * magnitude)
-        else:
+        d = _DIRECTIONS.get(direction)
+        if d is None:
             self.stop()
+            return
+        
+        dx, dy = d
+        self.set_movement(dx * magnitude, dy * magnitude)
     
     def get_status(self) -> dict:
         """Get current AI agent status for debugging/display."""
@@ -16,6 +16,107 @@ from enum import Enum
 import math
 import time
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+# Below this many objects NumPy's per-call overhead outweighs vectorizing
+VECTORIZE_MIN_OBJECTS = 32
+
+# Squared distances for push completion (compared without a sqrt)
+_AT_TARGET_DIST_SQ = 10.0 * 10.0  # push_towards: object already at target
+_PUSH_DONE_DIST_SQ = 50.0 * 50.0  # is_action_complete: object close to target
+_RETARGET_DIST_SQ = 2.0 * 2.0  # is_action_complete: object moved enough to re-aim
+
+
+# Unit offsets for move_to_object's fixed directions (screen y grows downward)
+_OFFSET_DIRECTIONS: Dict[str, Tuple[float, float]] = {
+    "left": (-1.0, 0.0),
+    "right": (1.0, 0.0),
+    "above": (0.0, -1.0),
+    "below": (0.0, 1.0),
+}
+
+
+def _shape_type_from_name(name: str) -> str:
+    """Derive an object's shape type from its name prefix."""
+    if name.startswith("Box"):
+        return "box"
+    elif name.startswith("T-"):
+        return "T"
+    elif name.startswith("L-"):
+        return "L"
+    return "unknown"
+
+
+def _push_score(obj: "ObjectInfo") -> float:
+    """Score an object as a push target (higher is better)."""
+    return obj.distance_to_human * 0.5 - obj.distance_to_ai
+
+
+def _observe_kernel(
+    xs: List[float],
+    ys: List[float],
+    human_pos: Tuple[float, float],
+    ai_pos: Tuple[float, float],
+    bounds: List[Tuple[float, float, float, float]],
+) -> Tuple[List[float], List[float], List[int], List[List[int]]]:
+    """
+    Compute the numeric part of an observation in one pass over the objects.
+    
+    Large worlds are processed as NumPy arrays (converted once); smaller ones
+    in a single fused Python loop.
+    
+    Args:
+        xs, ys: Object coordinates
+        human_pos: Human agent position
+        ai_pos: AI agent position
+        bounds: (x0, x1, y0, y1) per goal
+        
+    Returns:
+        Distances to the human and to the AI per object, the first
+        containing goal index per object (-1 if none), and the indices of
+        the objects inside each goal
+    """
+    hx, hy = human_pos
+    ax, ay = ai_pos
+    
+    if NUMPY_AVAILABLE and len(xs) >= VECTORIZE_MIN_OBJECTS:
+        px = np.asarray(xs)
+        py = np.asarray(ys)
+        dists_human = np.hypot(px - hx, py - hy).tolist()
+        dists_ai = np.hypot(px - ax, py - ay).tolist()
+        if not bounds:
+            return dists_human, dists_ai, [-1] * len(xs), []
+        
+        b = np.asarray(bounds)
+        px = px[:, None]
+        py = py[:, None]
+        inside = (px >= b[:, 0]) & (px <= b[:, 1]) & (py >= b[:, 2]) & (py <= b[:, 3])
+        first = np.where(inside.any(axis=1), inside.argmax(axis=1), -1).tolist()
+        members = [np.flatnonzero(column).tolist() for column in inside.T]
+        return dists_human, dists_ai, first, members
+    
+    hypot = math.hypot
+    dists_human = []
+    dists_ai = []
+    first = []
+    members: List[List[int]] = [[] for _ in bounds]
+    for j, (x, y) in enumerate(zip(xs, ys)):
+        dists_human.append(hypot(x - hx, y - hy))
+        dists_ai.append(hypot(x - ax, y - ay))
+        hit = -1
+        for i, (x0, x1, y0, y1) in enumerate(bounds):
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                if hit < 0:
+                    hit = i
+                members[i].append(j)
+        first.append(hit)
+    return dists_human, dists_ai, first, members
+
 
 class ActionStatus(Enum):
     """Status of an action execution."""
@@ -34,7 +135,7 @@ class ActionResult:
     data: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectInfo:
     """Information about an object in the world."""
     name: str
@@ -47,7 +148,7 @@ class ObjectInfo:
     distance_to_ai: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class GoalInfo:
     """Information about a goal zone."""
     name: str
@@ -72,6 +173,11 @@ class WorldObservation:
     human_score: int
     ai_score: int
     
+    # Name -> ObjectInfo index, built on the first get_object_by_name call
+    _by_name: Optional[Dict[str, ObjectInfo]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def to_text(self) -> str:
         """Convert to natural language description for VLM."""
         lines = [
@@ -84,13 +190,12 @@ class WorldObservation:
             "Objects:",
         ]
         
-        for obj in self.objects:
-            status = f"in {obj.in_goal}" if obj.in_goal else "in play"
-            lines.append(
-                f"  - {obj.name} ({obj.shape_type}): ({obj.x:.0f}, {obj.y:.0f}), "
-                f"dist to human: {obj.distance_to_human:.0f}, dist to AI: {obj.distance_to_ai:.0f}, "
-                f"status: {status}"
-            )
+        lines.extend(
+            f"  - {obj.name} ({obj.shape_type}): ({obj.x:.0f}, {obj.y:.0f}), "
+            f"dist to human: {obj.distance_to_human:.0f}, dist to AI: {obj.distance_to_ai:.0f}, "
+            f"status: {f'in {obj.in_goal}' if obj.in_goal else 'in play'}"
+            for obj in self.objects
+        )
         
         lines.append("")
         lines.append("Goal Zones:")
@@ -107,17 +212,18 @@ class WorldObservation:
     
     def get_closest_object_to_ai(self) -> Optional[ObjectInfo]:
         """Get the closest object to the AI that's still in play."""
-        in_play = self.get_objects_in_play()
-        if not in_play:
-            return None
-        return min(in_play, key=lambda o: o.distance_to_ai)
+        return min(
+            (obj for obj in self.objects if obj.in_goal is None),
+            key=lambda o: o.distance_to_ai,
+            default=None,
+        )
     
     def get_object_by_name(self, name: str) -> Optional[ObjectInfo]:
         """Find object by name."""
-        for obj in self.objects:
-            if obj.name == name:
-                return obj
-        return None
+        if self._by_name is None:
+            # Reversed so the first object wins should names ever repeat
+            self._by_name = {obj.name: obj for obj in reversed(self.objects)}
+        return self._by_name.get(name)
     
     def get_ai_goal(self) -> Optional[GoalInfo]:
         """Get the AI's assigned goal zone."""
@@ -160,6 +266,18 @@ class AIActionPrimitives:
         self._action_start_tick: int = 0
         self._message: str = ""
         
+        # Object position the current push target was computed from
+        self._last_pushed_obj_xy: Optional[Tuple[float, float]] = None
+        
+        # Last observation and the world state it was built from
+        self._obs_cache: Optional[WorldObservation] = None
+        self._obs_cache_key: Optional[tuple] = None
+        
+        # Object names of the last observed world and their shape types,
+        # reused for as long as the object set is unchanged
+        self._layout_names: Tuple[str, ...] = ()
+        self._layout_shape_types: List[str] = []
+        
         # Action parameters
         self.arrival_threshold = 25.0  # Distance to consider "arrived"
         self.push_offset = 35.0  # Distance behind object when pushing
@@ -174,70 +292,105 @@ class AIActionPrimitives:
         """Clear the displayed message."""
         self._message = ""
     
+    def _assigned_goal(self, agent: str):
+        """Find the goal currently assigned to an agent ("ai" or "human")."""
+        return next((g for g in self.goals if g.assigned_to == agent), None)
+    
     # ==================== PERCEPTION ====================
     
+    def invalidate_observation(self) -> None:
+        """Discard the cached observation so the next observe() rebuilds it."""
+        self._obs_cache = None
+        self._obs_cache_key = None
+    
     def observe(self) -> WorldObservation:
         """
         Get complete observation of the current world state.
         
+        The raw world state (agents, object poses, goals) is read on every
+        call; if none of it changed since the last call, the previous
+        (shared, read-only) WorldObservation is returned without rebuilding.
+        
         Returns:
             WorldObservation with all entities and their states
         """
-        human_pos = self.physics.get_agent_position("human")
-        human_vel = self.physics.get_agent_velocity("human")
-        ai_pos = self.physics.get_agent_position(self.agent_name)
-        ai_vel = self.physics.get_agent_velocity(self.agent_name)
+        physics = self.physics
+        tick = getattr(physics, "tick", 0)
+        human_pos = physics.get_agent_position("human")
+        human_vel = physics.get_agent_velocity("human")
+        ai_pos = physics.get_agent_position(self.agent_name)
+        ai_vel = physics.get_agent_velocity(self.agent_name)
+        
+        object_poses = physics.get_object_poses()
+        names = tuple(object_poses)
+        poses = tuple(object_poses.values())
+        
+        goal_states = tuple(
+            (g.name, g.x, g.y, g.width, g.height, g.assigned_to) for g in self.goals
+        )
+        
+        key = (tick, human_pos, human_vel, ai_pos, ai_vel, names, poses, goal_states)
+        if key == self._obs_cache_key:
+            return self._obs_cache
+        
+        obs = self._build_observation(
+            tick, human_pos, human_vel, ai_pos, ai_vel, names, poses
+        )
+        self._obs_cache = obs
+        self._obs_cache_key = key
+        return obs
+    
+    def _build_observation(
+        self,
+        tick: int,
+        human_pos: Tuple[float, float],
+        human_vel: Tuple[float, float],
+        ai_pos: Tuple[float, float],
+        ai_vel: Tuple[float, float],
+        names: Tuple[str, ...],
+        poses: Tuple[Tuple[float, float, float], ...],
+    ) -> WorldObservation:
+        """Build a WorldObservation from agent states and object (x, y, angle) poses."""
+        # Shape types depend only on the object set, which is usually fixed
+        if names != self._layout_names:
+            self._layout_names = names
+            self._layout_shape_types = [_shape_type_from_name(name) for name in names]
+        
+        xs = [pose[0] for pose in poses]
+        ys = [pose[1] for pose in poses]
+        
+        # Goal bounds (x0, x1, y0, y1), matching GoalZone.contains_point
+        goals = self.goals
+        goal_bounds = [
+            (g.x - g.width / 2, g.x + g.width / 2, g.y - g.height / 2, g.y + g.height / 2)
+            for g in goals
+        ]
+        
+        # Distances and goal containment in one pass
+        dists_human, dists_ai, goal_idx, members = _observe_kernel(
+            xs, ys, human_pos, ai_pos, goal_bounds
+        )
         
         # Build object info
         objects = []
-        for name, body in self.physics.objects.items():
-            # Determine shape type from name
-            if name.startswith("Box"):
-                shape_type = "box"
-            elif name.startswith("T-"):
-                shape_type = "T"
-            elif name.startswith("L-"):
-                shape_type = "L"
-            else:
-                shape_type = "unknown"
-            
-            # Check if in any goal
-            in_goal = None
-            for goal in self.goals:
-                if goal.contains_point(body.position.x, body.position.y):
-                    in_goal = goal.name
-                    break
-            
-            # Calculate distances
-            dist_human = math.sqrt(
-                (body.position.x - human_pos[0])**2 +
-                (body.position.y - human_pos[1])**2
-            )
-            dist_ai = math.sqrt(
-                (body.position.x - ai_pos[0])**2 +
-                (body.position.y - ai_pos[1])**2
-            )
-            
+        for name, shape_type, (x, y, angle), gi, dist_human, dist_ai in zip(
+            names, self._layout_shape_types, poses, goal_idx, dists_human, dists_ai
+        ):
             objects.append(ObjectInfo(
                 name=name,
                 shape_type=shape_type,
-                x=body.position.x,
-                y=body.position.y,
-                angle=body.angle,
-                in_goal=in_goal,
+                x=x,
+                y=y,
+                angle=angle,
+                in_goal=goals[gi].name if gi >= 0 else None,
                 distance_to_human=dist_human,
                 distance_to_ai=dist_ai,
             ))
         
-        # Build goal info
+        # Build goal info, scoring as we go (simplified - count objects * 100)
         goal_infos = []
-        for goal in self.goals:
-            # Check which objects are inside
-            objects_inside = []
-            for name, body in self.physics.objects.items():
-                if goal.contains_point(body.position.x, body.position.y):
-                    objects_inside.append(name)
-            
+        scores = {"human": 0, "ai": 0}
+        for goal, inside in zip(goals, members):
             goal_infos.append(GoalInfo(
                 name=goal.name,
                 x=goal.x,
@@ -245,20 +398,15 @@ class AIActionPrimitives:
                 width=goal.width,
                 height=goal.height,
                 assigned_to=goal.assigned_to,
-                objects_inside=objects_inside,
+                objects_inside=[names[j] for j in inside],
             ))
-        
-        # Calculate scores (simplified - count objects * 100)
-        human_score = 0
-        ai_score = 0
-        for goal_info in goal_infos:
-            if goal_info.assigned_to == "human":
-                human_score = len(goal_info.objects_inside) * 100
-            elif goal_info.assigned_to == "ai":
-                ai_score = len(goal_info.objects_inside) * 100
+            if goal.assigned_to in scores:
+                scores[goal.assigned_to] = len(inside) * 100
+        human_score = scores["human"]
+        ai_score = scores["ai"]
         
         return WorldObservation(
-            tick=0,  # Would need to track this
+            tick=tick,
             human_position=human_pos,
             human_velocity=human_vel,
             ai_position=ai_pos,
@@ -353,33 +501,25 @@ class AIActionPrimitives:
         
         if offset_direction == "behind":
             # Position behind object relative to AI's goal
-            ai_goal = None
-            for goal in self.goals:
-                if goal.assigned_to == "ai":
-                    ai_goal = goal
-                    break
+            ai_goal = self._assigned_goal("ai")
             
             if ai_goal:
                 dx = ai_goal.x - obj_pos[0]
                 dy = ai_goal.y - obj_pos[1]
-                dist = math.sqrt(dx*dx + dy*dy)
+                dist = math.hypot(dx, dy)
                 if dist > 0:
-                    target_x = obj_pos[0] - (dx / dist) * offset
-                    target_y = obj_pos[1] - (dy / dist) * offset
+                    scale = offset / dist
+                    target_x = obj_pos[0] - dx * scale
+                    target_y = obj_pos[1] - dy * scale
                 else:
                     target_x, target_y = obj_pos[0] - offset, obj_pos[1]
             else:
                 target_x, target_y = obj_pos[0] - offset, obj_pos[1]
-        elif offset_direction == "left":
-            target_x, target_y = obj_pos[0] - offset, obj_pos[1]
-        elif offset_direction == "right":
-            target_x, target_y = obj_pos[0] + offset, obj_pos[1]
-        elif offset_direction == "above":
-            target_x, target_y = obj_pos[0], obj_pos[1] - offset
-        elif offset_direction == "below":
-            target_x, target_y = obj_pos[0], obj_pos[1] + offset
         else:
-            target_x, target_y = obj_pos
+            # Unknown directions approach the object itself
+            ux, uy = _OFFSET_DIRECTIONS.get(offset_direction, (0.0, 0.0))
+            target_x = obj_pos[0] + ux * offset
+            target_y = obj_pos[1] + uy * offset
         
         return self.move_to(target_x, target_y)
     
@@ -403,14 +543,23 @@ class AIActionPrimitives:
                 status=ActionStatus.FAILED,
                 message=f"Object '{object_name}' not found"
             )
-        
+        return self._push_from(object_name, obj_pos, target_x, target_y)
+    
+    def _push_from(
+        self,
+        object_name: str,
+        obj_pos: Tuple[float, float],
+        target_x: float,
+        target_y: float,
+    ) -> ActionResult:
+        """Steer a push given the object's already-read position."""
         # Move towards the object (which will push it towards target)
         # The AI should position itself on the opposite side of the object from the target
         dx = target_x - obj_pos[0]
         dy = target_y - obj_pos[1]
-        dist = math.sqrt(dx*dx + dy*dy)
+        dist_sq = dx*dx + dy*dy
         
-        if dist < 10:
+        if dist_sq < _AT_TARGET_DIST_SQ:
             return ActionResult(
                 success=True,
                 status=ActionStatus.COMPLETED,
@@ -419,10 +568,12 @@ class AIActionPrimitives:
         
         # Push by moving through the object towards target
         # Target position is slightly past the object towards goal
-        push_target_x = obj_pos[0] + (dx / dist) * 20
-        push_target_y = obj_pos[1] + (dy / dist) * 20
+        scale = 20 / math.sqrt(dist_sq)
+        push_target_x = obj_pos[0] + dx * scale
+        push_target_y = obj_pos[1] + dy * scale
         
         self.physics.set_agent_target(self.agent_name, push_target_x, push_target_y)
+        self._last_pushed_obj_xy = obj_pos
         
         self._current_action = "push_towards"
         self._action_target = {
@@ -489,7 +640,7 @@ class AIActionPrimitives:
         
         self._message = f"Pushing {object_name} to {goal_name}"
         
-        return self.push_towards(object_name, goal_pos[0], goal_pos[1])
+        return self._push_from(object_name, obj_pos, goal_pos[0], goal_pos[1])
     
     # ==================== COMMUNICATION ====================
     
@@ -525,11 +676,9 @@ class AIActionPrimitives:
         
         if self._current_action == "move_to":
             target = self._action_target
-            dist = math.sqrt(
-                (ai_pos[0] - target["x"])**2 +
-                (ai_pos[1] - target["y"])**2
-            )
-            if dist < self.arrival_threshold:
+            dx = ai_pos[0] - target["x"]
+            dy = ai_pos[1] - target["y"]
+            if dx*dx + dy*dy < self.arrival_threshold * self.arrival_threshold:
                 self._current_action = None
                 return True
         
@@ -542,18 +691,23 @@ class AIActionPrimitives:
                 target_x = target.get("target_x") or target.get("goal_x", 0)
                 target_y = target.get("target_y") or target.get("goal_y", 0)
                 
-                dist = math.sqrt(
-                    (obj_pos[0] - target_x)**2 +
-                    (obj_pos[1] - target_y)**2
-                )
+                dx = obj_pos[0] - target_x
+                dy = obj_pos[1] - target_y
                 
-                if dist < 50:  # Object close to target
+                if dx*dx + dy*dy < _PUSH_DONE_DIST_SQ:  # Object close to target
                     self._current_action = None
                     self._message = "Done! ✓"
                     return True
                 
-                # Continue pushing - update target to keep pushing
-                self.push_towards(target["object"], target_x, target_y)
+                # Continue pushing - re-aim only once the object has moved,
+                # since the push target depends on nothing else
+                last = self._last_pushed_obj_xy
+                if last is not None:
+                    mx = obj_pos[0] - last[0]
+                    my = obj_pos[1] - last[1]
+                    if mx*mx + my*my < _RETARGET_DIST_SQ:
+                        return False
+                self._push_from(target["object"], obj_pos, target_x, target_y)
         
         return False
     
@@ -564,6 +718,7 @@ class AIActionPrimitives:
         
         self._current_action = None
         self._action_target = None
+        self._last_pushed_obj_xy = None
         
         return ActionResult(
             success=True,
@@ -591,21 +746,11 @@ class AIActionPrimitives:
         if not in_play:
             return None
         
-        # Score each object
-        best_obj = None
-        best_score = float('-inf')
-        
-        for obj in in_play:
-            # Higher score = better target
-            # Prefer objects far from human (less competition)
-            # Prefer objects close to AI (less travel)
-            score = obj.distance_to_human * 0.5 - obj.distance_to_ai
-            
-            if score > best_score:
-                best_score = score
-                best_obj = obj.name
-        
-        return best_obj
+        # Higher score = better target
+        # Prefer objects far from human (less competition)
+        # Prefer objects close to AI (less travel)
+        best = max(in_play, key=_push_score)
+        return best.name
     
     def execute_autonomous_step(self) -> Optional[ActionResult]:
         """
@@ -621,8 +766,7 @@ class AIActionPrimitives:
             return None  # Still executing
         
         # Find something to do
-        obs = self.observe()
-        ai_goal = obs.get_ai_goal()
+        ai_goal = self._assigned_goal("ai")
         
         if not ai_goal:
             return None
@@ -13,6 +13,7 @@ This provides much smoother and more realistic pushing behavior.
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict, Any
 from enum import Enum
+import functools
 import math
 
 try:
@@ -24,6 +25,21 @@ except ImportError:
     pymunk = None
     Vec2d = None
 
+try:
+    # Batch body readback (pymunk >= 7); falls back to per-body access
+    import pymunk.batch
+    PYMUNK_BATCH_AVAILABLE = True
+    _POSE_FIELDS = (
+        pymunk.batch.BodyFields.BODY_ID
+        | pymunk.batch.BodyFields.POSITION
+        | pymunk.batch.BodyFields.ANGLE
+    )
+except ImportError:
+    PYMUNK_BATCH_AVAILABLE = False
+
+# Below this many objects a batch call costs more than reading each body
+BATCH_READ_MIN_OBJECTS = 64
+
 
 class ShapeType(Enum):
     BOX = "box"
@@ -51,6 +67,58 @@ class PhysicsConfig:
     block_mass: float = 1.0
 
 
+@functools.lru_cache(maxsize=32)
+def _tee_geometry(mass: float, scale: float) -> Tuple[tuple, tuple, float]:
+    """Vertices of the two T-shape bars and their summed moment of inertia."""
+    length = 4  # Ratio
+    
+    # Vertices for horizontal bar (top of T)
+    vertices1 = (
+        (-length * scale / 2, scale),
+        (length * scale / 2, scale),
+        (length * scale / 2, 0),
+        (-length * scale / 2, 0)
+    )
+    
+    # Vertices for vertical bar (stem of T)
+    vertices2 = (
+        (-scale / 2, scale),
+        (-scale / 2, length * scale),
+        (scale / 2, length * scale),
+        (scale / 2, scale)
+    )
+    
+    inertia1 = pymunk.moment_for_poly(mass, vertices=vertices1)
+    inertia2 = pymunk.moment_for_poly(mass, vertices=vertices2)
+    return vertices1, vertices2, inertia1 + inertia2
+
+
+@functools.lru_cache(maxsize=32)
+def _ell_geometry(mass: float, scale: float) -> Tuple[tuple, tuple, float]:
+    """Vertices of the two L-shape bars and their summed moment of inertia."""
+    length = 3  # Ratio
+    
+    # Vertices for vertical bar (tall part of L)
+    vertices1 = (
+        (-scale / 2, -length * scale / 2),
+        (scale / 2, -length * scale / 2),
+        (scale / 2, length * scale / 2),
+        (-scale / 2, length * scale / 2)
+    )
+    
+    # Vertices for horizontal bar (bottom of L)
+    vertices2 = (
+        (scale / 2, length * scale / 2 - scale),
+        (length * scale / 2 + scale / 2, length * scale / 2 - scale),
+        (length * scale / 2 + scale / 2, length * scale / 2),
+        (scale / 2, length * scale / 2)
+    )
+    
+    inertia1 = pymunk.moment_for_poly(mass, vertices=vertices1)
+    inertia2 = pymunk.moment_for_poly(mass, vertices=vertices2)
+    return vertices1, vertices2, inertia1 + inertia2
+
+
 class PhysicsWorld:
     """
     PyMunk-based physics world matching push-T environment.
@@ -80,11 +148,19 @@ class PhysicsWorld:
         # Track bodies
         self.agents: Dict[str, pymunk.Body] = {}
         self.objects: Dict[str, pymunk.Body] = {}
-        self.agent_targets: Dict[str, Vec2d] = {}  # Target positions for PD control
+        self.agent_targets: Dict[str, List[float]] = {}  # Target positions for PD control
+        # (body, target) pairs for the PD loop; targets are shared with agent_targets
+        self._agent_pairs: List[Tuple[pymunk.Body, List[float]]] = []
         
         # Collision tracking
         self.n_contact_points = 0
         
+        # Number of completed control steps
+        self.tick = 0
+        
+        # Reused buffer for batch pose readback
+        self._batch_buf = pymunk.batch.Buffer() if PYMUNK_BATCH_AVAILABLE else None
+        
         # Add walls
         self._add_walls()
         
@@ -92,6 +168,19 @@ class PhysicsWorld:
         # We just track contacts without needing the handler for basic simulation
         # The physics works fine without explicit collision tracking
     
+    @property
+    def config(self) -> PhysicsConfig:
+        """Physics configuration."""
+        return self._config
+    
+    @config.setter
+    def config(self, config: PhysicsConfig) -> None:
+        # Cache the sub-step timing used by step(); assign a new config
+        # rather than mutating sim_hz/control_hz in place.
+        self._config = config
+        self._physics_dt = 1.0 / config.sim_hz
+        self._n_substeps = max(1, int(config.sim_hz / config.control_hz))
+    
     def _add_walls(self) -> None:
         """Add boundary walls to the physics space."""
         wall_thickness = 5
@@ -107,11 +196,13 @@ class PhysicsWorld:
              (self.width - wall_thickness, self.height - wall_thickness)),  # Bottom
         ]
         
+        shapes = []
         for start, end in walls:
             shape = pymunk.Segment(self.space.static_body, start, end, wall_thickness)
             shape.friction = self.config.friction
             shape.color = (200, 200, 200, 255)  # Light gray
-            self.space.add(shape)
+            shapes.append(shape)
+        self.space.add(*shapes)
     
     def _handle_collision(self, arbiter, space, data) -> None:
         """Track collision contact points."""
@@ -133,7 +224,10 @@ class PhysicsWorld:
         
         self.space.add(body, shape)
         self.agents[name] = body
-        self.agent_targets[name] = Vec2d(x, y)
+        self.agent_targets[name] = [x, y]
+        self._agent_pairs = [
+            (self.agents[n], target) for n, target in self.agent_targets.items()
+        ]
         
         return body
     
@@ -164,28 +258,9 @@ class PhysicsWorld:
         The T consists of two rectangles sharing a body.
         """
         mass = self.config.block_mass
-        length = 4  # Ratio
-        
-        # Vertices for horizontal bar (top of T)
-        vertices1 = [
-            (-length * scale / 2, scale),
-            (length * scale / 2, scale),
-            (length * scale / 2, 0),
-            (-length * scale / 2, 0)
-        ]
-        
-        # Vertices for vertical bar (stem of T)
-        vertices2 = [
-            (-scale / 2, scale),
-            (-scale / 2, length * scale),
-            (scale / 2, length * scale),
-            (scale / 2, scale)
-        ]
+        vertices1, vertices2, inertia = _tee_geometry(mass, scale)
         
-        inertia1 = pymunk.moment_for_poly(mass, vertices=vertices1)
-        inertia2 = pymunk.moment_for_poly(mass, vertices=vertices2)
-        
-        body = pymunk.Body(mass, inertia1 + inertia2)
+        body = pymunk.Body(mass, inertia)
         
         shape1 = pymunk.Poly(body, vertices1)
         shape2 = pymunk.Poly(body, vertices2)
@@ -217,28 +292,9 @@ class PhysicsWorld:
         The L consists of two rectangles sharing a body.
         """
         mass = self.config.block_mass
-        length = 3  # Ratio
-        
-        # Vertices for vertical bar (tall part of L)
-        vertices1 = [
-            (-scale / 2, -length * scale / 2),
-            (scale / 2, -length * scale / 2),
-            (scale / 2, length * scale / 2),
-            (-scale / 2, length * scale / 2)
-        ]
-        
-        # Vertices for horizontal bar (bottom of L)
-        vertices2 = [
-            (scale / 2, length * scale / 2 - scale),
-            (length * scale / 2 + scale / 2, length * scale / 2 - scale),
-            (length * scale / 2 + scale / 2, length * scale / 2),
-            (scale / 2, length * scale / 2)
-        ]
+        vertices1, vertices2, inertia = _ell_geometry(mass, scale)
         
-        inertia1 = pymunk.moment_for_poly(mass, vertices=vertices1)
-        inertia2 = pymunk.moment_for_poly(mass, vertices=vertices2)
-        
-        body = pymunk.Body(mass, inertia1 + inertia2)
+        body = pymunk.Body(mass, inertia)
         
         shape1 = pymunk.Poly(body, vertices1)
         shape2 = pymunk.Poly(body, vertices2)
@@ -265,7 +321,9 @@ class PhysicsWorld:
     def set_agent_target(self, name: str, target_x: float, target_y: float) -> None:
         """Set the target position for an agent (for PD control)."""
         if name in self.agent_targets:
-            self.agent_targets[name] = Vec2d(target_x, target_y)
+            target = self.agent_targets[name]
+            target[0] = target_x
+            target[1] = target_y
     
     def get_agent_position(self, name: str) -> Tuple[float, float]:
         """Get current agent position."""
@@ -281,6 +339,39 @@ class PhysicsWorld:
             return (vel.x, vel.y)
         return (0, 0)
     
+    def get_object_poses(self) -> Dict[str, Tuple[float, float, float]]:
+        """
+        Get the current (x, y, angle) of all dynamic objects, keyed by name.
+        
+        When pymunk.batch is available and there are many objects, every
+        body's pose is read in a single call instead of several property
+        accesses per body.
+        """
+        buf = self._batch_buf
+        if buf is None or len(self.objects) < BATCH_READ_MIN_OBJECTS:
+            poses = {}
+            for name, body in self.objects.items():
+                p = body.position
+                poses[name] = (p.x, p.y, body.angle)
+            return poses
+        
+        buf.clear()
+        pymunk.batch.get_space_bodies(self.space, _POSE_FIELDS, buf)
+        ids = memoryview(buf.int_buf()).cast("P")
+        values = memoryview(buf.float_buf()).cast("d").tolist()
+        rows = {body_id: 3 * i for i, body_id in enumerate(ids)}
+        
+        poses = {}
+        for name, body in self.objects.items():
+            row = rows.get(body.id)
+            if row is None:
+                # Not in the space (removed by hand)
+                p = body.position
+                poses[name] = (p.x, p.y, body.angle)
+            else:
+                poses[name] = (values[row], values[row + 1], values[row + 2])
+        return poses
+    
     def get_object_state(self, name: str) -> Dict[str, Any]:
         """Get object position, angle, and velocity."""
         if name in self.objects:
@@ -301,31 +392,49 @@ class PhysicsWorld:
         This matches the push-T environment approach:
         - Multiple physics sub-steps per control step
         - PD control for smooth agent movement
-        """
-        if dt is None:
-            dt = 1.0 / self.config.control_hz
         
-        physics_dt = 1.0 / self.config.sim_hz
-        n_steps = max(1, int(self.config.sim_hz / self.config.control_hz))
+        Args:
+            dt: Ignored; the control period is fixed by config.control_hz.
+        """
+        physics_dt = self._physics_dt
+        n_steps = self._n_substeps
         
         self.n_contact_points = 0
         
+        # Read agent state from the bodies once per control step, as plain
+        # floats. Agents are kinematic, so contacts never move them and each
+        # sub-step advances position by exactly velocity * dt; mirror that
+        # locally instead of reading the bodies back after every sub-step.
+        k_p = self.config.k_p
+        k_v = self.config.k_v
+        pairs = self._agent_pairs
+        states = [[*body.position, *body.velocity] for body, _ in pairs]
+        
         for _ in range(n_steps):
             # Apply PD control to each agent
-            for name, body in self.agents.items():
-                target = self.agent_targets.get(name, body.position)
+            for (body, target), state in zip(pairs, states):
+                px, py, vx, vy = state
                 
                 # PD control: acceleration = k_p * (target - pos) + k_v * (0 - vel)
-                acceleration = (
-                    self.config.k_p * (target - body.position) +
-                    self.config.k_v * (Vec2d(0, 0) - body.velocity)
-                )
+                ax = k_p * (target[0] - px) - k_v * vx
+                ay = k_p * (target[1] - py) - k_v * vy
                 
                 # Update velocity (integrate acceleration)
-                body.velocity += acceleration * physics_dt
+                vx += ax * physics_dt
+                vy += ay * physics_dt
+                body.velocity = (vx, vy)
+                state[2] = vx
+                state[3] = vy
             
             # Step physics
             self.space.step(physics_dt)
+            
+            # Kinematic position update, as performed by the space step
+            for state in states:
+                state[0] += state[2] * physics_dt
+                state[1] += state[3] * physics_dt
+        
+        self.tick += 1
     
     def clear_objects(self) -> None:
         """Remove all dynamic objects from the simulation."""
@@ -339,7 +448,7 @@ class PhysicsWorld:
         """Stop all agents and clear their targets."""
         for name, body in self.agents.items():
             body.velocity = (0, 0)
-            self.agent_targets[name] = body.position
+            self.agent_targets[name][:] = body.position
 
 
 def check_pymunk_available() -> bool:
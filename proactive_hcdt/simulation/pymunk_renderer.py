@@ -6,6 +6,7 @@ matching the push-T diffusion policy environment style.
 """
 
 from typing import Optional, TYPE_CHECKING, List, Tuple, Dict, Any
+import functools
 import math
 
 try:
@@ -26,16 +27,24 @@ except ImportError:
     pymunk = None
 
 
-def to_pygame(p: Tuple[float, float], surface: pygame.Surface) -> Tuple[int, int]:
+def to_pygame(p: Tuple[float, float], _round=round) -> Tuple[int, int]:
     """Convert pymunk coordinates to pygame surface coordinates."""
-    return (round(p[0]), round(p[1]))
+    # Simulation and screen share an origin and scale, so this only rounds;
+    # _round is bound as a default to keep the per-vertex lookup local.
+    return (_round(p[0]), _round(p[1]))
+
+
+@functools.lru_cache(maxsize=64)
+def _light_color(r: float, g: float, b: float, a: float) -> "SpaceDebugColor":
+    return SpaceDebugColor(
+        r=min(1.2 * r, 255.0), g=min(1.2 * g, 255.0), b=min(1.2 * b, 255.0), a=min(1.2 * a, 255.0)
+    )
 
 
 def light_color(color: "SpaceDebugColor") -> "SpaceDebugColor":
     """Create a lighter version of a color for highlights."""
-    import numpy as np
-    c = np.minimum(1.2 * np.float32([color.r, color.g, color.b, color.a]), np.float32([255]))
-    return SpaceDebugColor(r=c[0], g=c[1], b=c[2], a=c[3])
+    # Shape colors are static, so each distinct color is only computed once
+    return _light_color(color.r, color.g, color.b, color.a)
 
 
 class PymunkDrawOptions(pymunk.SpaceDebugDrawOptions):
@@ -57,7 +66,7 @@ class PymunkDrawOptions(pymunk.SpaceDebugDrawOptions):
         outline_color: "SpaceDebugColor",
         fill_color: "SpaceDebugColor",
     ) -> None:
-        p = to_pygame(pos, self.surface)
+        p = to_pygame(pos)
         
         # Fill
         pygame.draw.circle(self.surface, fill_color.as_int(), p, round(radius), 0)
@@ -67,13 +76,13 @@ class PymunkDrawOptions(pymunk.SpaceDebugDrawOptions):
         
         # Direction indicator
         circle_edge = pos + Vec2d(radius, 0).rotated(angle)
-        p2 = to_pygame(circle_edge, self.surface)
+        p2 = to_pygame(circle_edge)
         line_r = 2 if radius > 20 else 1
         pygame.draw.line(self.surface, outline_color.as_int(), p, p2, line_r)
     
     def draw_segment(self, a: "Vec2d", b: "Vec2d", color: "SpaceDebugColor") -> None:
-        p1 = to_pygame(a, self.surface)
-        p2 = to_pygame(b, self.surface)
+        p1 = to_pygame(a)
+        p2 = to_pygame(b)
         pygame.draw.aalines(self.surface, color.as_int(), False, [p1, p2])
     
     def draw_fat_segment(
@@ -84,8 +93,8 @@ class PymunkDrawOptions(pymunk.SpaceDebugDrawOptions):
         outline_color: "SpaceDebugColor",
         fill_color: "SpaceDebugColor",
     ) -> None:
-        p1 = to_pygame(a, self.surface)
-        p2 = to_pygame(b, self.surface)
+        p1 = to_pygame(a)
+        p2 = to_pygame(b)
         
         r = round(max(1, radius * 2))
         pygame.draw.lines(self.surface, fill_color.as_int(), False, [p1, p2], r)
@@ -114,24 +123,19 @@ class PymunkDrawOptions(pymunk.SpaceDebugDrawOptions):
         outline_color: "SpaceDebugColor",
         fill_color: "SpaceDebugColor",
     ) -> None:
-        ps = [to_pygame(v, self.surface) for v in verts]
-        ps_closed = ps + [ps[0]]
+        ps = [to_pygame(v) for v in verts]
         
         # Draw filled polygon with highlight
         pygame.draw.polygon(self.surface, light_color(fill_color).as_int(), ps)
         
-        # Draw edges with rounded corners
+        # Draw the edges as one closed outline
         edge_radius = 2
-        if edge_radius > 0:
-            for i in range(len(verts)):
-                a = verts[i]
-                b = verts[(i + 1) % len(verts)]
-                self.draw_fat_segment(a, b, edge_radius, fill_color, fill_color)
+        pygame.draw.polygon(self.surface, fill_color.as_int(), ps, 2 * edge_radius)
     
     def draw_dot(
         self, size: float, pos: Tuple[float, float], color: "SpaceDebugColor"
     ) -> None:
-        p = to_pygame(pos, self.surface)
+        p = to_pygame(pos)
         pygame.draw.circle(self.surface, color.as_int(), p, round(size), 0)
 
 
@@ -169,6 +173,16 @@ class PymunkRenderer:
     Renderer that uses PyMunk's debug drawing for accurate physics visualization.
     """
     
+    INSTRUCTIONS = (
+        "WASD/Arrows: Move Human (blue)",
+        "AI (green) assists automatically",
+        "Push shapes to goal zones!",
+        "R: Reset | ESC: Quit",
+    )
+    
+    # Text cache is cleared once it holds this many surfaces
+    MAX_CACHED_TEXTS = 256
+    
     def __init__(self, width: int, height: int, title: str = "Simulation"):
         if not PYGAME_AVAILABLE:
             raise ImportError("Pygame is required. Install with: pip install pygame")
@@ -186,9 +200,26 @@ class PymunkRenderer:
         self.small_font: Optional[pygame.font.Font] = None
         self.tiny_font: Optional[pygame.font.Font] = None
         
+        # Rendered text surfaces, keyed by (text, font, color)
+        self._text_cache: Dict[Tuple[str, Any, Tuple[int, int, int]], pygame.Surface] = {}
+        self._instruction_surfaces: List[pygame.Surface] = []
+        
         self._initialized = False
         self.fps = 60
         self.background_color = (245, 245, 245)
+        
+        # Keyboard state returned by process_events, reused every frame
+        self._keys_state: Dict[str, bool] = dict.fromkeys(
+            ('w', 's', 'a', 'd', 'up', 'down', 'left', 'right',
+             'space', 'escape', 'r', 'quit'),
+            False,
+        )
+        self._key_bindings: Tuple[Tuple[str, int], ...] = (
+            ('w', pygame.K_w), ('s', pygame.K_s), ('a', pygame.K_a), ('d', pygame.K_d),
+            ('up', pygame.K_UP), ('down', pygame.K_DOWN),
+            ('left', pygame.K_LEFT), ('right', pygame.K_RIGHT),
+            ('space', pygame.K_SPACE),
+        )
     
     def initialize(self) -> None:
         """Initialize pygame and create the window."""
@@ -205,6 +236,12 @@ class PymunkRenderer:
         self.small_font = pygame.font.SysFont("Arial", 16)
         self.tiny_font = pygame.font.SysFont("Arial", 12)
         
+        self._text_cache.clear()
+        self._instruction_surfaces = [
+            self.tiny_font.render(instruction, True, (120, 120, 120))
+            for instruction in self.INSTRUCTIONS
+        ]
+        
         self._initialized = True
     
     def cleanup(self) -> None:
@@ -214,12 +251,15 @@ class PymunkRenderer:
             self._initialized = False
     
     def process_events(self) -> Dict[str, bool]:
-        """Process pygame events and return keyboard state."""
-        keys_pressed = {
-            'w': False, 's': False, 'a': False, 'd': False,
-            'up': False, 'down': False, 'left': False, 'right': False,
-            'space': False, 'escape': False, 'r': False, 'quit': False,
-        }
+        """
+        Process pygame events and return keyboard state.
+        
+        The same dict is updated and returned on every call; callers must
+        not modify it or keep it across frames.
+        """
+        keys_pressed = self._keys_state
+        for key in keys_pressed:
+            keys_pressed[key] = False
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -235,15 +275,8 @@ class PymunkRenderer:
         
         # Continuous key state
         pressed = pygame.key.get_pressed()
-        keys_pressed['w'] = pressed[pygame.K_w]
-        keys_pressed['s'] = pressed[pygame.K_s]
-        keys_pressed['a'] = pressed[pygame.K_a]
-        keys_pressed['d'] = pressed[pygame.K_d]
-        keys_pressed['up'] = pressed[pygame.K_UP]
-        keys_pressed['down'] = pressed[pygame.K_DOWN]
-        keys_pressed['left'] = pressed[pygame.K_LEFT]
-        keys_pressed['right'] = pressed[pygame.K_RIGHT]
-        keys_pressed['space'] = pressed[pygame.K_SPACE]
+        for key, code in self._key_bindings:
+            keys_pressed[key] = pressed[code]
         
         return keys_pressed
     
@@ -327,32 +360,37 @@ class PymunkRenderer:
         label_rect = label.get_rect(center=(int(goal.x), int(goal.y - goal.height/2 - 15)))
         self.screen.blit(label, label_rect)
     
+    def _render_cached(
+        self, text: str, font: "pygame.font.Font", color: Tuple[int, int, int]
+    ) -> "pygame.Surface":
+        """Render text, reusing the surface from an earlier identical call."""
+        key = (text, font, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= self.MAX_CACHED_TEXTS:
+                self._text_cache.clear()
+            surface = self._text_cache[key] = font.render(text, True, color)
+        return surface
+    
     def _draw_ui(self, human_score: int, ai_score: int, tick: int) -> None:
         """Draw UI overlay."""
         # Human score (blue, left)
-        human_text = self.font.render(f"Human: {human_score}", True, (65, 105, 225))
+        human_text = self._render_cached(f"Human: {human_score}", self.font, (65, 105, 225))
         self.screen.blit(human_text, (10, 10))
         
         # AI score (green, right)
-        ai_text = self.font.render(f"AI: {ai_score}", True, (50, 205, 50))
+        ai_text = self._render_cached(f"AI: {ai_score}", self.font, (50, 205, 50))
         ai_rect = ai_text.get_rect(topright=(self.width - 10, 10))
         self.screen.blit(ai_text, ai_rect)
         
-        # Tick counter
+        # Tick counter (changes every frame, so not cached)
         tick_text = self.small_font.render(f"Tick: {tick}", True, (100, 100, 100))
         tick_rect = tick_text.get_rect(midtop=(self.width // 2, 10))
         self.screen.blit(tick_text, tick_rect)
         
-        # Instructions
-        instructions = [
-            "WASD/Arrows: Move Human (blue)",
-            "AI (green) assists automatically",
-            "Push shapes to goal zones!",
-            "R: Reset | ESC: Quit",
-        ]
-        y = self.height - 18 * len(instructions) - 10
-        for instruction in instructions:
-            text = self.tiny_font.render(instruction, True, (120, 120, 120))
+        # Instructions (rendered once in initialize)
+        y = self.height - 18 * len(self._instruction_surfaces) - 10
+        for text in self._instruction_surfaces:
             self.screen.blit(text, (10, y))
             y += 18
     
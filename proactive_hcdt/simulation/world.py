@@ -191,20 +191,25 @@ class World:
         """Update world simulation by one step."""
         self._tick += 1
         
+        # Resolve the bounds once per tick rather than per entity
+        width = self.config.width
+        height = self.config.height
+        agents = (self.human_agent, self.ai_agent)
+        
         # Update agents
-        self.human_agent.update(dt, self.width, self.height)
-        self.ai_agent.update(dt, self.width, self.height)
+        for agent in agents:
+            agent.update(dt, width, height)
         
         # Handle agent-object collisions with compliant pushing
-        self._handle_agent_object_collisions(self.human_agent)
-        self._handle_agent_object_collisions(self.ai_agent)
+        for agent in agents:
+            self._handle_agent_object_collisions(agent)
         
         # Handle object-object collisions
         self._handle_object_object_collisions()
         
         # Update objects
         for obj in self.objects:
-            obj.update(dt, self.width, self.height)
+            obj.update(dt, width, height)
         
         # Check goals and update scores
         self._check_goals()
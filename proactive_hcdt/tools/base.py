@@ -42,7 +42,17 @@ Example:
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
+
+# JSON Schema type name -> accepted Python type(s)
+_TYPE_MAPPING: dict[str, type | tuple[type, ...]] = {
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
 
 
 class ToolParameterType(str, Enum):
@@ -236,20 +246,58 @@ class BaseTool(ABC):
 
         return True, None
 
+    def compile_validator(self) -> Callable[..., tuple[bool, str | None]]:
+        """
+        Build an argument validator with the parameter definitions resolved once.
+
+        The returned callable behaves like validate_arguments(). Tools that
+        override the validation methods get their own validate_arguments back.
+
+        Returns:
+            Callable taking the tool arguments as keyword arguments and
+            returning a tuple of (is_valid, error_message).
+        """
+        cls = type(self)
+        if (
+            cls.validate_arguments is not BaseTool.validate_arguments
+            or cls._validate_type is not BaseTool._validate_type
+        ):
+            return self.validate_arguments
+
+        checks = []
+        for param in self.parameters:
+            type_str = param.type.value if isinstance(param.type, ToolParameterType) else param.type
+            checks.append((
+                param.name,
+                f"Missing required parameter: {param.name}" if param.required else None,
+                _TYPE_MAPPING.get(type_str),
+                f"Invalid type for parameter {param.name}: expected {param.type}",
+                param.enum,
+                f"Invalid value for parameter {param.name}: must be one of {param.enum}",
+            ))
+
+        def validate(**kwargs: Any) -> tuple[bool, str | None]:
+            for name, missing_error, python_type, type_error, enum, enum_error in checks:
+                if name not in kwargs:
+                    if missing_error is not None:
+                        return False, missing_error
+                    continue
+
+                value = kwargs[name]
+                if python_type is not None and not isinstance(value, python_type):
+                    return False, type_error
+                if enum and value not in enum:
+                    return False, enum_error
+
+            return True, None
+
+        return validate
+
     def _validate_type(self, value: Any, expected_type: ToolParameterType | str) -> bool:
         """Validate that a value matches the expected type."""
         type_str = expected_type.value if isinstance(expected_type, ToolParameterType) else expected_type
 
-        type_mapping = {
-            "string": str,
-            "number": (int, float),
-            "integer": int,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
-
-        expected_python_type = type_mapping.get(type_str)
+        expected_python_type = _TYPE_MAPPING.get(type_str)
         if expected_python_type is None:
             return True  # Unknown types pass validation
 
@@ -159,6 +159,121 @@ class AIController:
             print(self.last_observation.to_text())
 
 
+def make_primitives():
+    """Create a seeded game world and the AI primitives driving it."""
+    random.seed(0)
+    physics = PhysicsWorld(800, 600)
+    physics.add_agent("human", 160, 300)
+    physics.add_agent("ai", 640, 300)
+    goals = []
+    setup_game(physics, goals)
+    return physics, goals, AIActionPrimitives(physics, goals, "ai")
+
+
+class TestObservationCache:
+    """Tests for observe() caching."""
+
+    def test_unchanged_world_reuses_observation(self):
+        """Test that observing an unchanged world returns the cached result."""
+        physics, goals, ai = make_primitives()
+        first = ai.observe()
+
+        assert ai.observe() is first
+
+        physics.step()
+        assert ai.observe() is not first
+
+    def test_agent_teleport_within_tick(self):
+        """Test that moving an agent by hand is observed before the next step."""
+        physics, goals, ai = make_primitives()
+        ai.observe()
+
+        physics.agents["ai"].position = (400, 300)
+
+        assert ai.observe().ai_position == (400.0, 300.0)
+
+    def test_object_moved_within_tick(self):
+        """Test that moving an object by hand is observed before the next step."""
+        physics, goals, ai = make_primitives()
+        ai.observe()
+
+        physics.objects["Box-1"].position = (700, 300)
+
+        obs = ai.observe()
+        assert obs.get_object_by_name("Box-1").x == 700.0
+        assert obs.get_object_by_name("Box-1").in_goal == "Green Zone"
+
+    def test_goal_changes_within_tick(self):
+        """Test that added or moved goals are observed before the next step."""
+        physics, goals, ai = make_primitives()
+        assert len(ai.observe().goals) == 2
+
+        goals.append(GoalZone(name="Extra Zone", x=400, y=100, assigned_to=""))
+        assert len(ai.observe().goals) == 3
+
+        goals[0].x = 150
+        assert ai.observe().goals[0].x == 150
+
+
+class TestGoalAssignment:
+    """Tests for resolving the AI's goal."""
+
+    def test_reassigned_goals_are_used(self):
+        """Test that reassigning goals mid-game redirects autonomous pushing."""
+        physics, goals, ai = make_primitives()
+        ai.execute_autonomous_step()
+        assert ai._action_target["target_x"] == 700  # Green Zone
+
+        ai.stop()
+        goals[0].assigned_to = "ai"
+        goals[1].assigned_to = "human"
+        ai.execute_autonomous_step()
+
+        assert ai._action_target["target_x"] == 100  # Blue Zone
+
+    def test_replaced_goals_are_used(self):
+        """Test that goals replaced in the shared list are picked up."""
+        physics, goals, ai = make_primitives()
+        goals.clear()
+        goals.append(GoalZone(name="New Zone", x=400, y=100, assigned_to="ai"))
+
+        ai.execute_autonomous_step()
+
+        assert ai._action_target["target_x"] == 400  # New Zone
+
+
+class TestPushRetarget:
+    """Tests for re-aiming an active push."""
+
+    def test_retarget_only_after_object_moves(self):
+        """Test that a push is re-aimed only once the object has moved."""
+        physics, goals, ai = make_primitives()
+        box = physics.objects["Box-1"]
+        box.position = (400, 300)
+        ai.push_towards("Box-1", 400, 100)
+        aim = list(physics.agent_targets["ai"])
+
+        box.position = (401, 300)
+        assert not ai.is_action_complete()
+        assert physics.agent_targets["ai"] == aim
+
+        box.position = (450, 300)
+        assert not ai.is_action_complete()
+        assert physics.agent_targets["ai"] != aim
+        assert ai._last_pushed_obj_xy == (450.0, 300.0)
+
+    def test_push_completes_near_target(self):
+        """Test that a push finishes once the object is close to its target."""
+        physics, goals, ai = make_primitives()
+        physics.objects["Box-1"].position = (400, 300)
+        ai.push_towards("Box-1", 400, 100)
+
+        physics.objects["Box-1"].position = (400, 120)
+
+        assert ai.is_action_complete()
+        assert ai._current_action is None
+
+
 def main():
     print("=" * 60)
     print("Phase 2: AI Action Primitives Demo")
@@ -1,9 +1,22 @@
 """Tests for AI providers."""
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 
-from proactive_hcdt.ai_providers import AIMessage, AIResponse, DummyAIProvider
-from proactive_hcdt.ai_providers.base import MessageRole
+from proactive_hcdt.ai_providers import (
+    AIMessage,
+    AIResponse,
+    ConversationBuffer,
+    DummyAIProvider,
+)
+from proactive_hcdt.ai_providers.base import (
+    MessageRole,
+    collect_stream,
+    extract_system_prompt,
+)
+from proactive_hcdt.ai_providers.cache import ExactResponseCache
 
 
 class TestDummyAIProvider:
@@ -66,6 +79,22 @@ class TestDummyAIProvider:
         assert len(response.tool_calls) == 1
         assert response.tool_calls[0].name == "move_robot"
 
+    def test_generate_sync(self, provider):
+        """Test the synchronous generation path."""
+        provider.set_response("greet", "Hello, human!")
+
+        response = provider.generate_sync(
+            [AIMessage(role=MessageRole.USER, content="Please greet me")]
+        )
+
+        assert response.content == "Hello, human!"
+
+    def test_tool_call_ids_sequential(self, provider):
+        """Test that tool call ids are unique and deterministic."""
+        ids = [provider._next_call_id() for _ in range(3)]
+
+        assert ids == ["call_00000000", "call_00000001", "call_00000002"]
+
     def test_format_tools(self, provider):
         """Test tool formatting (pass-through for dummy)."""
         tools = [{"name": "test_tool", "description": "A test tool"}]
@@ -86,6 +115,30 @@ class TestDummyAIProvider:
         assert provider._call_count == 0
         assert len(provider.responses) == 0
 
+    def test_responses_dict_edits(self, provider):
+        """Test that editing the responses dict directly affects matching."""
+        greet = [AIMessage(role=MessageRole.USER, content="Please GREET me")]
+
+        provider.responses["Greet"] = "Hello!"
+        assert provider.generate_sync(greet).content == "Hello!"
+
+        provider.responses["Greet"] = "Hi!"
+        assert provider.generate_sync(greet).content == "Hi!"
+
+        provider.responses.clear()
+        assert provider.generate_sync(greet).content != "Hi!"
+
+    def test_responses_shared_with_caller(self):
+        """Test that the dict passed to the constructor is used, not a copy."""
+        responses = {"greet": "Hello!"}
+        provider = DummyAIProvider(responses=responses)
+        responses["bye"] = "Goodbye!"
+
+        response = provider.generate_sync([AIMessage(role=MessageRole.USER, content="bye")])
+
+        assert provider.responses is responses
+        assert response.content == "Goodbye!"
+
 
 class TestAIMessage:
     """Tests for AIMessage."""
@@ -114,6 +167,27 @@ class TestAIMessage:
         assert result["content"] == "Hi"
         assert "tool_call_id" not in result
 
+    def test_shared_dict_is_memoized(self):
+        """Test that the request form is built once and refreshed on change."""
+        msg = AIMessage(role=MessageRole.USER, content="Hello")
+
+        first = msg._shared_dict()
+        assert msg._shared_dict() is first
+
+        msg.content = "Goodbye"
+        assert msg._shared_dict()["content"] == "Goodbye"
+
+    def test_to_dict_returns_copies(self):
+        """Test that editing a to_dict() result does not change the message."""
+        msg = AIMessage(role=MessageRole.USER, content="Hello")
+
+        result = msg.to_dict()
+        result["content"] = "Edited"
+
+        assert msg.to_dict() is not result
+        assert msg.to_dict()["content"] == "Hello"
+        assert msg._shared_dict()["content"] == "Hello"
+
 
 class TestAIResponse:
     """Tests for AIResponse."""
@@ -134,3 +208,777 @@ class TestAIResponse:
         response = AIResponse(content="Hello")
 
         assert response.has_tool_calls is False
+
+
+def _bag_of_words(text: str) -> list[float]:
+    """Tiny deterministic embedding for cache tests."""
+    vec = [0.0] * 32
+    for word in text.lower().split():
+        vec[sum(map(ord, word)) % 32] += 1.0
+    return vec
+
+
+class TestCachingProvider:
+    """Tests for the semantic CachingProvider."""
+
+    @pytest.fixture
+    def inner(self):
+        """Create the wrapped DummyAIProvider."""
+        return DummyAIProvider()
+
+    @pytest.fixture
+    def provider(self, inner):
+        """Create a CachingProvider around the dummy provider."""
+        pytest.importorskip("numpy")
+        from proactive_hcdt.ai_providers.cache import CachingProvider, SemanticCache
+
+        return CachingProvider(inner, cache=SemanticCache(embed_fn=_bag_of_words))
+
+    @pytest.mark.asyncio
+    async def test_duplicate_request_is_cached(self, provider, inner):
+        """Test that an identical user turn is served from the cache."""
+        messages = [AIMessage(role=MessageRole.USER, content="Hello there robot")]
+
+        first = await provider.generate(messages, temperature=0.0)
+        second = await provider.generate(messages, temperature=0.0)
+
+        assert second is first
+        assert inner._call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_different_request_misses(self, provider, inner):
+        """Test that an unrelated user turn reaches the wrapped provider."""
+        await provider.generate(
+            [AIMessage(role=MessageRole.USER, content="Hello there robot")], temperature=0.0
+        )
+        await provider.generate(
+            [AIMessage(role=MessageRole.USER, content="What time is it")], temperature=0.0
+        )
+
+        assert inner._call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_high_temperature_bypasses_cache(self, provider, inner):
+        """Test that sampling temperatures above the limit are never cached."""
+        messages = [AIMessage(role=MessageRole.USER, content="Hello there robot")]
+
+        await provider.generate(messages, temperature=0.7)
+        await provider.generate(messages, temperature=0.7)
+
+        assert inner._call_count == 2
+        assert len(provider.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_tool_messages_bypass_cache(self, provider, inner):
+        """Test that conversations with tool results are never cached."""
+        messages = [
+            AIMessage(role=MessageRole.USER, content="Move forward"),
+            AIMessage(role=MessageRole.TOOL, content="ok", tool_call_id="call_1"),
+        ]
+
+        await provider.generate(messages, temperature=0.0)
+        await provider.generate(messages, temperature=0.0)
+
+        assert inner._call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_max_tokens_scopes_cache(self, provider, inner):
+        """Test that a reply generated under a token limit is not reused without it."""
+        messages = [AIMessage(role=MessageRole.USER, content="Hello there robot")]
+
+        await provider.generate(messages, temperature=0.0, max_tokens=16)
+        await provider.generate(messages, temperature=0.0)
+
+        assert inner._call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_truncated_reply_not_cached(self, provider, inner):
+        """Test that replies cut off by max_tokens are not stored."""
+        truncated = AIResponse(content="Hello th", finish_reason="length")
+
+        async def generate(messages, **kwargs):
+            inner._call_count += 1
+            return truncated
+
+        inner.generate = generate
+        messages = [AIMessage(role=MessageRole.USER, content="Hello there robot")]
+
+        await provider.generate(messages, temperature=0.0, max_tokens=2)
+        await provider.generate(messages, temperature=0.0, max_tokens=2)
+
+        assert inner._call_count == 2
+        assert len(provider.cache) == 0
+
+    def test_provider_name(self, provider):
+        """Test that the wrapper reports the wrapped provider's name."""
+        assert provider.provider_name == "dummy"
+
+
+class FakeOpenAICompletions:
+    """Stand-in for ``AsyncOpenAI().chat.completions`` that counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **params):
+        self.calls += 1
+        message = SimpleNamespace(content="Hello!", tool_calls=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+
+class TestExactResponseCache:
+    """Tests for the exact-match ExactResponseCache."""
+
+    def _key(self, cache, content, temperature=0.0):
+        messages = [AIMessage(role=MessageRole.USER, content=content)]
+        return cache.make_key("model", messages, None, temperature, None)
+
+    def test_hit_after_put(self):
+        """Test that an identical request is served from the cache."""
+        cache = ExactResponseCache()
+        response = AIResponse(content="Hi", finish_reason="stop")
+
+        cache.put(self._key(cache, "Hello"), response)
+
+        assert cache.get(self._key(cache, "Hello")) == response
+        assert cache.get(self._key(cache, "Goodbye")) is None
+
+    def test_hits_are_copies(self):
+        """Test that editing a cached response does not change later hits."""
+        from proactive_hcdt.ai_providers.base import ToolCall
+
+        cache = ExactResponseCache()
+        key = self._key(cache, "Move left")
+        response = AIResponse(
+            content="Moving",
+            tool_calls=[ToolCall(id="call_1", name="move_robot", arguments={"direction": "left"})],
+            finish_reason="tool_calls",
+        )
+        cache.put(key, response)
+        response.tool_calls[0].arguments["direction"] = "up"
+
+        hit = cache.get(key)
+        hit.content = "Edited"
+        hit.tool_calls[0].arguments["direction"] = "right"
+        hit.tool_calls.append(ToolCall(id="call_2", name="stop", arguments={}))
+
+        again = cache.get(key)
+        assert again is not hit
+        assert again.content == "Moving"
+        assert len(again.tool_calls) == 1
+        assert again.tool_calls[0].arguments == {"direction": "left"}
+
+    def test_nonzero_temperature_not_cacheable(self):
+        """Test that sampled requests produce no key."""
+        cache = ExactResponseCache()
+
+        assert self._key(cache, "Hello", temperature=0.7) is None
+
+    def test_errors_not_cached(self):
+        """Test that error responses are not stored."""
+        cache = ExactResponseCache()
+
+        cache.put(self._key(cache, "Hello"), AIResponse(content="", finish_reason="error"))
+
+        assert len(cache) == 0
+
+    def test_key_ignores_dict_order(self):
+        """Test that tool definitions differing only in key order share a key."""
+        cache = ExactResponseCache()
+        messages = [AIMessage(role=MessageRole.USER, content="Hello")]
+
+        first = cache.make_key("model", messages, [{"name": "a", "description": "b"}], 0.0, None)
+        second = cache.make_key("model", messages, [{"description": "b", "name": "a"}], 0.0, None)
+
+        assert first == second
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ExactResponseCache(maxsize=2)
+        a, b, c = (self._key(cache, text) for text in ("a", "b", "c"))
+
+        cache.put(a, AIResponse(content="a"))
+        cache.put(b, AIResponse(content="b"))
+        cache.get(a)
+        cache.put(c, AIResponse(content="c"))
+
+        assert cache.get(a) is not None
+        assert cache.get(b) is None
+        assert cache.get(c) is not None
+
+    @pytest.mark.asyncio
+    async def test_provider_skips_client_on_hit(self):
+        """Test that a deterministic repeat request does not reach the client."""
+        from proactive_hcdt.ai_providers.openai_provider import OpenAIProvider
+
+        provider = OpenAIProvider(api_key="test")
+        completions = FakeOpenAICompletions()
+        provider._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        messages = [AIMessage(role=MessageRole.USER, content="Hello")]
+
+        first = await provider.generate(messages, temperature=0.0)
+        second = await provider.generate(messages, temperature=0.0)
+
+        assert second == first
+        assert second is not first
+        assert completions.calls == 1
+
+
+class TestSharedHttpClient:
+    """Tests for the shared provider HTTP connection pool."""
+
+    @pytest.mark.asyncio
+    async def test_same_client_per_vendor(self):
+        """Test that one pooled client is reused per vendor."""
+        pytest.importorskip("httpx")
+        from proactive_hcdt.ai_providers._http import (
+            aclose_shared_http_clients,
+            get_shared_http_client,
+        )
+
+        try:
+            assert get_shared_http_client("openai") is get_shared_http_client("openai")
+            assert get_shared_http_client("openai") is not get_shared_http_client("anthropic")
+        finally:
+            await aclose_shared_http_clients()
+
+    def test_client_per_event_loop(self):
+        """Test that each event loop gets its own pooled client."""
+        pytest.importorskip("httpx")
+        import asyncio
+
+        from proactive_hcdt.ai_providers._http import (
+            aclose_shared_http_clients,
+            get_shared_http_client,
+        )
+
+        async def get_and_close():
+            client = get_shared_http_client("openai")
+            assert get_shared_http_client("openai") is client
+            await aclose_shared_http_clients()
+            return client
+
+        first = asyncio.run(get_and_close())
+        second = asyncio.run(get_and_close())
+
+        assert first is not second
+        assert first.is_closed and second.is_closed
+
+    def test_provider_rebuilds_client_per_event_loop(self, monkeypatch):
+        """Test that a provider's SDK client follows the running event loop."""
+        pytest.importorskip("httpx")
+        import asyncio
+        import sys
+        from types import SimpleNamespace
+
+        from proactive_hcdt.ai_providers._http import aclose_shared_http_clients
+        from proactive_hcdt.ai_providers.openai_provider import OpenAIProvider
+
+        class FakeAsyncOpenAI:
+            def __init__(self, http_client=None, **kwargs):
+                self.http_client = http_client
+
+        monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(AsyncOpenAI=FakeAsyncOpenAI))
+        provider = OpenAIProvider(api_key="test")
+
+        async def ensure_client():
+            provider._ensure_client()
+            client = provider._client
+            provider._ensure_client()
+            assert provider._client is client
+            await aclose_shared_http_clients()
+            return client
+
+        first = asyncio.run(ensure_client())
+        second = asyncio.run(ensure_client())
+
+        assert first is not second
+        assert first.http_client is not second.http_client
+
+
+class TestConcurrencyLimit:
+    """Tests for the per-provider concurrency cap."""
+
+    def test_default_from_provider(self, monkeypatch):
+        """Test that each vendor uses its own default limit."""
+        from proactive_hcdt.ai_providers.anthropic_provider import AnthropicProvider
+        from proactive_hcdt.ai_providers.openai_provider import OpenAIProvider
+
+        monkeypatch.delenv("PHCDT_MAX_CONCURRENCY", raising=False)
+
+        assert DummyAIProvider().max_concurrency == 32
+        assert AnthropicProvider().max_concurrency == 50
+        assert OpenAIProvider().max_concurrency == 2000
+
+    def test_env_override(self, monkeypatch):
+        """Test that PHCDT_MAX_CONCURRENCY overrides the default."""
+        from proactive_hcdt.ai_providers.openai_provider import OpenAIProvider
+
+        monkeypatch.setenv("PHCDT_MAX_CONCURRENCY", "4")
+
+        assert OpenAIProvider().max_concurrency == 4
+
+    def test_explicit_limit(self, monkeypatch):
+        """Test that an explicit limit wins over the environment."""
+        from proactive_hcdt.ai_providers.openai_provider import OpenAIProvider
+
+        monkeypatch.setenv("PHCDT_MAX_CONCURRENCY", "4")
+
+        assert OpenAIProvider(max_concurrency=8).max_concurrency == 8
+
+
+class TestBatchGeneration:
+    """Tests for batched generation."""
+
+    @pytest.mark.asyncio
+    async def test_default_abatch_preserves_order(self):
+        """Test that the gather fallback returns one response per conversation."""
+        provider = DummyAIProvider()
+        provider.set_response("first", "one")
+        provider.set_response("second", "two")
+
+        responses = await provider.abatch([
+            [AIMessage(role=MessageRole.USER, content="first")],
+            [AIMessage(role=MessageRole.USER, content="second")],
+        ])
+
+        assert [r.content for r in responses] == ["one", "two"]
+
+    @pytest.mark.asyncio
+    async def test_anthropic_abatch(self):
+        """Test that Anthropic batches map results back to input order."""
+        from proactive_hcdt.ai_providers.anthropic_provider import AnthropicProvider
+
+        def message(text):
+            return SimpleNamespace(
+                content=[SimpleNamespace(type="text", text=text)], stop_reason="end_turn"
+            )
+
+        class FakeBatches:
+            async def create(self, requests):
+                self.requests = requests
+                return SimpleNamespace(id="batch_1", processing_status="in_progress")
+
+            async def retrieve(self, batch_id):
+                return SimpleNamespace(id=batch_id, processing_status="ended")
+
+            async def results(self, batch_id):
+                async def entries():
+                    # Results may arrive out of order
+                    yield SimpleNamespace(
+                        custom_id="1",
+                        result=SimpleNamespace(type="succeeded", message=message("b")),
+                    )
+                    yield SimpleNamespace(custom_id="0", result=SimpleNamespace(type="errored"))
+
+                return entries()
+
+        provider = AnthropicProvider(api_key="test")
+        batches = FakeBatches()
+        provider._client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+
+        responses = await provider.abatch([
+            [AIMessage(role=MessageRole.USER, content="a")],
+            [AIMessage(role=MessageRole.USER, content="b")],
+        ])
+
+        assert len(batches.requests) == 2
+        assert responses[0].finish_reason == "error"
+        assert responses[1].content == "b"
+
+
+class TestToolFormatCache:
+    """Tests for memoized provider tool formatting."""
+
+    TOOLS = [{"name": "move_robot", "description": "Move", "parameters": {"type": "object"}}]
+
+    def test_equal_tool_lists_reuse_result(self):
+        """Test that structurally identical tool lists are formatted once."""
+        from proactive_hcdt.ai_providers.openai_provider import OpenAIProvider
+
+        provider = OpenAIProvider()
+        first = provider._format_tools_cached(self.TOOLS)
+        second = provider._format_tools_cached([dict(t) for t in self.TOOLS])
+
+        assert second is first
+        assert first == provider.format_tools(self.TOOLS)
+
+    def test_changed_tools_are_reformatted(self):
+        """Test that a modified tool list is not served from the cache."""
+        from proactive_hcdt.ai_providers.anthropic_provider import AnthropicProvider
+
+        provider = AnthropicProvider()
+        first = provider._format_tools_cached(self.TOOLS)
+        changed = [{**self.TOOLS[0], "description": "Move quickly"}]
+
+        second = provider._format_tools_cached(changed)
+
+        assert second is not first
+        assert second[0]["description"] == "Move quickly"
+
+
+class TestConversationBuffer:
+    """Tests for incremental message conversion via ConversationBuffer."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create an AnthropicProvider (no client needed for conversion)."""
+        from proactive_hcdt.ai_providers.anthropic_provider import AnthropicProvider
+
+        return AnthropicProvider()
+
+    def test_converts_only_new_messages(self, provider):
+        """Test that previously converted messages are reused on append."""
+        buffer = ConversationBuffer([
+            AIMessage(role=MessageRole.SYSTEM, content="Be helpful"),
+            AIMessage(role=MessageRole.USER, content="Hi"),
+        ])
+
+        system, first = provider._convert_messages(buffer)
+        buffer.append(AIMessage(role=MessageRole.ASSISTANT, content="Hello"))
+        _, second = provider._convert_messages(buffer)
+
+        assert system == "Be helpful"
+        assert second[0] is first[0]
+        assert second[1] == {"role": "assistant", "content": "Hello"}
+
+    def test_matches_plain_list_conversion(self, provider):
+        """Test that buffered and plain-list conversions agree."""
+        messages = [
+            AIMessage(role=MessageRole.SYSTEM, content="Be helpful"),
+            AIMessage(role=MessageRole.USER, content="Move"),
+            AIMessage(role=MessageRole.TOOL, content="ok", tool_call_id="call_1"),
+        ]
+
+        assert provider._convert_messages(ConversationBuffer(messages)) == (
+            provider._convert_messages(messages)
+        )
+
+    def test_last_user_index(self):
+        """Test that the last user message index is tracked on append."""
+        buffer = ConversationBuffer([AIMessage(role=MessageRole.SYSTEM, content="sys")])
+        assert buffer.last_user_index == -1
+
+        buffer.append(AIMessage(role=MessageRole.USER, content="Hi"))
+        buffer.append(AIMessage(role=MessageRole.ASSISTANT, content="Hello"))
+        assert buffer.last_user_index == 1
+
+        del buffer[1]
+        assert buffer.last_user_index == -1
+
+    def test_extend_tracks_incrementally(self, provider):
+        """Test that extend keeps conversions and updates tracked state."""
+        buffer = ConversationBuffer([AIMessage(role=MessageRole.SYSTEM, content="sys")])
+        assert buffer.system_prompt == "sys"
+        _, first = provider._convert_messages(buffer)
+
+        buffer.extend([
+            AIMessage(role=MessageRole.USER, content="Hi"),
+            AIMessage(role=MessageRole.ASSISTANT, content="Hello"),
+        ])
+        buffer += [AIMessage(role=MessageRole.SYSTEM, content="more")]
+
+        assert buffer.last_user_index == 1
+        assert buffer.system_prompt == "sys\nmore"
+        assert provider._convert_messages(buffer) == provider._convert_messages(list(buffer))
+
+    def test_system_prompt_tracking(self):
+        """Test that system messages are tracked on append and rescanned after edits."""
+        buffer = ConversationBuffer([AIMessage(role=MessageRole.SYSTEM, content="Be helpful")])
+        buffer.append(AIMessage(role=MessageRole.USER, content="Hi"))
+        assert buffer.system_prompt == "Be helpful"
+
+        buffer.append(AIMessage(role=MessageRole.SYSTEM, content="Be brief"))
+        assert buffer.system_prompt == "Be helpful\nBe brief"
+        assert extract_system_prompt(buffer) == extract_system_prompt(list(buffer))
+
+        buffer[0] = AIMessage(role=MessageRole.USER, content="Hello")
+        assert buffer.system_prompt == "Be brief"
+
+    def test_mutation_invalidates(self, provider):
+        """Test that replacing a message discards the stored conversion."""
+        buffer = ConversationBuffer([AIMessage(role=MessageRole.USER, content="Hi")])
+        provider._convert_messages(buffer)
+
+        buffer[0] = AIMessage(role=MessageRole.USER, content="Bye")
+        _, converted = provider._convert_messages(buffer)
+
+        assert converted == [{"role": "user", "content": "Bye"}]
+
+    def test_gemini_role_mapping(self):
+        """Test that Gemini maps tool results to user turns and replies to model turns."""
+        from proactive_hcdt.ai_providers.gemini import GeminiAIProvider
+
+        converted = GeminiAIProvider()._convert_messages([
+            AIMessage(role=MessageRole.SYSTEM, content="sys"),
+            AIMessage(role=MessageRole.USER, content="Move"),
+            AIMessage(role=MessageRole.ASSISTANT, content="Moving"),
+            AIMessage(role=MessageRole.TOOL, content="ok", tool_call_id="call_1"),
+        ])
+
+        assert [m["role"] for m in converted] == ["user", "model", "user"]
+
+
+class TestDummyToolMatching:
+    """Tests for DummyAIProvider tool selection."""
+
+    TOOLS = [
+        {"name": f"tool_{name}", "description": name, "parameters": {}}
+        for name in ("alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel")
+    ]
+
+    def test_automaton_matches_linear_scan(self, monkeypatch):
+        """Test that large tool lists pick the same tool as the linear scan."""
+        import proactive_hcdt.ai_providers.dummy as dummy_module
+
+        provider = DummyAIProvider()
+        messages = ["go to golf then bravo", "hotel please", "nothing here", "a tool"]
+
+        fast = [provider._match_tool(m, self.TOOLS) for m in messages]
+        monkeypatch.setattr(dummy_module, "AHOCORASICK_AVAILABLE", False)
+        slow = [provider._match_tool(m, self.TOOLS) for m in messages]
+
+        assert fast == slow == [1, 7, None, 0]
+
+    def test_dummy_arguments_are_independent(self):
+        """Test that memoized dummy arguments do not share mutable values."""
+        tool = {
+            "name": "pack",
+            "parameters": {"properties": {"items": {"type": "array"}, "label": {"type": "string"}}},
+        }
+        provider = DummyAIProvider()
+
+        first = provider._generate_dummy_arguments(tool)
+        first["items"].append("cup")
+        second = provider._generate_dummy_arguments(tool)
+
+        assert second == {"items": [], "label": "dummy_label"}
+
+    def test_first_tool_in_order_wins(self):
+        """Test that the earliest matching tool is chosen regardless of message order."""
+        tools = [{"name": name} for name in
+                 ("grab_item", "move_robot", "scan_room", "say_text", "look_up",
+                  "fetch_cup", "turn_left", "bring_box")]
+        provider = DummyAIProvider()
+
+        assert provider._match_tool("bring the box and scan", tools) == 2
+
+
+class TestOpenAIParsing:
+    """Tests for OpenAI response parsing."""
+
+    def _response(self, arguments):
+        function = SimpleNamespace(name="move_robot", arguments=arguments)
+        message = SimpleNamespace(
+            content=None,
+            tool_calls=[SimpleNamespace(id="call_1", function=function)],
+        )
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="tool_calls")])
+
+    def test_parse_tool_arguments(self):
+        """Test that JSON tool arguments are decoded."""
+        from proactive_hcdt.ai_providers.openai_provider import OpenAIProvider
+
+        result = OpenAIProvider()._parse_response(self._response('{"direction": "left"}'))
+
+        assert result.tool_calls[0].arguments == {"direction": "left"}
+
+    def test_parse_invalid_arguments(self):
+        """Test that malformed arguments are preserved raw."""
+        from proactive_hcdt.ai_providers.openai_provider import OpenAIProvider
+
+        result = OpenAIProvider()._parse_response(self._response("{not json"))
+
+        assert result.tool_calls[0].arguments == {"raw": "{not json"}
+
+
+class TestStreaming:
+    """Tests for streamed responses."""
+
+    @pytest.mark.asyncio
+    async def test_default_stream_wraps_generate(self):
+        """Test that providers without native streaming yield one delta."""
+        provider = DummyAIProvider()
+        provider.set_response("greet", "Hello, human!")
+        messages = [AIMessage(role=MessageRole.USER, content="Please greet me")]
+
+        deltas = [d async for d in provider.stream(messages)]
+
+        assert len(deltas) == 1
+        assert deltas[0].content == "Hello, human!"
+        assert deltas[0].finish_reason == "stop"
+
+    @pytest.mark.asyncio
+    async def test_openai_stream_accumulates_tool_calls(self):
+        """Test that OpenAI text deltas stream and tool call fragments are joined."""
+        from proactive_hcdt.ai_providers.openai_provider import OpenAIProvider
+
+        def chunk(content=None, tool_calls=None, finish_reason=None):
+            delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+            return SimpleNamespace(
+                choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)]
+            )
+
+        def fragment(index, id=None, name=None, arguments=None):
+            function = SimpleNamespace(name=name, arguments=arguments)
+            return SimpleNamespace(index=index, id=id, function=function)
+
+        chunks = [
+            chunk(content="Moving "),
+            chunk(content="now."),
+            chunk(tool_calls=[fragment(0, id="call_1", name="move_robot", arguments='{"dir')]),
+            chunk(tool_calls=[fragment(0, arguments='ection": "left"}')]),
+            chunk(finish_reason="tool_calls"),
+        ]
+
+        class FakeStreamingCompletions:
+            async def create(self, **params):
+                assert params["stream"] is True
+
+                async def iterate():
+                    for c in chunks:
+                        yield c
+
+                return iterate()
+
+        provider = OpenAIProvider()
+        provider._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=FakeStreamingCompletions())
+        )
+        messages = [AIMessage(role=MessageRole.USER, content="Move left")]
+
+        deltas = [d async for d in provider.stream(messages)]
+        assert [d.content for d in deltas[:2]] == ["Moving ", "now."]
+
+        response = await collect_stream(provider.stream(messages))
+        assert response.content == "Moving now."
+        assert response.finish_reason == "tool_calls"
+        assert len(response.tool_calls) == 1
+        assert response.tool_calls[0].id == "call_1"
+        assert response.tool_calls[0].arguments == {"direction": "left"}
+
+    @pytest.mark.asyncio
+    async def test_openai_stream_releases_slot_while_yielding(self):
+        """Test that a paused OpenAI stream does not hold a concurrency slot."""
+        from proactive_hcdt.ai_providers.openai_provider import OpenAIProvider
+
+        delta = SimpleNamespace(content="Hi", tool_calls=None)
+        chunk = SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason="stop")])
+
+        class FakeStreamingCompletions:
+            async def create(self, **params):
+                async def iterate():
+                    yield chunk
+
+                return iterate()
+
+        provider = OpenAIProvider(max_concurrency=1)
+        provider._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=FakeStreamingCompletions())
+        )
+        messages = [AIMessage(role=MessageRole.USER, content="Hello")]
+
+        paused = provider.stream(messages)
+        assert (await paused.__anext__()).content == "Hi"
+
+        response = await asyncio.wait_for(collect_stream(provider.stream(messages)), 1.0)
+        assert response.content == "Hi"
+        await paused.aclose()
+
+    @pytest.mark.asyncio
+    async def test_anthropic_stream_releases_slot_while_yielding(self):
+        """Test that a paused Anthropic stream does not hold a concurrency slot."""
+        from proactive_hcdt.ai_providers.anthropic_provider import AnthropicProvider
+
+        closed = []
+
+        class FakeStream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                closed.append(True)
+
+            @property
+            async def text_stream(self):
+                yield "Hi"
+
+            async def get_final_message(self):
+                return SimpleNamespace(
+                    content=[SimpleNamespace(type="text", text="Hi")],
+                    stop_reason="end_turn",
+                )
+
+        provider = AnthropicProvider(api_key="test", max_concurrency=1)
+        provider._client = SimpleNamespace(
+            messages=SimpleNamespace(stream=lambda **params: FakeStream())
+        )
+        messages = [AIMessage(role=MessageRole.USER, content="Hello")]
+
+        paused = provider.stream(messages)
+        assert (await paused.__anext__()).content == "Hi"
+
+        response = await asyncio.wait_for(collect_stream(provider.stream(messages)), 1.0)
+        assert response.content == "Hi"
+        assert response.finish_reason == "end_turn"
+        assert closed == [True]
+
+        await paused.aclose()
+        assert closed == [True, True]
+
+
+class TestRetry:
+    """Tests for retrying transient provider errors."""
+
+    class StatusError(Exception):
+        """Error carrying an HTTP status code like the SDK exceptions."""
+
+        def __init__(self, status_code):
+            super().__init__(f"status {status_code}")
+            self.status_code = status_code
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limit(self):
+        """Test that rate-limited requests are retried until they succeed."""
+        from proactive_hcdt.ai_providers._retry import with_retries
+
+        calls = []
+
+        async def request():
+            calls.append(1)
+            if len(calls) < 3:
+                raise self.StatusError(429)
+            return "ok"
+
+        assert await with_retries(request, base=0.0) == "ok"
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_raises_immediately(self):
+        """Test that client errors are not retried."""
+        from proactive_hcdt.ai_providers._retry import with_retries
+
+        calls = []
+
+        async def request():
+            calls.append(1)
+            raise self.StatusError(401)
+
+        with pytest.raises(self.StatusError):
+            await with_retries(request, base=0.0)
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_attempts(self):
+        """Test that the last transient error surfaces once attempts run out."""
+        from proactive_hcdt.ai_providers._retry import with_retries
+
+        calls = []
+
+        async def request():
+            calls.append(1)
+            raise self.StatusError(503)
+
+        with pytest.raises(self.StatusError):
+            await with_retries(request, attempts=2, base=0.0)
+        assert len(calls) == 2
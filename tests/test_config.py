@@ -46,6 +46,15 @@ class TestAIProviderConfig:
 
         assert config.model_name == "gpt-4o"
 
+    def test_api_key_not_in_repr(self, monkeypatch):
+        """Test that an API key resolved from the environment is not printed."""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-secret")
+        config = AIProviderConfig(provider_type=AIProviderType.OPENAI)
+
+        assert config.api_key == "sk-secret"
+        assert "sk-secret" not in repr(config)
+        assert "sk-secret" not in repr(FrameworkConfig(ai_provider=config))
+
     def test_create_dummy_provider(self):
         """Test creating dummy provider."""
         config = AIProviderConfig(provider_type=AIProviderType.DUMMY)
@@ -53,6 +62,39 @@ class TestAIProviderConfig:
 
         assert isinstance(provider, DummyAIProvider)
 
+    def test_to_dict_excludes_api_key(self):
+        """Test that serialized provider settings omit the API key."""
+        config = AIProviderConfig(provider_type=AIProviderType.GEMINI, api_key="secret")
+
+        assert config.to_dict() == {
+            "provider_type": "gemini",
+            "model_name": "gemini-1.5-pro",
+            "temperature": 0.7,
+            "max_tokens": None,
+            "max_concurrency": None,
+        }
+
+    def test_to_dict_round_trip_keeps_max_concurrency(self):
+        """Test that a concurrency cap survives saving and loading."""
+        config = FrameworkConfig(
+            ai_provider=AIProviderConfig(provider_type=AIProviderType.OPENAI, max_concurrency=4)
+        )
+
+        loaded = FrameworkConfig.from_dict(config.to_dict())
+
+        assert loaded.ai_provider.max_concurrency == 4
+
+    def test_create_provider_reads_env_key(self, monkeypatch):
+        """Test that SDK providers fall back to their API key environment variable."""
+        monkeypatch.setenv("OPENAI_API_KEY", "env-key")
+        config = AIProviderConfig(provider_type=AIProviderType.OPENAI, max_concurrency=4)
+        monkeypatch.delenv("OPENAI_API_KEY")
+        provider = config.create_provider()
+
+        assert provider.provider_name == "openai"
+        assert provider.api_key == "env-key"
+        assert provider.max_concurrency == 4
+
 
 class TestFrameworkConfig:
     """Tests for FrameworkConfig."""
@@ -82,6 +124,25 @@ class TestFrameworkConfig:
         assert config.debug_mode is True
         assert config.ai_provider.model_name == "test-model"
 
+    def test_from_dict_defaults(self):
+        """Test that keys missing from the dictionary use the field defaults."""
+        config_dict = {"ai_provider": {"provider_type": "openai"}, "robot_name": "MyBot"}
+        config = FrameworkConfig.from_dict(config_dict)
+
+        assert config.robot_name == "MyBot"
+        assert config.max_tool_iterations == 10
+        assert config.ai_provider.provider_type == AIProviderType.OPENAI
+        assert config_dict["ai_provider"]["provider_type"] == "openai"
+
+    def test_from_dict_ai_provider_shapes(self):
+        """Test that the ai_provider entry may be missing, a dict, or a config."""
+        provider_config = AIProviderConfig(provider_type=AIProviderType.ANTHROPIC)
+
+        assert FrameworkConfig.from_dict({}).ai_provider == AIProviderConfig()
+        assert FrameworkConfig.from_dict({"ai_provider": provider_config}).ai_provider is (
+            provider_config
+        )
+
     def test_to_dict(self):
         """Test converting config to dictionary."""
         config = FrameworkConfig(
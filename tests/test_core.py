@@ -129,6 +129,37 @@ class TestToolRegistry:
         assert len(schemas) == 1
         assert schemas[0]["name"] == "simple_tool"
 
+    def test_tools_view(self, registry, simple_tool):
+        """Test that the tools mapping is a live, read-only view."""
+        tools = registry.tools
+        registry.register(simple_tool)
+
+        assert tools["simple_tool"] is simple_tool
+        with pytest.raises(TypeError):
+            tools["other"] = simple_tool
+
+    def test_get_schemas_returns_fresh_list(self, registry, simple_tool):
+        """Test that callers may edit the schemas they get."""
+        registry.register(simple_tool)
+        schemas = registry.get_schemas()
+
+        schemas[0]["name"] = "edited"
+        schemas.append({"name": "extra"})
+
+        assert registry.get_schemas() == [simple_tool.to_schema()]
+        assert registry.schemas_view()[0]["name"] == "simple_tool"
+
+    def test_schemas_view_cached(self, registry, simple_tool):
+        """Test that shared schemas are reused until the registry changes."""
+        registry.register(simple_tool)
+        schemas = registry.schemas_view()
+
+        assert registry.schemas_view() is schemas
+        assert list(schemas) == registry.get_schemas()
+
+        registry.unregister("simple_tool")
+        assert registry.schemas_view() == ()
+
     def test_clear(self, registry, simple_tool):
         """Test clearing registry."""
         registry.register(simple_tool)
@@ -213,6 +244,16 @@ class TestAIController:
         # Should have system + user + assistant messages
         assert len(history) >= 3
 
+    @pytest.mark.asyncio
+    async def test_iter_conversation_history(self, controller):
+        """Test that the history iterator yields the same messages as the list."""
+        await controller.process("First message")
+
+        history = controller.iter_conversation_history()
+
+        assert not isinstance(history, list)
+        assert list(history) == controller.get_conversation_history()
+
     @pytest.mark.asyncio
     async def test_clear_history(self, controller):
         """Test clearing conversation history."""
@@ -225,6 +266,106 @@ class TestAIController:
         assert len(history) == 1
         assert history[0]["role"] == "system"
 
+    @pytest.mark.asyncio
+    async def test_history_copies_are_safe_to_edit(self, provider):
+        """Test that editing get_conversation_history() results changes nothing sent."""
+        controller = AIController(ai_provider=provider)
+        await controller.process("Hello")
+
+        history = controller.get_conversation_history()
+        history[1]["content"] = "Edited"
+
+        assert controller.get_conversation_history()[1]["content"] == "Hello"
+        assert next(iter(controller.iter_conversation_history()))["role"] == "system"
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self, provider):
+        """Test that old turns are dropped once max_history is exceeded."""
+        controller = AIController(ai_provider=provider, max_history=8)
+
+        for i in range(20):
+            await controller.process(f"Message {i}")
+
+        history = controller.get_conversation_history()
+        assert len(history) <= 9
+        assert history[0]["role"] == "system"
+        assert history[1]["role"] == "user"
+        assert history[-1]["role"] == "assistant"
+
+    @pytest.mark.asyncio
+    async def test_history_trim_keeps_long_tool_turn(self):
+        """Test that a tool-call turn longer than max_history is kept whole."""
+        from proactive_hcdt.ai_providers.base import AIResponse, ToolCall
+
+        class ToolLoopProvider(DummyAIProvider):
+            """Requests one tool call three times, then answers."""
+
+            async def generate(self, messages, tools=None, temperature=0.7, max_tokens=None):
+                n_calls = sum(1 for m in messages if m.role.value == "tool")
+                if n_calls % 3 == 0 and messages[-1].role.value == "tool":
+                    return AIResponse(content="done", tool_calls=[], finish_reason="stop")
+                call = ToolCall(id=f"call_{n_calls}", name="simple_tool", arguments={"value": "x"})
+                return AIResponse(content="", tool_calls=[call], finish_reason="tool_calls")
+
+        registry = ToolRegistry()
+        registry.register(SimpleTool())
+        controller = AIController(
+            ai_provider=ToolLoopProvider(), tool_registry=registry, max_history=4
+        )
+
+        for i in range(3):
+            assert await controller.process(f"Turn {i}") == "done"
+
+            history = controller.get_conversation_history()
+            assert history[0]["role"] == "system"
+            assert history[1] == {"role": "user", "content": f"Turn {i}"}
+            assert [m["role"] for m in history[2:]] == ["assistant", "tool"] * 3 + ["assistant"]
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_run_concurrently(self, provider):
+        """Test that independent tool calls in one response overlap."""
+        import asyncio
+
+        from proactive_hcdt.ai_providers.base import ToolCall
+
+        running = []
+        peak = []
+
+        class SlowTool(SimpleTool):
+            async def execute(self, **kwargs):
+                running.append(1)
+                peak.append(len(running))
+                await asyncio.sleep(0.01)
+                running.pop()
+                return await super().execute(**kwargs)
+
+        registry = ToolRegistry()
+        registry.register(SlowTool())
+        controller = AIController(ai_provider=provider, tool_registry=registry)
+        tool_calls = [
+            ToolCall(id=f"call_{i}", name="simple_tool", arguments={"value": str(i)})
+            for i in range(3)
+        ]
+
+        results = await controller._execute_tool_calls(tool_calls)
+
+        assert max(peak) == 3
+        assert [r.data["received"] for _, r in results] == ["0", "1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_tool_call_arguments_are_json(self, controller):
+        """Test that recorded tool call arguments are serialized as JSON."""
+        import json
+
+        await controller.process("Move forward")
+
+        history = controller.get_conversation_history()
+        calls = [tc for msg in history for tc in msg.get("tool_calls") or ()]
+
+        assert calls
+        for tc in calls:
+            assert isinstance(json.loads(tc["function"]["arguments"]), dict)
+
     def test_add_context(self, controller):
         """Test adding context."""
         controller.add_context("User is standing nearby")
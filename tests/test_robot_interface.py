@@ -26,6 +26,24 @@ class TestRobotState:
         assert state_dict["battery_level"] == 0.8
         assert state_dict["held_object"] == "cup"
 
+    def test_to_mapping(self):
+        """Test that the mapping view matches to_dict and tracks changes."""
+        state = RobotState(
+            position={"x": 1.0, "y": 2.0, "z": 0.0},
+            orientation={"roll": 0.0, "pitch": 0.0, "yaw": 90.0},
+            battery_level=0.8,
+            is_moving=False,
+            is_holding_object=False,
+        )
+
+        view = state.to_mapping()
+        assert dict(view) == state.to_dict()
+
+        state.battery_level = 0.5
+        assert view["battery_level"] == 0.5
+        with pytest.raises(KeyError):
+            view["missing"]
+
 
 class TestDummyRobotInterface:
     """Tests for DummyRobotInterface."""
@@ -69,6 +87,27 @@ class TestDummyRobotInterface:
         state = await robot.get_state()
         assert state.position == target
 
+    @pytest.mark.asyncio
+    async def test_move_to_normalizes_position(self, robot):
+        """Test that targets are stored as floats and z defaults to 0."""
+        await robot.initialize()
+        target = {"x": 1, "y": "2"}
+
+        assert await robot.move_to(target) is True
+        state = await robot.get_state()
+        assert state.position == {"x": 1.0, "y": 2.0, "z": 0.0}
+        assert state.position is not target
+
+    @pytest.mark.asyncio
+    async def test_move_to_invalid_position(self, robot):
+        """Test that malformed targets fail without moving."""
+        await robot.initialize()
+
+        assert await robot.move_to({"y": 1.0}) is False
+        state = await robot.get_state()
+        assert state.position["x"] == 0.0
+        assert "Invalid position" in state.error_state
+
     @pytest.mark.asyncio
     async def test_move_without_init(self, robot):
         """Test moving without initialization."""
@@ -155,6 +194,12 @@ class TestDummyRobotInterface:
         assert "movement" in caps
         assert "manipulation" in caps
 
+    def test_capabilities_shared_and_immutable(self, robot):
+        """Capabilities are an immutable tuple returned without copying."""
+        caps = robot.capabilities
+        assert isinstance(caps, tuple)
+        assert robot.capabilities is caps
+
     @pytest.mark.asyncio
     async def test_set_position(self, robot):
         """Test directly setting position for testing."""
@@ -183,3 +228,91 @@ class TestDummyRobotInterface:
         state = await robot.get_state()
         assert state.error_state is None
         assert state.error_state is None
+
+    @pytest.mark.asyncio
+    async def test_failure_rate(self):
+        """Test that operations always fail at rate 1.0 and never at 0.0."""
+        failing = DummyRobotInterface(simulation_delay=0.0, failure_rate=1.0)
+        reliable = DummyRobotInterface(simulation_delay=0.0, failure_rate=0.0)
+
+        assert not await failing._simulate_operation()
+        assert await reliable._simulate_operation()
+
+    @pytest.mark.asyncio
+    async def test_states_are_snapshots(self):
+        """Test that a returned state does not change when the robot moves."""
+        robot = DummyRobotInterface(simulation_delay=0.0)
+        await robot.initialize()
+        before = await robot.get_state()
+
+        await robot.move_to({"x": 1.0, "y": 2.0, "z": 0.0})
+        await robot.rotate(90.0)
+        after = await robot.get_state()
+
+        assert before.position["x"] == 0.0
+        assert before.orientation["yaw"] == 0.0
+        assert after.position["x"] == 1.0
+        assert after.orientation["yaw"] == 90.0
+
+    @pytest.mark.asyncio
+    async def test_editing_state_does_not_move_robot(self):
+        """Test that a returned state's pose dicts are copies."""
+        robot = DummyRobotInterface(simulation_delay=0.0)
+        await robot.initialize()
+        state = await robot.get_state()
+
+        state.position["x"] = 42.0
+        state.orientation["yaw"] = 42.0
+
+        assert robot._position["x"] == 0.0
+        assert robot._orientation["yaw"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_states_are_independent(self):
+        """Test that each get_state call returns its own RobotState."""
+        robot = DummyRobotInterface(simulation_delay=0.0)
+        await robot.initialize()
+        first = await robot.get_state()
+        first.battery_level = 0.3
+
+        second = await robot.get_state()
+        assert second is not first
+        assert second.battery_level == 1.0
+
+    @pytest.mark.asyncio
+    async def test_move_many(self):
+        """Test batched movement ends at the last position."""
+        robot = DummyRobotInterface(simulation_delay=0.0)
+        await robot.initialize()
+
+        results = await robot.move_many(
+            [{"x": 1.0, "y": 0.0, "z": 0.0}, {"x": 2.0, "y": 3.0, "z": 0.0}]
+        )
+        state = await robot.get_state()
+
+        assert results == [True, True]
+        assert state.position == {"x": 2.0, "y": 3.0, "z": 0.0}
+        assert state.battery_level == pytest.approx(0.98)
+        assert not state.is_moving
+
+    @pytest.mark.asyncio
+    async def test_move_many_failures(self):
+        """Test batched movement reports each failure."""
+        robot = DummyRobotInterface(simulation_delay=0.0, failure_rate=1.0)
+        await robot.initialize()
+
+        results = await robot.move_many([{"x": 1.0, "y": 0.0, "z": 0.0}] * 3)
+        state = await robot.get_state()
+
+        assert results == [False, False, False]
+        assert state.position["x"] == 0.0
+        assert state.error_state == "Movement failed"
+
+    @pytest.mark.asyncio
+    async def test_sub_millisecond_delay(self):
+        """Test that sub-millisecond delays still yield and complete operations."""
+        robot = DummyRobotInterface(simulation_delay=1e-5)
+
+        assert await robot.initialize()
+        assert await robot.rotate(45.0)
+        assert (await robot.get_state()).orientation["yaw"] == 45.0
@@ -20,7 +20,10 @@ import random
 
 sys.path.insert(0, '/home/mani/Repos/proactive_hcdt')
 
-from proactive_hcdt.simulation.physics import PhysicsWorld, PhysicsConfig, check_pymunk_available
+from proactive_hcdt.simulation.agents import AgentType
+from proactive_hcdt.simulation.physics import (
+    BATCH_READ_MIN_OBJECTS, PhysicsWorld, PhysicsConfig, check_pymunk_available
+)
 from proactive_hcdt.simulation.pymunk_renderer import PymunkRenderer, GoalZone
 
 # Check dependencies
@@ -190,6 +193,72 @@ class AIController:
             self.message = ""
 
 
+class TestPhysicsWorld:
+    """Tests for PhysicsWorld state readback."""
+
+    def test_object_poses_match_bodies(self):
+        """Test that batched poses match per-body reads after stepping."""
+        physics = PhysicsWorld(700, 500)
+        physics.add_agent("ai", 300, 200)
+        physics.add_box("box", 330, 210)
+        physics.add_tee("tee", 400, 300, angle=0.7)
+        physics.set_agent_target("ai", 500, 260)
+        for _ in range(30):
+            physics.step()
+
+        poses = physics.get_object_poses()
+
+        assert list(poses) == ["box", "tee"]
+        for name, body in physics.objects.items():
+            assert poses[name] == (body.position.x, body.position.y, body.angle)
+
+    def test_batched_poses_match_bodies(self):
+        """Test that the batch readback used for many objects matches per-body reads."""
+        physics = PhysicsWorld(700, 500)
+        physics.add_agent("ai", 20, 20)
+        for i in range(BATCH_READ_MIN_OBJECTS):
+            physics.add_box(f"box-{i}", 40 + (i * 37) % 600, 40 + (i * 53) % 400)
+        physics.set_agent_target("ai", 500, 260)
+        for _ in range(10):
+            physics.step()
+        physics.space.remove(physics.objects["box-0"])
+
+        poses = physics.get_object_poses()
+
+        assert list(poses) == list(physics.objects)
+        for name, body in physics.objects.items():
+            assert poses[name] == (body.position.x, body.position.y, body.angle)
+
+    def test_readback_sees_manual_moves(self):
+        """Test that bodies moved by hand are seen before the next step."""
+        physics = PhysicsWorld(700, 500)
+        physics.add_box("box", 300, 300)
+        physics.step()
+        assert physics.get_object_poses()["box"] == (300.0, 300.0, 0.0)
+        assert physics.get_object_state("box")["x"] == 300.0
+
+        physics.objects["box"].position = (50, 60)
+        physics.objects["box"].angle = 0.5
+
+        assert physics.get_object_poses()["box"] == (50.0, 60.0, 0.5)
+        assert physics.get_object_state("box")["x"] == 50.0
+
+
+class TestAgentType:
+    """Tests for the AgentType enum."""
+
+    def test_label_is_former_string_value(self):
+        """Test that labels match the old "human"/"ai" string values."""
+        assert AgentType.HUMAN.label == "human"
+        assert AgentType.AI.label == "ai"
+
+    def test_compares_as_int(self):
+        """Test that agent types compare and hash like their integer values."""
+        assert AgentType.HUMAN == 0
+        assert AgentType.AI == 1
+        assert {0: "human"}[AgentType.HUMAN] == "human"
+
+
 def main():
     print("=" * 60)
     print("PyMunk Physics Test: Smooth Push Dynamics")
@@ -137,6 +137,35 @@ class TestBaseTool:
         assert "input" in schema["parameters"]["properties"]
         assert schema["parameters"]["required"] == ["input"]
 
+    def test_compiled_validator_matches_validate_arguments(self):
+        """Test that the compiled validator agrees with validate_arguments."""
+        class ValidatedTool(BaseTool):
+            name = "validated_tool"
+            description = "Tool for validation testing"
+            parameters = [
+                ToolParameter(
+                    name="mode",
+                    type=ToolParameterType.STRING,
+                    description="Mode",
+                    enum=["fast", "slow"],
+                ),
+                ToolParameter(
+                    name="count",
+                    type=ToolParameterType.INTEGER,
+                    description="Count",
+                    required=False,
+                ),
+            ]
+
+            async def execute(self, **kwargs):
+                return ToolResult(success=True)
+
+        tool = ValidatedTool()
+        validator = tool.compile_validator()
+
+        for kwargs in ({"mode": "fast"}, {}, {"mode": "other"}, {"mode": "slow", "count": "2"}):
+            assert validator(**kwargs) == tool.validate_arguments(**kwargs)
+
 
 class TestMovementTool:
     """Tests for MovementTool."""